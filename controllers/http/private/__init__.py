@@ -1 +1 @@
-from . import agent, company, point, route, geo, user
+from . import agent, company, point, route, geo, user, vehicle
@@ -4,7 +4,8 @@ from fastapi import Request
 
 from server.instances import ServerInstances
 from services.agent import AgentService
-from models import Agent, Company
+from services.auth import AgentPrincipal
+from models import Agent
 from utils.responses import JSONSuccessResponse
 from utils.entities import AgentBodyEntity, AgentEntity
 from utils.config import PROFILE_ENDPOINT_NAME, SWAGGER_PROFILE_SESSION_TAG
@@ -29,11 +30,13 @@ async def find_agent(agent_uuid: str) -> JSONSuccessResponse[AgentEntity]:
 
 @router.get("")
 async def find_agents(request: Request) -> JSONSuccessResponse[List[AgentEntity]]:
-    company: Company = request.state.user.company
+    principal: AgentPrincipal = request.state.user
+
+    company_id: int = await principal.get_company_id()
 
     agent_service: AgentService = AgentService()
 
-    agents: Sequence[Agent] = await agent_service.find_agents(company_instance=company)
+    agents: Sequence[Agent] = await agent_service.find_agents(company_id=company_id)
 
     agents_handled: List[AgentEntity] = [get_agent_entity(agent) for agent in agents]
 
@@ -44,12 +47,14 @@ async def find_agents(request: Request) -> JSONSuccessResponse[List[AgentEntity]
 async def create_agent(
     request: Request, body: AgentBodyEntity
 ) -> JSONSuccessResponse[Optional[AgentEntity]]:
-    company: Company = request.state.user.company
+    principal: AgentPrincipal = request.state.user
+
+    company_id: int = await principal.get_company_id()
 
     agent_service: AgentService = AgentService()
 
     agent: Optional[Agent] = await agent_service.create_agent(
-        company_instance=company,
+        company_id=company_id,
         name=body.name,
         email=body.email,
         password=body.password,
@@ -0,0 +1,65 @@
+from typing import Optional
+from fastapi.routing import APIRouter
+from fastapi import Request
+
+from server.instances import ServerInstances
+from services.vehicle import VehicleService
+from services.auth import AgentPrincipal
+from models import Vehicle
+from utils.responses import JSONSuccessResponse
+from utils.entities import VehicleBodyEntity, VehicleEntity
+from utils.config import VEHICLE_ENDPOINT_NAME, SWAGGER_VEHICLE_SESSION_TAG
+from utils.functions import handle_vehicle_body
+
+
+router: APIRouter = APIRouter(
+    prefix=VEHICLE_ENDPOINT_NAME, tags=[SWAGGER_VEHICLE_SESSION_TAG]
+)
+
+
+@router.post("")
+async def create_vehicle(
+    request: Request, body: VehicleBodyEntity
+) -> JSONSuccessResponse[Optional[VehicleEntity]]:
+    principal: AgentPrincipal = request.state.user
+
+    company_id: int = await principal.get_company_id()
+
+    vehicle_service: VehicleService = VehicleService()
+
+    vehicle: Optional[Vehicle] = await vehicle_service.create_vehicle(
+        company_id=company_id,
+        type=body.type,
+        plate=body.plate,
+        route_uuid=body.route_uuid,
+    )
+
+    vehicle_handled: Optional[VehicleEntity] = handle_vehicle_body(vehicle)
+
+    return JSONSuccessResponse(content=vehicle_handled)
+
+
+@router.put("/{vehicle_uuid}")
+async def update_vehicle(
+    request: Request, vehicle_uuid: str, body: VehicleBodyEntity
+) -> JSONSuccessResponse[Optional[VehicleEntity]]:
+    principal: AgentPrincipal = request.state.user
+
+    company_id: int = await principal.get_company_id()
+
+    vehicle_service: VehicleService = VehicleService()
+
+    vehicle: Optional[Vehicle] = await vehicle_service.update_vehicle(
+        vehicle_uuid=vehicle_uuid,
+        company_id=company_id,
+        type=body.type,
+        plate=body.plate,
+        route_uuid=body.route_uuid,
+    )
+
+    vehicle_handled: Optional[VehicleEntity] = handle_vehicle_body(vehicle)
+
+    return JSONSuccessResponse(content=vehicle_handled)
+
+
+ServerInstances.agent_api.include_router(router)
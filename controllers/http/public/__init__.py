@@ -1 +1 @@
-from . import index, auth, events
+from . import index, auth, events, vehicle
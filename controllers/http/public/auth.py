@@ -1,4 +1,5 @@
 from fastapi.routing import APIRouter
+from fastapi import Request
 import jwt
 
 from server.instances import ServerInstances
@@ -30,13 +31,16 @@ user_router: APIRouter = APIRouter(
 
 @agent_router.post("")
 async def authenticate_agent(
+    request: Request,
     body: AuthBodyEntity,
 ) -> JSONSuccessResponse[AuthResultEntity]:
     auth_service: AuthService = AuthService()
 
     try:
         auth_data: AuthResult = await auth_service.auth_agent(
-            email=body.email, password=body.password
+            email=body.email,
+            password=body.password,
+            client_host=request.client.host if request.client else None,
         )
 
     except (
@@ -72,13 +76,16 @@ async def refresh_agent_authencation(
 
 @user_router.post("")
 async def authenticate_user(
+    request: Request,
     body: AuthBodyEntity,
 ) -> JSONSuccessResponse[AuthResultEntity]:
     auth_service: AuthService = AuthService()
 
     try:
         auth_data: AuthResult = await auth_service.auth_user(
-            email=body.email, password=body.password
+            email=body.email,
+            password=body.password,
+            client_host=request.client.host if request.client else None,
         )
 
     except (
@@ -1,14 +1,26 @@
+from typing import Annotated, List, Optional, Sequence, Set
+from fastapi import Query, Request
 from fastapi.routing import APIRouter
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from server.instances import ServerInstances
 from services.vehicle_events import VehicleEventsService
+from services.vehicle_eta import VehicleEtaService
 from utils.responses import JSONSuccessResponse
 from utils.config import (
     EVENTS_ENDPOINT_NAME,
     VEHICLE_ENDPOINT_NAME,
     SWAGGER_EVENTS_SESSION_TAG,
 )
-from utils.entities import VehiclePositionBodyEntity
+from utils.entities import (
+    VehiclePositionBodyEntity,
+    VehiclePositionItemEntity,
+    VehiclePositionBatchResultEntity,
+    VehicleLastPositionEntity,
+    VehicleEtaEntity,
+)
+from utils.functions import handle_vehicle_positions_body
 
 
 router: APIRouter = APIRouter(
@@ -16,17 +28,73 @@ router: APIRouter = APIRouter(
 )
 
 
+@router.post(f"{VEHICLE_ENDPOINT_NAME}/positions")
+async def capture_vehicle_positions(
+    request: Request,
+) -> JSONSuccessResponse[VehiclePositionBatchResultEntity]:
+    try:
+        positions: List[VehiclePositionItemEntity] = handle_vehicle_positions_body(
+            await request.body(), request.headers.get("Content-Type", "")
+        )
+
+    except ValidationError as error:
+        raise RequestValidationError(error.errors())
+
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    rejected: Sequence[str] = await vehicle_events_service.capture_vehicle_positions(
+        positions
+    )
+
+    rejected_uuids: Set[str] = set(rejected)
+
+    result: VehiclePositionBatchResultEntity = VehiclePositionBatchResultEntity(
+        accepted=len(
+            [item for item in positions if item.vehicle_uuid not in rejected_uuids]
+        ),
+        rejected=list(rejected),
+    )
+
+    return JSONSuccessResponse(content=result)
+
+
+@router.get(f"{VEHICLE_ENDPOINT_NAME}/positions")
+async def find_vehicle_positions(
+    uuids: Annotated[List[str], Query()] = [],
+) -> JSONSuccessResponse[List[VehicleLastPositionEntity]]:
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    positions: Sequence[VehicleLastPositionEntity] = (
+        vehicle_events_service.find_last_positions(uuids)
+    )
+
+    return JSONSuccessResponse(content=list(positions))
+
+
 @router.post(f"{VEHICLE_ENDPOINT_NAME}/{{vehicle_uuid}}/position")
 async def capture_vehicle_position(
     body: VehiclePositionBodyEntity, vehicle_uuid: str
 ) -> JSONSuccessResponse:
     vehicle_events_service: VehicleEventsService = VehicleEventsService()
 
-    await vehicle_events_service.process_vehicle_position(
+    await vehicle_events_service.capture_vehicle_position(
         vehicle_uuid=vehicle_uuid, latitude=body.latitude, longitude=body.longitude
     )
 
     return JSONSuccessResponse()
 
 
+@router.get(f"{VEHICLE_ENDPOINT_NAME}/{{vehicle_uuid}}/eta")
+async def find_vehicle_eta(
+    vehicle_uuid: str,
+) -> JSONSuccessResponse[VehicleEtaEntity]:
+    vehicle_eta_service: VehicleEtaService = VehicleEtaService()
+
+    eta: Optional[VehicleEtaEntity] = await vehicle_eta_service.find_vehicle_eta(
+        vehicle_uuid
+    )
+
+    return JSONSuccessResponse(content=eta)
+
+
 ServerInstances.general_api.include_router(router)
@@ -1,9 +1,25 @@
 from server.instances import ServerInstances
 from utils.responses import JSONSuccessResponse
-from utils.entities import IndexEntity
-from utils.config import INDEX_ENDPOINT_NAME, SWAGGER_INDEX_SESSION_TAG
+from utils.entities import IndexEntity, ServerMetricsEntity
+from utils.config import (
+    INDEX_ENDPOINT_NAME,
+    METRICS_ENDPOINT_NAME,
+    SWAGGER_INDEX_SESSION_TAG,
+)
 
 
 @ServerInstances.general_api.get(INDEX_ENDPOINT_NAME, tags=[SWAGGER_INDEX_SESSION_TAG])
 def index() -> JSONSuccessResponse[IndexEntity]:
     return JSONSuccessResponse(content=IndexEntity())
+
+
+@ServerInstances.general_api.get(
+    METRICS_ENDPOINT_NAME, tags=[SWAGGER_INDEX_SESSION_TAG]
+)
+def metrics() -> JSONSuccessResponse[ServerMetricsEntity]:
+    server_metrics: ServerMetricsEntity = ServerMetricsEntity(
+        websocket=ServerInstances.general_api.websocket_metrics,
+        crypt=ServerInstances.crypt_pool.metrics,
+    )
+
+    return JSONSuccessResponse(content=server_metrics)
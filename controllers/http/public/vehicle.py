@@ -0,0 +1,52 @@
+from typing import Annotated, AsyncIterator
+from datetime import datetime
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRouter
+import orjson
+
+from server.instances import ServerInstances
+from services.vehicle import VehicleService
+from services.vehicle_position import VehiclePositionService
+from models import Vehicle
+from utils.entities import VehicleTrackPointEntity
+from utils.config import VEHICLE_ENDPOINT_NAME, SWAGGER_VEHICLE_SESSION_TAG
+
+
+router: APIRouter = APIRouter(
+    prefix=VEHICLE_ENDPOINT_NAME, tags=[SWAGGER_VEHICLE_SESSION_TAG]
+)
+
+
+async def encode_track_points(
+    points: AsyncIterator[VehicleTrackPointEntity],
+) -> AsyncIterator[bytes]:
+    async for point in points:
+        yield orjson.dumps(point._asdict()) + b"\n"
+
+
+@router.get("/{vehicle_uuid}/track")
+async def stream_vehicle_track(
+    vehicle_uuid: str,
+    start: Annotated[datetime, Query(alias="from")],
+    end: Annotated[datetime, Query(alias="to")],
+    tolerance: Annotated[float, Query(ge=0)] = 0,
+) -> StreamingResponse:
+    vehicle_service: VehicleService = VehicleService()
+
+    vehicle_position_service: VehiclePositionService = VehiclePositionService()
+
+    vehicle: Vehicle = await vehicle_service.find_vehicle(vehicle_uuid)
+
+    points: AsyncIterator[VehicleTrackPointEntity] = (
+        vehicle_position_service.stream_vehicle_track(
+            vehicle_id=vehicle.id, start=start, end=end, tolerance=tolerance
+        )
+    )
+
+    return StreamingResponse(
+        encode_track_points(points), media_type="application/x-ndjson"
+    )
+
+
+ServerInstances.general_api.include_router(router)
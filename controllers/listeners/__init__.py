@@ -0,0 +1 @@
+from . import index, vehicle, crypt
@@ -0,0 +1,6 @@
+from server.instances import ServerInstances
+
+
+ServerInstances.general_api.router.on_shutdown.append(
+    ServerInstances.crypt_pool.shutdown
+)
@@ -0,0 +1,61 @@
+from typing import List
+
+from server.instances import ServerInstances
+from services.vehicle_events import VehicleEventsService
+from services.vehicle_position import VehiclePositionService
+from utils.entities import VehiclePositionRecordEntity
+from utils.types import VehiclePositionsPipelineType
+from utils.config import VEHICLE_POSITIONS_PIPELINE
+
+
+async def on_vehicle_positions(values: List[bytes]) -> None:
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    await vehicle_events_service.process_published_positions(values)
+
+
+async def on_fleet_tick() -> None:
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    vehicle_events_service.broadcast_fleet_changes()
+
+
+async def on_vehicle_positions_history(
+    records: List[VehiclePositionRecordEntity],
+) -> None:
+    vehicle_position_service: VehiclePositionService = VehiclePositionService()
+
+    await vehicle_position_service.create_vehicle_positions(records)
+
+
+if (
+    VehiclePositionsPipelineType(VEHICLE_POSITIONS_PIPELINE)
+    == VehiclePositionsPipelineType.KAFKA
+):
+    ServerInstances.vehicle_positions_pipeline.bind(on_vehicle_positions)
+
+    ServerInstances.general_api.router.on_startup.append(
+        ServerInstances.vehicle_positions_pipeline.start
+    )
+
+    ServerInstances.general_api.router.on_shutdown.append(
+        ServerInstances.vehicle_positions_pipeline.stop
+    )
+
+
+ServerInstances.vehicle_positions_history.bind(on_vehicle_positions_history)
+
+ServerInstances.general_api.router.on_startup.append(
+    ServerInstances.vehicle_positions_history.start
+)
+
+ServerInstances.general_api.router.on_shutdown.append(
+    ServerInstances.vehicle_positions_history.stop
+)
+
+
+ServerInstances.fleet_ticker.bind(on_fleet_tick)
+
+ServerInstances.general_api.router.on_startup.append(ServerInstances.fleet_ticker.start)
+
+ServerInstances.general_api.router.on_shutdown.append(ServerInstances.fleet_ticker.stop)
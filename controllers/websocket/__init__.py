@@ -1 +1,2 @@
 import controllers.websocket.vehicle
+import controllers.websocket.company
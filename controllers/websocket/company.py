@@ -0,0 +1,52 @@
+from fastapi import WebSocket, WebSocketDisconnect, WebSocketException
+
+from server.instances import ServerInstances
+from server.websocket import ServerWebSocketConnection
+from services.auth import AuthService, AgentPrincipal
+from services.vehicle_events import VehicleEventsService
+from utils.entities import FleetPositionsEntity
+from utils.config import COMPANY_ENPOINT_NAME
+from utils.functions import get_company_topic, get_websocket_token
+
+
+@ServerInstances.general_api.websocket(f"{COMPANY_ENPOINT_NAME}/{{company_uuid}}/fleet")
+async def on_connect_fleet(websocket: WebSocket, company_uuid: str) -> None:
+    auth_service: AuthService = AuthService()
+
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    token: str = get_websocket_token(websocket)
+
+    try:
+        principal: AgentPrincipal = await auth_service.get_agent_principal(token)
+
+        company_id: int = await principal.get_company_id()
+
+    except:
+        await websocket.close(code=1008)
+
+        return
+
+    if principal.company_uuid != company_uuid:
+        await websocket.close(code=1008)
+
+        return
+
+    try:
+        connection: ServerWebSocketConnection = (
+            await ServerInstances.general_api.connect_websocket(
+                websocket, get_company_topic(company_id), company_id=company_id
+            )
+        )
+
+        snapshot: FleetPositionsEntity = vehicle_events_service.find_fleet_snapshot(
+            company_id, company_uuid
+        )
+
+        connection.send_json(snapshot.model_dump())
+
+        while True:
+            await ServerInstances.general_api.receive_websocket(websocket)
+
+    except (WebSocketDisconnect, WebSocketException, RuntimeError):
+        await ServerInstances.general_api.disconnect_websocket(websocket)
@@ -1,7 +1,22 @@
+from typing import List, Optional, Sequence, Union
 from fastapi import WebSocket, WebSocketDisconnect, WebSocketException
+from pydantic import ValidationError
 
 from server.instances import ServerInstances
-from utils.config import VEHICLE_ENDPOINT_NAME
+from server.websocket import ServerWebSocketConnection
+from server.codec import decode_device_frame
+from services.auth import AuthService, AgentPrincipal
+from services.vehicle import VehicleService
+from services.vehicle_events import VehicleEventsService
+from models import Vehicle
+from utils.entities import (
+    VehicleLastPositionEntity,
+    VehiclePositionItemEntity,
+    ViewportBodyEntity,
+)
+from utils.types import DictType
+from utils.config import EVENTS_ENDPOINT_NAME, VEHICLE_ENDPOINT_NAME
+from utils.functions import get_vehicle_topic, get_websocket_token
 
 
 @ServerInstances.general_api.websocket(
@@ -9,10 +24,144 @@ from utils.config import VEHICLE_ENDPOINT_NAME
 )
 async def on_connect(websocket: WebSocket, vehicle_uuid: str) -> None:
     try:
-        await ServerInstances.general_api.connect_websocket(websocket)
+        connection: ServerWebSocketConnection = (
+            await ServerInstances.general_api.connect_websocket(
+                websocket, get_vehicle_topic(vehicle_uuid)
+            )
+        )
+
+        position: Optional[VehicleLastPositionEntity] = (
+            ServerInstances.vehicle_positions.find(vehicle_uuid)
+        )
+
+        if position is not None:
+            connection.send_data(position.model_dump(), key=vehicle_uuid)
+
+        while True:
+            await ServerInstances.general_api.receive_websocket(websocket)
+
+    except (WebSocketDisconnect, WebSocketException, RuntimeError):
+        pass
+
+    finally:
+        await ServerInstances.general_api.disconnect_websocket(websocket)
+
+
+@ServerInstances.general_api.websocket(f"{VEHICLE_ENDPOINT_NAME}/viewport")
+async def on_connect_viewport(websocket: WebSocket) -> None:
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    try:
+        connection: ServerWebSocketConnection = (
+            await ServerInstances.general_api.connect_websocket(websocket)
+        )
+
+        while True:
+            message: DictType = await ServerInstances.general_api.receive_websocket(
+                websocket
+            )
+
+            try:
+                viewport: ViewportBodyEntity = ViewportBodyEntity.model_validate_json(
+                    message.get("text") or message.get("bytes") or ""
+                )
+
+            except ValidationError as error:
+                connection.send_json(
+                    {
+                        "type": "error",
+                        "detail": error.errors(
+                            include_context=False, include_url=False
+                        ),
+                    }
+                )
+
+                continue
+
+            ServerInstances.vehicle_viewports.subscribe(connection, viewport)
+
+            positions: Sequence[VehicleLastPositionEntity] = (
+                vehicle_events_service.find_viewport_positions(viewport)
+            )
+
+            for position in positions:
+                connection.send_data(position.model_dump(), key=position.vehicle_uuid)
+
+    except (WebSocketDisconnect, WebSocketException, RuntimeError):
+        pass
+
+    finally:
+        await ServerInstances.general_api.disconnect_websocket(websocket)
+
+
+@ServerInstances.general_api.websocket(
+    f"{EVENTS_ENDPOINT_NAME}{VEHICLE_ENDPOINT_NAME}/{{vehicle_uuid}}/stream"
+)
+async def on_connect_stream(websocket: WebSocket, vehicle_uuid: str) -> None:
+    auth_service: AuthService = AuthService()
+
+    vehicle_service: VehicleService = VehicleService()
+
+    vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+    token: str = get_websocket_token(websocket)
+
+    try:
+        principal: AgentPrincipal = await auth_service.get_agent_principal(token)
+
+        company_id: int = await principal.get_company_id()
+
+        vehicle: Vehicle = await vehicle_service.find_vehicle(vehicle_uuid)
+
+    except:
+        await websocket.close(code=1008)
+
+        return
+
+    if vehicle.company_id != company_id:
+        await websocket.close(code=1008)
+
+        return
+
+    try:
+        connection: ServerWebSocketConnection = (
+            await ServerInstances.general_api.connect_websocket(
+                websocket, company_id=vehicle.company_id, is_device=True
+            )
+        )
 
         while True:
-            await websocket.receive()
+            message: DictType = await ServerInstances.general_api.receive_websocket(
+                websocket
+            )
+
+            frame: Union[str, bytes] = (
+                message["bytes"]
+                if message.get("bytes") is not None
+                else message.get("text", "")
+            )
+
+            try:
+                positions: List[VehiclePositionItemEntity] = decode_device_frame(
+                    vehicle.uuid, frame
+                )
+
+            except ValueError as error:
+                connection.send_json({"type": "error", "detail": str(error)})
+
+                continue
+
+            rejected: Sequence[str] = (
+                await vehicle_events_service.capture_vehicle_positions(positions)
+            )
+
+            if rejected:
+                await websocket.close(code=1008)
+
+                break
 
     except (WebSocketDisconnect, WebSocketException, RuntimeError):
+        pass
+
+    finally:
         await ServerInstances.general_api.disconnect_websocket(websocket)
@@ -1,68 +1,87 @@
-from typing import Any, Callable, Awaitable, Mapping
-from fastapi import Request, Response
+from typing import Any, Awaitable, Callable, Mapping, Pattern, Sequence, Set, Tuple
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.routing import get_route_path
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from server.instances import ServerInstances
-from models import Agent, User
-from services.auth import AuthService
-from utils.functions import validate_middleware_request
+from models import User
+from services.auth import AuthService, AgentPrincipal
+from utils.functions import compile_route_prefixes
 from utils.responses import JSONUnauthorizedResponse
-from utils.config import AGENT_PUBLIC_ROUTES, USER_PUBLIC_ROUTES
+from utils.config import (
+    AGENT_PUBLIC_ROUTES,
+    USER_PUBLIC_ROUTES,
+    USER_PUBLIC_ENDPOINTS,
+)
 
 
-@ServerInstances.agent_api.middleware("http")
-async def verify_agent_authentication(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-):
-    verify_request = validate_middleware_request(
-        request, call_next, private_routes=AGENT_PUBLIC_ROUTES
-    )
+class AuthMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        authenticate: Callable[[str], Awaitable[Any]],
+        public_routes: Sequence[str],
+        public_endpoints: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        self.__app: ASGIApp = app
 
-    if await anext(verify_request):
-        return await anext(verify_request)
+        self.__authenticate: Callable[[str], Awaitable[Any]] = authenticate
 
-    auth_service: AuthService = AuthService()
+        self.__public_routes: Pattern[str] = compile_route_prefixes(public_routes)
+
+        self.__public_endpoints: Set[Tuple[str, str]] = {
+            (method.upper(), path.rstrip("/")) for method, path in public_endpoints
+        }
+
+    def __is_public(self, scope: Scope) -> bool:
+        route_path: str = get_route_path(scope)
 
-    token: str = request.headers.get("Authorization", "")
+        return (
+            self.__public_routes.match(route_path) is not None
+            or (scope["method"], route_path.rstrip("/")) in self.__public_endpoints
+        )
 
-    try:
-        agent: Agent = await auth_service.get_agent_data_in_token(token)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.__is_public(scope):
+            return await self.__app(scope, receive, send)
 
-    except:
-        response: Mapping[str, Any] = JSONUnauthorizedResponse().model_dump()
+        token: str = Headers(scope=scope).get("Authorization", "")
 
-        return JSONResponse(status_code=401, content=response)
+        try:
+            user: Any = await self.__authenticate(token)
 
-    else:
-        request.state.user = agent
+        except:
+            response: Mapping[str, Any] = JSONUnauthorizedResponse().model_dump()
 
-        return await call_next(request)
+            return await JSONResponse(status_code=401, content=response)(
+                scope, receive, send
+            )
 
+        scope.setdefault("state", {})["user"] = user
 
-@ServerInstances.user_api.middleware("http")
-async def verify_user_authentication(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-):
-    verify_request = validate_middleware_request(
-        request, call_next, private_routes=USER_PUBLIC_ROUTES
-    )
+        await self.__app(scope, receive, send)
 
-    if await anext(verify_request):
-        return await anext(verify_request)
 
+async def authenticate_agent(token: str) -> AgentPrincipal:
     auth_service: AuthService = AuthService()
 
-    token: str = request.headers.get("Authorization", "")
+    return await auth_service.get_agent_principal(token)
 
-    try:
-        agent: User = await auth_service.get_user_data_in_token(token)
 
-    except:
-        response: Mapping[str, Any] = JSONUnauthorizedResponse().model_dump()
+async def authenticate_user(token: str) -> User:
+    auth_service: AuthService = AuthService()
+
+    return await auth_service.get_user_data_in_token(token)
 
-        return JSONResponse(status_code=401, content=response)
 
-    else:
-        request.state.user = agent
+ServerInstances.agent_api.add_middleware(
+    AuthMiddleware, authenticate=authenticate_agent, public_routes=AGENT_PUBLIC_ROUTES
+)
 
-        return await call_next(request)
+ServerInstances.user_api.add_middleware(
+    AuthMiddleware,
+    authenticate=authenticate_user,
+    public_routes=USER_PUBLIC_ROUTES,
+    public_endpoints=USER_PUBLIC_ENDPOINTS,
+)
@@ -5,4 +5,5 @@ from models.agent import Agent
 from models.route_point import RoutePoint
 from models.user import User
 from models.vehicle import Vehicle
+from models.vehicle_position import VehiclePosition
 from models.common import database, UserBaseModel
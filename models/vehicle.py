@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey
 
@@ -7,6 +7,7 @@ from utils.types import VehicleType
 
 if TYPE_CHECKING:
     from models.company import Company
+    from models.route import Route
 
 
 class Vehicle(common.BaseModel):
@@ -18,4 +19,10 @@ class Vehicle(common.BaseModel):
 
     plate: Mapped[str] = mapped_column(nullable=False, unique=True)
 
+    route_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("route.id", ondelete="SET NULL"), nullable=True
+    )
+
     company: Mapped["Company"] = relationship(back_populates="vehicles")
+
+    route: Mapped[Optional["Route"]] = relationship()
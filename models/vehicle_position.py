@@ -0,0 +1,27 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer
+
+from . import common
+
+
+class VehiclePosition(common.database.Base):
+    __tablename__ = "vehicle_position"
+
+    __table_args__ = (Index("ix_vehicle_position_vehicle_id_ts", "vehicle_id", "ts"),)
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    vehicle_id: Mapped[int] = mapped_column(
+        ForeignKey("vehicle.id", ondelete="CASCADE"), nullable=False
+    )
+
+    latitude: Mapped[float] = mapped_column(nullable=False)
+
+    longitude: Mapped[float] = mapped_column(nullable=False)
+
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
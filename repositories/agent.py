@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import Update, update, delete, Select, select, func
 from sqlalchemy.orm import joinedload
 
+from server.instances import ServerInstances
 from models import Company, Agent
 from utils.patterns import (
     BaseRepository,
@@ -14,7 +15,6 @@ from utils.patterns import (
     IAuthRepository,
 )
 from utils.exceptions import UserNotFound, InvalidUserPassword
-from utils.crypt import CryptUtils
 from utils.types import DictType
 
 
@@ -25,7 +25,7 @@ class IAgentCreateRepository(Protocol):
 
     password: str
 
-    company: Company
+    company_id: int
 
 
 class IAgentUpdateRepository(Protocol):
@@ -50,7 +50,7 @@ class IAgentFindRepository(Protocol):
 
 
 class IAgentFindManyRepository(Protocol):
-    company: Company
+    company_id: int
     page: int
     limit: int
 
@@ -73,10 +73,10 @@ class AgentRepository(
     async def create(self, props: IAgentCreateRepository) -> Optional[Agent]:
         agent: Agent = Agent()
 
-        agent.company = props.company
+        agent.company_id = props.company_id
         agent.name = props.name
         agent.email = props.email
-        agent.password = CryptUtils.Bcrypt.create_hash(props.password)
+        agent.password = await ServerInstances.crypt_pool.create_hash(props.password)
 
         self.session.add(agent)
 
@@ -86,7 +86,7 @@ class AgentRepository(
         password: Optional[str] = props.password
 
         if password is not None:
-            password = CryptUtils.Bcrypt.create_hash(password)
+            password = await ServerInstances.crypt_pool.create_hash(password)
 
         if props.instance:
             props.instance.name = props.name
@@ -142,7 +142,7 @@ class AgentRepository(
             select(Agent)
             .join(Company, Agent.company_id == Company.id)
             .options(joinedload(Agent.company))
-            .where(Agent.company_id == props.company.id)
+            .where(Agent.company_id == props.company_id)
             .offset(props.page)
             .limit(props.limit)
         )
@@ -161,7 +161,9 @@ class AgentRepository(
         if agent is None:
             raise UserNotFound(props.email)
 
-        if not CryptUtils.Bcrypt.compare_password(props.password, agent.password):
+        if not await ServerInstances.crypt_pool.compare_password(
+            props.password, agent.password
+        ):
             raise InvalidUserPassword(agent)
 
         return agent
@@ -0,0 +1,28 @@
+from typing import Protocol, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, Select, select
+
+from models import Point, RoutePoint
+from utils.patterns import BaseRepository, IFindManyRepository
+
+
+class IRoutePointFindManyRepository(Protocol):
+    route_ids: Sequence[int]
+
+
+class RoutePointRepository(
+    BaseRepository[AsyncSession],
+    IFindManyRepository[IRoutePointFindManyRepository, Row],
+):
+    async def find_many(self, props: IRoutePointFindManyRepository) -> Sequence[Row]:
+        if not props.route_ids:
+            return []
+
+        query: Select = (
+            select(RoutePoint.route_id, Point.uuid, Point.latitude, Point.longitude)
+            .join(Point, RoutePoint.point_id == Point.id)
+            .where(RoutePoint.route_id.in_(props.route_ids))
+            .order_by(RoutePoint.route_id, RoutePoint.index)
+        )
+
+        return (await self.session.execute(query)).all()
@@ -2,6 +2,7 @@ from typing import Optional, Protocol
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import Update, update, Delete, delete, Select, select, func
 
+from server.instances import ServerInstances
 from models import User
 from utils.patterns import (
     BaseRepository,
@@ -12,7 +13,6 @@ from utils.patterns import (
     IAuthRepository,
 )
 from utils.exceptions import UserNotFound, InvalidUserPassword
-from utils.crypt import CryptUtils
 from utils.functions import handle_dict
 from utils.types import DictType
 
@@ -57,7 +57,7 @@ class UserRepository(
         user: User = User(
             name=props.name,
             email=props.email,
-            password=CryptUtils.Bcrypt.create_hash(props.password),
+            password=await ServerInstances.crypt_pool.create_hash(props.password),
         )
 
         self.session.add(user)
@@ -68,7 +68,7 @@ class UserRepository(
         password: Optional[str] = None
 
         if props.password:
-            password = CryptUtils.Bcrypt.create_hash(props.password)
+            password = await ServerInstances.crypt_pool.create_hash(props.password)
 
         if props.instance:
             props.instance.name = props.name
@@ -118,7 +118,9 @@ class UserRepository(
         if not user:
             raise UserNotFound(props.email)
 
-        if not CryptUtils.Bcrypt.compare_password(props.password, user.password):
+        if not await ServerInstances.crypt_pool.compare_password(
+            props.password, user.password
+        ):
             raise InvalidUserPassword(user)
 
         return user
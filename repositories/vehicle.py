@@ -17,20 +17,26 @@ from utils.types import DictType, VehicleType
 
 
 class IVehicleCreateRepository(Protocol):
-    company: Company
+    company_id: int
 
     type: VehicleType
 
     plate: str
 
+    route_id: Optional[int]
+
 
 class IVehicleUpdateRepository(Protocol):
     uuid: str
 
+    company_id: int
+
     type: VehicleType
 
     plate: str
 
+    route_id: Optional[int]
+
     instance: Optional[Vehicle]
 
 
@@ -45,13 +51,61 @@ class IVehicleFindRepository(Protocol):
 
 
 class IVehicleFindManyRepository(Protocol):
-    company: Company
+    uuids: Sequence[str]
 
 
 class VehicleRepository(
-    BaseRepository[AsyncSession], IFindRepository[IVehicleFindRepository, Vehicle]
+    BaseRepository[AsyncSession],
+    ICreateRepository[IVehicleCreateRepository, Optional[Vehicle]],
+    IUpdateRepository[IVehicleUpdateRepository, Optional[Vehicle]],
+    IFindRepository[IVehicleFindRepository, Vehicle],
+    IFindManyRepository[IVehicleFindManyRepository, Vehicle],
 ):
+    async def create(self, props: IVehicleCreateRepository) -> Optional[Vehicle]:
+        vehicle: Vehicle = Vehicle()
+
+        vehicle.company_id = props.company_id
+        vehicle.type = props.type.value
+        vehicle.plate = props.plate
+        vehicle.route_id = props.route_id
+
+        self.session.add(vehicle)
+
+        return vehicle
+
+    async def update(self, props: IVehicleUpdateRepository) -> Optional[Vehicle]:
+        if props.instance:
+            props.instance.type = props.type.value
+            props.instance.plate = props.plate
+            props.instance.route_id = props.route_id
+
+            self.session.add(props.instance)
+
+            return props.instance
+
+        else:
+            query: Update = (
+                update(Vehicle)
+                .where(
+                    Vehicle.uuid == props.uuid, Vehicle.company_id == props.company_id
+                )
+                .values(
+                    type=props.type.value, plate=props.plate, route_id=props.route_id
+                )
+                .returning(Vehicle)
+            )
+
+            return await self.session.scalar(query)
+
     async def find(self, props: IVehicleFindRepository) -> Optional[Vehicle]:
         query: Select = select(Vehicle).where(Vehicle.uuid == props.uuid)
 
         return await self.session.scalar(query)
+
+    async def find_many(self, props: IVehicleFindManyRepository) -> Sequence[Vehicle]:
+        if not props.uuids:
+            return []
+
+        query: Select = select(Vehicle).where(Vehicle.uuid.in_(props.uuids))
+
+        return (await self.session.scalars(query)).all()
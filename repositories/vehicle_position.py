@@ -0,0 +1,90 @@
+from typing import AsyncIterator, Protocol, Sequence
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection, AsyncResult
+from sqlalchemy import Row, Select, insert, select
+from sqlalchemy.pool import PoolProxiedConnection
+
+from models import VehiclePosition
+from utils.patterns import (
+    BaseRepository,
+    ICreateManyRepository,
+    IStreamManyRepository,
+)
+from utils.entities import VehiclePositionRecordEntity
+
+
+class IVehiclePositionCreateManyRepository(Protocol):
+    records: Sequence[VehiclePositionRecordEntity]
+
+
+class IVehiclePositionStreamManyRepository(Protocol):
+    vehicle_id: int
+
+    start: datetime
+
+    end: datetime
+
+    fetch_size: int
+
+
+class VehiclePositionRepository(
+    BaseRepository[AsyncSession],
+    ICreateManyRepository[IVehiclePositionCreateManyRepository, int],
+    IStreamManyRepository[IVehiclePositionStreamManyRepository, Row],
+):
+    __columns = ("vehicle_id", "latitude", "longitude", "ts")
+
+    async def __copy_records(
+        self, records: Sequence[VehiclePositionRecordEntity]
+    ) -> None:
+        connection: AsyncConnection = await self.session.connection()
+
+        raw_connection: PoolProxiedConnection = await connection.get_raw_connection()
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            VehiclePosition.__tablename__,
+            records=records,
+            columns=VehiclePositionRepository.__columns,
+        )
+
+    async def __insert_records(
+        self, records: Sequence[VehiclePositionRecordEntity]
+    ) -> None:
+        await self.session.execute(
+            insert(VehiclePosition), [record._asdict() for record in records]
+        )
+
+    async def create_many(self, props: IVehiclePositionCreateManyRepository) -> int:
+        if not props.records:
+            return 0
+
+        if self.session.bind.dialect.driver == "asyncpg":
+            await self.__copy_records(props.records)
+
+        else:
+            await self.__insert_records(props.records)
+
+        return len(props.records)
+
+    async def stream_many(
+        self, props: IVehiclePositionStreamManyRepository
+    ) -> AsyncIterator[Row]:
+        query: Select = (
+            select(
+                VehiclePosition.latitude,
+                VehiclePosition.longitude,
+                VehiclePosition.ts,
+            )
+            .where(
+                VehiclePosition.vehicle_id == props.vehicle_id,
+                VehiclePosition.ts >= props.start,
+                VehiclePosition.ts <= props.end,
+            )
+            .order_by(VehiclePosition.ts)
+            .execution_options(yield_per=props.fetch_size)
+        )
+
+        result: AsyncResult = await self.session.stream(query)
+
+        async for row in result:
+            yield row
@@ -3,6 +3,7 @@ if __name__ == "__main__":
     import controllers.http.public
     import controllers.http.private
     import controllers.websocket
+    import controllers.listeners
     import middlewares.auth
     from utils.config import AGENT_ENDPOINT_NAME, USER_ENDPOINT_NAME
 
@@ -0,0 +1,52 @@
+from argparse import ArgumentParser, Namespace
+import asyncio
+import logging
+import orjson
+
+
+async def main(
+    vehicles: int, rate: float, subscribers: int, duration: float, trace_memory: bool
+) -> None:
+    from tests.benchmarks.harness import BenchmarkResult, VehicleEventsBenchmark
+
+    benchmark: VehicleEventsBenchmark = VehicleEventsBenchmark(
+        vehicles=vehicles,
+        rate=rate,
+        subscribers=subscribers,
+        duration=duration,
+        trace_memory=trace_memory,
+    )
+
+    result: BenchmarkResult = await benchmark.run()
+
+    print(orjson.dumps(result._asdict(), option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser(
+        description="Measure the latency from position ingest to WebSocket delivery"
+    )
+
+    parser.add_argument("--vehicles", type=int, default=50)
+
+    parser.add_argument("--rate", type=float, default=1)
+
+    parser.add_argument("--subscribers", type=int, default=100)
+
+    parser.add_argument("--duration", type=float, default=10)
+
+    parser.add_argument("--no-trace-memory", action="store_true")
+
+    args: Namespace = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    asyncio.run(
+        main(
+            vehicles=args.vehicles,
+            rate=args.rate,
+            subscribers=args.subscribers,
+            duration=args.duration,
+            trace_memory=not args.no_trace_memory,
+        )
+    )
@@ -1,8 +1,32 @@
+from typing import Set
 from dotenv import load_dotenv
 import asyncio
 import logging
 
 
+async def add_vehicle_route_column() -> None:
+    from sqlalchemy import Connection, inspect, text
+    import models
+
+    def get_vehicle_columns(connection: Connection) -> Set[str]:
+        return {column["name"] for column in inspect(connection).get_columns("vehicle")}
+
+    async with models.database.async_engine.begin() as connection:
+        columns: Set[str] = await connection.run_sync(get_vehicle_columns)
+
+        if "route_id" in columns:
+            return
+
+        logging.warning("Adding the route_id column to the vehicle table")
+
+        await connection.execute(
+            text(
+                "ALTER TABLE vehicle ADD COLUMN route_id INTEGER "
+                "REFERENCES route (id) ON DELETE SET NULL"
+            )
+        )
+
+
 async def main(drop_all: bool = False) -> None:
     import models
 
@@ -11,6 +35,8 @@ async def main(drop_all: bool = False) -> None:
 
     await models.database.create_all_async()
 
+    await add_vehicle_route_column()
+
 
 if __name__ == "__main__":
     load_dotenv()
@@ -1,11 +1,78 @@
-from typing import Any, List, Union
-from fastapi import FastAPI, WebSocket
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+import asyncio
+import logging
+import time
+import orjson
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, WebSocketException
+from starlette.types import Message
+from starlette.websockets import WebSocketState
 import uvicorn
 
+from server.backplane import ServerBackplane, ServerLocalBackplane
+from server.wheel import ServerTimerWheel
+from server.websocket import (
+    ServerWebSocketConnection,
+    ServerWebSocketRegistry,
+    ServerWebSocketCodec,
+    ServerWebSocketRouter,
+    WebSocketEncodedFrame,
+    WebSocketFrame,
+    encode_websocket_frame,
+)
+from utils.entities import WebSocketMetricsEntity
+from utils.types import WebSocketOverflowPolicy
+from utils.config import (
+    API_FORWARDED_ALLOW_IPS,
+    WEBSOCKET_OVERFLOW_POLICY,
+    WEBSOCKET_SEND_QUEUE_SIZE,
+    WEBSOCKET_MAX_CONNECTIONS,
+    WEBSOCKET_MAX_COMPANY_CONNECTIONS,
+    WEBSOCKET_MAX_COMPANY_DEVICES,
+    WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS,
+    WEBSOCKET_IDLE_TIMEOUT_SECONDS,
+    WEBSOCKET_PING_INTERVAL_SECONDS,
+    WEBSOCKET_PING_TIMEOUT_SECONDS,
+    WEBSOCKET_TIMER_TICK_SECONDS,
+    WEBSOCKET_TIMER_SLOTS,
+)
+
 
 class ServerApi(FastAPI):
     def __init__(
-        self, host: str, port: Union[int, str], *args: Any, **kwargs: Any
+        self,
+        host: str,
+        port: Union[int, str],
+        *args: Any,
+        forwarded_allow_ips: str = API_FORWARDED_ALLOW_IPS,
+        websocket_queue_size: int = WEBSOCKET_SEND_QUEUE_SIZE,
+        websocket_overflow_policy: Union[
+            WebSocketOverflowPolicy, str
+        ] = WEBSOCKET_OVERFLOW_POLICY,
+        websocket_backplane: Optional[ServerBackplane] = None,
+        websocket_codecs: Iterable[ServerWebSocketCodec] = (),
+        websocket_routers: Iterable[
+            ServerWebSocketRouter[ServerWebSocketConnection]
+        ] = (),
+        websocket_max_connections: int = WEBSOCKET_MAX_CONNECTIONS,
+        websocket_max_company_connections: int = WEBSOCKET_MAX_COMPANY_CONNECTIONS,
+        websocket_max_company_devices: int = WEBSOCKET_MAX_COMPANY_DEVICES,
+        websocket_heartbeat_interval: float = WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS,
+        websocket_idle_timeout: float = WEBSOCKET_IDLE_TIMEOUT_SECONDS,
+        websocket_ping_interval: float = WEBSOCKET_PING_INTERVAL_SECONDS,
+        websocket_ping_timeout: float = WEBSOCKET_PING_TIMEOUT_SECONDS,
+        websocket_timer_tick: float = WEBSOCKET_TIMER_TICK_SECONDS,
+        websocket_timer_slots: int = WEBSOCKET_TIMER_SLOTS,
+        **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
@@ -13,30 +80,393 @@ class ServerApi(FastAPI):
 
         self.__port: Union[int, str] = port
 
-        self.__websocket_connections: List[WebSocket] = []
+        self.__forwarded_allow_ips: str = forwarded_allow_ips
 
-    @property
-    def websocket_connections(self) -> List[WebSocket]:
-        return self.__websocket_connections
+        self.__websocket_queue_size: int = websocket_queue_size
+
+        self.__websocket_overflow_policy: WebSocketOverflowPolicy = (
+            WebSocketOverflowPolicy(websocket_overflow_policy)
+        )
+
+        self.__websocket_backplane: ServerBackplane = (
+            websocket_backplane or ServerLocalBackplane()
+        )
+
+        self.__websocket_backplane.bind(self.deliver)
+
+        self.router.on_startup.append(self.__websocket_backplane.start)
+
+        self.router.on_shutdown.append(self.__websocket_backplane.stop)
+
+        self.__websocket_codecs: Dict[str, ServerWebSocketCodec] = {
+            codec.subprotocol: codec for codec in websocket_codecs
+        }
+
+        self.__websocket_routers: Sequence[
+            ServerWebSocketRouter[ServerWebSocketConnection]
+        ] = tuple(websocket_routers)
+
+        self.__websocket_connections: Dict[WebSocket, ServerWebSocketConnection] = {}
+
+        self.__websocket_registry: ServerWebSocketRegistry[
+            ServerWebSocketConnection
+        ] = ServerWebSocketRegistry()
+
+        self.__websocket_max_connections: int = websocket_max_connections
+
+        self.__websocket_max_company_connections: int = (
+            websocket_max_company_connections
+        )
+
+        self.__websocket_company_connections: Dict[int, int] = {}
 
-    async def connect_websocket(self, websocket: WebSocket) -> None:
-        await websocket.accept()
+        self.__websocket_max_company_devices: int = websocket_max_company_devices
 
-        self.__websocket_connections.append(websocket)
+        self.__websocket_company_devices: Dict[int, int] = {}
 
-    async def disconnect_websocket(self, websocket: WebSocket) -> None:
-        try:
-            await websocket.close()
+        self.__websocket_heartbeat_interval: float = websocket_heartbeat_interval
 
-        finally:
-            self.__websocket_connections.remove(websocket)
+        self.__websocket_idle_timeout: float = websocket_idle_timeout
 
-    def find_websocket_connections_by_url(self, url: str) -> List[WebSocket]:
+        self.__websocket_ping_interval: float = websocket_ping_interval
+
+        self.__websocket_ping_timeout: float = websocket_ping_timeout
+
+        self.__websocket_timers: ServerTimerWheel[ServerWebSocketConnection] = (
+            ServerTimerWheel(
+                tick=websocket_timer_tick,
+                slots=websocket_timer_slots,
+                callback=self.__check_websocket,
+                name="websocket",
+            )
+        )
+
+        self.router.on_startup.append(self.__websocket_timers.start)
+
+        self.router.on_shutdown.append(self.__websocket_timers.stop)
+
+        self.__websocket_accepted: int = 0
+
+        self.__websocket_rejected: int = 0
+
+        self.__websocket_evicted: int = 0
+
+        self.__websocket_heartbeats: int = 0
+
+        self.__websocket_dropped: int = 0
+
+    def __find_websocket_codec(
+        self, websocket: WebSocket
+    ) -> Optional[ServerWebSocketCodec]:
+        for subprotocol in websocket.scope.get("subprotocols") or ():
+            if subprotocol in self.__websocket_codecs:
+                return self.__websocket_codecs[subprotocol]
+
+        return None
+
+    @property
+    def websocket_connections(self) -> Collection[ServerWebSocketConnection]:
+        return self.__websocket_registry.connections
+
+    @property
+    def websocket_metrics(self) -> WebSocketMetricsEntity:
+        return WebSocketMetricsEntity(
+            connections=len(self.__websocket_connections),
+            companies=len(
+                self.__websocket_company_connections.keys()
+                | self.__websocket_company_devices.keys()
+            ),
+            devices=sum(self.__websocket_company_devices.values()),
+            max_connections=self.__websocket_max_connections,
+            max_company_connections=self.__websocket_max_company_connections,
+            max_company_devices=self.__websocket_max_company_devices,
+            accepted=self.__websocket_accepted,
+            rejected=self.__websocket_rejected,
+            evicted=self.__websocket_evicted,
+            heartbeats=self.__websocket_heartbeats,
+            pending_frames=sum(
+                connection.pending
+                for connection in self.__websocket_connections.values()
+            ),
+            dropped_frames=self.__websocket_dropped
+            + sum(
+                connection.dropped
+                for connection in self.__websocket_connections.values()
+            ),
+        )
+
+    def __get_websocket_intervals(self) -> Sequence[float]:
         return [
-            websocket
-            for websocket in self.__websocket_connections
-            if url in websocket.url.path
+            interval
+            for interval in (
+                self.__websocket_heartbeat_interval,
+                self.__websocket_idle_timeout,
+            )
+            if interval > 0
         ]
 
+    def __schedule_websocket(self, connection: ServerWebSocketConnection) -> None:
+        intervals: Sequence[float] = self.__get_websocket_intervals()
+
+        if not intervals:
+            return
+
+        idle: float = time.monotonic() - connection.last_activity
+
+        self.__websocket_timers.schedule(
+            connection,
+            min(
+                [
+                    *intervals,
+                    *[interval - idle for interval in intervals if interval > idle],
+                ]
+            ),
+        )
+
+    def __check_websocket(self, connection: ServerWebSocketConnection) -> None:
+        if (
+            connection.closed
+            or connection.websocket not in self.__websocket_connections
+        ):
+            return
+
+        idle: float = time.monotonic() - connection.last_activity
+
+        if 0 < self.__websocket_idle_timeout <= idle:
+            logging.info(f"Evicting websocket idle for {idle:.0f}s")
+
+            self.__websocket_evicted += 1
+
+            asyncio.ensure_future(
+                self.disconnect_websocket(connection.websocket, code=1001)
+            )
+
+            return
+
+        if 0 < self.__websocket_heartbeat_interval <= idle:
+            connection.send_json({"type": "heartbeat"}, key="heartbeat")
+
+            self.__websocket_heartbeats += 1
+
+        self.__schedule_websocket(connection)
+
+    def __get_company_counts(self, is_device: bool) -> Dict[int, int]:
+        return (
+            self.__websocket_company_devices
+            if is_device
+            else self.__websocket_company_connections
+        )
+
+    def count_company_websockets(self, company_id: int, is_device: bool = False) -> int:
+        return self.__get_company_counts(is_device).get(company_id, 0)
+
+    def __is_websocket_limited(
+        self, company_id: Optional[int], is_device: bool
+    ) -> bool:
+        if len(self.__websocket_connections) >= self.__websocket_max_connections:
+            return True
+
+        max_company_connections: int = (
+            self.__websocket_max_company_devices
+            if is_device
+            else self.__websocket_max_company_connections
+        )
+
+        return (
+            company_id is not None
+            and self.__get_company_counts(is_device).get(company_id, 0)
+            >= max_company_connections
+        )
+
+    async def connect_websocket(
+        self,
+        websocket: WebSocket,
+        *topics: str,
+        overflow_policy: Optional[WebSocketOverflowPolicy] = None,
+        company_id: Optional[int] = None,
+        is_device: bool = False,
+    ) -> ServerWebSocketConnection:
+        if self.__is_websocket_limited(company_id, is_device):
+            self.__websocket_rejected += 1
+
+            await websocket.close(code=1013)
+
+            raise WebSocketException(code=1013, reason="Too many connections")
+
+        codec: Optional[ServerWebSocketCodec] = self.__find_websocket_codec(websocket)
+
+        await websocket.accept(subprotocol=codec.subprotocol if codec else None)
+
+        connection: ServerWebSocketConnection = ServerWebSocketConnection(
+            websocket,
+            on_close=self.disconnect_websocket,
+            max_queue_size=self.__websocket_queue_size,
+            overflow_policy=overflow_policy or self.__websocket_overflow_policy,
+            codec=codec,
+            company_id=company_id,
+            is_device=is_device,
+        )
+
+        self.__websocket_connections[websocket] = connection
+
+        self.__websocket_accepted += 1
+
+        if company_id is not None:
+            company_counts: Dict[int, int] = self.__get_company_counts(is_device)
+
+            company_counts[company_id] = company_counts.get(company_id, 0) + 1
+
+        self.__websocket_registry.add(connection)
+
+        for topic in topics:
+            self.__websocket_registry.subscribe(connection, topic)
+
+        connection.start()
+
+        self.__schedule_websocket(connection)
+
+        return connection
+
+    async def receive_websocket(self, websocket: WebSocket) -> Message:
+        message: Message = await websocket.receive()
+
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+
+        connection: Optional[ServerWebSocketConnection] = (
+            self.__websocket_connections.get(websocket)
+        )
+
+        if connection is not None:
+            connection.touch()
+
+        return message
+
+    def subscribe_websocket(self, websocket: WebSocket, topic: str) -> None:
+        connection: Optional[ServerWebSocketConnection] = (
+            self.__websocket_connections.get(websocket)
+        )
+
+        if connection is not None:
+            self.__websocket_registry.subscribe(connection, topic)
+
+    def unsubscribe_websocket(self, websocket: WebSocket, topic: str) -> None:
+        connection: Optional[ServerWebSocketConnection] = (
+            self.__websocket_connections.get(websocket)
+        )
+
+        if connection is not None:
+            self.__websocket_registry.unsubscribe(connection, topic)
+
+    async def disconnect_websocket(
+        self, websocket: WebSocket, code: int = 1000
+    ) -> None:
+        connection: Optional[ServerWebSocketConnection] = (
+            self.__websocket_connections.pop(websocket, None)
+        )
+
+        if connection is not None:
+            connection.stop()
+
+            self.__websocket_timers.cancel(connection)
+
+            self.__websocket_registry.remove(connection)
+
+            self.__websocket_dropped += connection.dropped
+
+            for router in self.__websocket_routers:
+                router.remove(connection)
+
+            if connection.company_id is not None:
+                company_counts: Dict[int, int] = self.__get_company_counts(
+                    connection.is_device
+                )
+
+                company_counts[connection.company_id] -= 1
+
+                if not company_counts[connection.company_id]:
+                    del company_counts[connection.company_id]
+
+        if websocket.client_state != WebSocketState.DISCONNECTED:
+            try:
+                await websocket.close(code=code)
+
+            except RuntimeError:
+                pass
+
+    def find_websocket_connections(
+        self, topic: str
+    ) -> Sequence[ServerWebSocketConnection]:
+        return self.__websocket_registry.find(topic)
+
+    @property
+    def websocket_backplane(self) -> ServerBackplane:
+        return self.__websocket_backplane
+
+    def deliver(
+        self, topic: str, frame: WebSocketFrame, key: Optional[Hashable] = None
+    ) -> int:
+        encoded_frames: Dict[str, Optional[WebSocketEncodedFrame]] = {}
+
+        data: Any = None
+
+        sent: int = 0
+
+        connections: Sequence[ServerWebSocketConnection] = (
+            self.__websocket_registry.find(topic)
+        )
+
+        if not isinstance(frame, bytes):
+            for router in self.__websocket_routers:
+                if not topic.startswith(router.topic_prefix):
+                    continue
+
+                if data is None:
+                    data = orjson.loads(frame)
+
+                routed: Set[ServerWebSocketConnection] = set(router.route(topic, data))
+
+                if routed:
+                    connections = (*connections, *routed.difference(connections))
+
+        for connection in connections:
+            codec: Optional[ServerWebSocketCodec] = connection.codec
+
+            if codec is None or isinstance(frame, bytes):
+                sent += connection.send(frame, key)
+
+                continue
+
+            if codec.subprotocol not in encoded_frames:
+                if data is None:
+                    data = orjson.loads(frame)
+
+                encoded_frames[codec.subprotocol] = codec.encode(data)
+
+            encoded: Optional[WebSocketEncodedFrame] = encoded_frames[codec.subprotocol]
+
+            sent += (
+                connection.send(frame, key)
+                if encoded is None
+                else connection.send_encoded(encoded, key)
+            )
+
+        return sent
+
+    def broadcast(self, topic: str, data: Any, key: Optional[str] = None) -> None:
+        frame: WebSocketFrame = (
+            data if isinstance(data, (str, bytes)) else encode_websocket_frame(data)
+        )
+
+        self.__websocket_backplane.publish(topic, frame, key)
+
     def start(self) -> None:
-        uvicorn.run(self, host=self.__host, port=int(self.__port))
+        uvicorn.run(
+            self,
+            host=self.__host,
+            port=int(self.__port),
+            proxy_headers=True,
+            forwarded_allow_ips=self.__forwarded_allow_ips,
+            ws_ping_interval=self.__websocket_ping_interval or None,
+            ws_ping_timeout=self.__websocket_ping_timeout or None,
+        )
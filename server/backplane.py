@@ -0,0 +1,203 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeAlias, Union
+from abc import ABC, abstractmethod
+from threading import Event, Thread
+from uuid import uuid4
+import asyncio
+import logging
+
+from server.event import ServerConsumer, ServerProducer
+from server.websocket import WebSocketFrame
+from utils.types import WebSocketBackplaneType
+from utils.config import WEBSOCKET_BACKPLANE_TOPIC
+
+
+DeliverType: TypeAlias = Callable[[str, WebSocketFrame, Optional[str]], Any]
+
+ProducerFactoryType: TypeAlias = Callable[..., ServerProducer]
+
+ConsumerFactoryType: TypeAlias = Callable[..., ServerConsumer]
+
+
+class ServerBackplane(ABC):
+    def __init__(self) -> None:
+        self.__deliver: Optional[DeliverType] = None
+
+    def bind(self, deliver: DeliverType) -> None:
+        self.__deliver = deliver
+
+    def deliver(self, topic: str, frame: WebSocketFrame, key: Optional[str]) -> None:
+        if self.__deliver is not None:
+            self.__deliver(topic, frame, key)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def publish(
+        self, topic: str, frame: WebSocketFrame, key: Optional[str] = None
+    ) -> None: ...
+
+
+class ServerLocalBackplane(ServerBackplane):
+    def publish(
+        self, topic: str, frame: WebSocketFrame, key: Optional[str] = None
+    ) -> None:
+        self.deliver(topic, frame, key)
+
+
+class ServerKafkaBackplane(ServerBackplane):
+    def __init__(
+        self,
+        kafka_topic: str = WEBSOCKET_BACKPLANE_TOPIC,
+        producer_factory: ProducerFactoryType = ServerProducer,
+        consumer_factory: ConsumerFactoryType = ServerConsumer,
+        poll_timeout: float = 0.5,
+    ) -> None:
+        super().__init__()
+
+        self.__kafka_topic: str = kafka_topic
+
+        self.__poll_timeout: float = poll_timeout
+
+        self.__producer_factory: ProducerFactoryType = producer_factory
+
+        self.__consumer_factory: ConsumerFactoryType = consumer_factory
+
+        self.__origin: bytes = uuid4().hex.encode()
+
+        self.__producer: Optional[ServerProducer] = None
+
+        self.__consumer: Optional[ServerConsumer] = None
+
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.__consumer_thread: Optional[Thread] = None
+
+        self.__stopping: Event = Event()
+
+    def __get_headers(
+        self, topic: str, frame: WebSocketFrame, key: Optional[str]
+    ) -> List[Tuple[str, bytes]]:
+        headers: List[Tuple[str, bytes]] = [
+            ("origin", self.__origin),
+            ("topic", topic.encode()),
+            ("binary", b"1" if isinstance(frame, bytes) else b"0"),
+        ]
+
+        if key is not None:
+            headers.append(("key", key.encode()))
+
+        return headers
+
+    def __on_message(self, message: Any) -> None:
+        headers: Dict[str, bytes] = dict(message.headers or ())
+
+        if headers.get("origin") == self.__origin or "topic" not in headers:
+            return
+
+        topic: str = headers["topic"].decode()
+
+        key: Optional[str] = headers["key"].decode() if "key" in headers else None
+
+        frame: WebSocketFrame = (
+            message.value if headers.get("binary") == b"1" else message.value.decode()
+        )
+
+        if self.__loop is not None:
+            self.__loop.call_soon_threadsafe(self.deliver, topic, frame, key)
+
+    def __consume(self, consumer: ServerConsumer) -> None:
+        try:
+            while not self.__stopping.is_set():
+                records: Any = consumer.poll(timeout_ms=int(self.__poll_timeout * 1000))
+
+                for messages in records.values():
+                    for message in messages:
+                        self.__on_message(message)
+
+        except Exception as error:
+            logging.error(
+                f"WebSocket backplane consumer for {self.__kafka_topic} failed"
+            )
+
+            logging.exception(error)
+
+        finally:
+            consumer.close()
+
+    async def start(self) -> None:
+        self.__loop = asyncio.get_running_loop()
+
+        self.__producer = await asyncio.to_thread(self.__producer_factory, linger_ms=5)
+
+        try:
+            await asyncio.to_thread(self.__producer.partitions_for, self.__kafka_topic)
+
+        except Exception as error:
+            logging.warning(
+                f"Failed to fetch metadata for {self.__kafka_topic}: {error}"
+            )
+
+        self.__consumer = await asyncio.to_thread(
+            self.__consumer_factory,
+            self.__kafka_topic,
+            self.__on_message,
+            auto_offset_reset="latest",
+        )
+
+        self.__stopping.clear()
+
+        self.__consumer_thread = Thread(
+            target=self.__consume,
+            args=(self.__consumer,),
+            name=f"backplane-{self.__kafka_topic}",
+            daemon=True,
+        )
+
+        self.__consumer_thread.start()
+
+        logging.info(f"WebSocket backplane listening on {self.__kafka_topic}")
+
+    async def stop(self) -> None:
+        self.__stopping.set()
+
+        if self.__consumer_thread is not None:
+            await asyncio.to_thread(self.__consumer_thread.join)
+
+            self.__consumer_thread = None
+
+        self.__consumer = None
+
+        if self.__producer is not None:
+            await asyncio.to_thread(self.__producer.close)
+
+            self.__producer = None
+
+    def publish(
+        self, topic: str, frame: WebSocketFrame, key: Optional[str] = None
+    ) -> None:
+        self.deliver(topic, frame, key)
+
+        if self.__producer is None:
+            logging.warning("WebSocket backplane is not started")
+
+            return
+
+        self.__producer.send(
+            self.__kafka_topic,
+            value=frame if isinstance(frame, bytes) else frame.encode(),
+            key=key.encode() if key is not None else None,
+            headers=self.__get_headers(topic, frame, key),
+        )
+
+
+def create_backplane(
+    backplane_type: Union[WebSocketBackplaneType, str],
+) -> ServerBackplane:
+    if WebSocketBackplaneType(backplane_type) == WebSocketBackplaneType.KAFKA:
+        return ServerKafkaBackplane()
+
+    return ServerLocalBackplane()
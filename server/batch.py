@@ -0,0 +1,122 @@
+from typing import Any, Awaitable, Callable, Deque, Generic, List, Optional, TypeVar
+from collections import deque
+import asyncio
+import logging
+
+
+T = TypeVar("T")
+
+
+class ServerBatchWriter(Generic[T]):
+    def __init__(
+        self,
+        batch_size: int,
+        max_buffer_size: int,
+        flush_interval: float,
+        name: str = "batch",
+    ) -> None:
+        self.__batch_size: int = max(batch_size, 1)
+
+        self.__flush_interval: float = flush_interval
+
+        self.__name: str = name
+
+        self.__buffer: Deque[T] = deque(maxlen=max(max_buffer_size, self.__batch_size))
+
+        self.__flush: Optional[Callable[[List[T]], Awaitable[Any]]] = None
+
+        self.__ready: Optional[asyncio.Event] = None
+
+        self.__worker: Optional[asyncio.Task] = None
+
+        self.__lock: asyncio.Lock = asyncio.Lock()
+
+        self.__stopping: bool = False
+
+        self.__dropped: int = 0
+
+        self.__written: int = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self.__buffer)
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    @property
+    def written(self) -> int:
+        return self.__written
+
+    def bind(self, flush: Callable[[List[T]], Awaitable[Any]]) -> None:
+        self.__flush = flush
+
+    def add(self, item: T) -> None:
+        if len(self.__buffer) == self.__buffer.maxlen:
+            self.__dropped += 1
+
+        self.__buffer.append(item)
+
+        if self.__ready is not None and len(self.__buffer) >= self.__batch_size:
+            self.__ready.set()
+
+    def __take_batch(self) -> List[T]:
+        size: int = min(len(self.__buffer), self.__batch_size)
+
+        return [self.__buffer.popleft() for _ in range(size)]
+
+    async def flush(self) -> None:
+        async with self.__lock:
+            while self.__buffer and self.__flush is not None:
+                batch: List[T] = self.__take_batch()
+
+                try:
+                    await self.__flush(batch)
+
+                    self.__written += len(batch)
+
+                except Exception as error:
+                    self.__dropped += len(batch)
+
+                    logging.error(f"Failed to write {len(batch)} {self.__name} items")
+
+                    logging.exception(error)
+
+                    return
+
+    async def __work(self, ready: asyncio.Event) -> None:
+        while not self.__stopping:
+            try:
+                await asyncio.wait_for(ready.wait(), self.__flush_interval)
+
+            except asyncio.TimeoutError:
+                pass
+
+            ready.clear()
+
+            await self.flush()
+
+    async def start(self) -> None:
+        if self.__worker is None:
+            self.__stopping = False
+
+            self.__ready = asyncio.Event()
+
+            self.__worker = asyncio.get_running_loop().create_task(
+                self.__work(self.__ready)
+            )
+
+    async def stop(self) -> None:
+        if self.__worker is not None and self.__ready is not None:
+            self.__stopping = True
+
+            self.__ready.set()
+
+            await self.__worker
+
+            self.__worker = None
+
+            self.__ready = None
+
+        await self.flush()
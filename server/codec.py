@@ -0,0 +1,150 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime, UTC
+import struct
+import orjson
+
+from server.websocket import ServerWebSocketCodec, WebSocketEncodedFrame
+from utils.entities import VehiclePositionItemEntity
+
+
+DICTIONARY_RECORD_TYPE: int = 1
+
+POSITION_RECORD_TYPE: int = 2
+
+DICTIONARY_RECORD: struct.Struct = struct.Struct("<BIH")
+
+POSITION_RECORD: struct.Struct = struct.Struct("<BIiiQ")
+
+DEVICE_POSITION_RECORD: struct.Struct = struct.Struct("<iiQ")
+
+MICRO_DEGREES: int = 1_000_000
+
+
+class ServerPositionCodec(ServerWebSocketCodec):
+    subprotocol: str = "busstop.position.v1"
+
+    def __init__(self) -> None:
+        self.__indexes: Dict[str, int] = {}
+
+        self.__announcements: List[bytes] = []
+
+    def find_index(self, vehicle_uuid: str) -> int:
+        index: Optional[int] = self.__indexes.get(vehicle_uuid)
+
+        if index is None:
+            index = len(self.__announcements)
+
+            uuid_bytes: bytes = vehicle_uuid.encode()
+
+            self.__indexes[vehicle_uuid] = index
+
+            self.__announcements.append(
+                DICTIONARY_RECORD.pack(DICTIONARY_RECORD_TYPE, index, len(uuid_bytes))
+                + uuid_bytes
+            )
+
+        return index
+
+    def encode(self, data: Any) -> Optional[WebSocketEncodedFrame]:
+        if not isinstance(data, dict) or "vehicle_uuid" not in data:
+            return None
+
+        try:
+            latitude: int = round(float(data["latitude"]) * MICRO_DEGREES)
+
+            longitude: int = round(float(data["longitude"]) * MICRO_DEGREES)
+
+            ts: int = round(float(data["ts"]) * 1000)
+
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return None
+
+        index: int = self.find_index(data["vehicle_uuid"])
+
+        try:
+            frame: bytes = POSITION_RECORD.pack(
+                POSITION_RECORD_TYPE, index, latitude, longitude, ts
+            )
+
+        except struct.error:
+            return None
+
+        return WebSocketEncodedFrame(
+            frame=frame,
+            announcement_key=index,
+            announcement=self.__announcements[index],
+        )
+
+    @staticmethod
+    def decode(frame: bytes) -> List[Tuple[Union[str, float], ...]]:
+        records: List[Tuple[Union[str, float], ...]] = []
+
+        offset: int = 0
+
+        while offset < len(frame):
+            record_type: int = frame[offset]
+
+            if record_type == DICTIONARY_RECORD_TYPE:
+                _, index, size = DICTIONARY_RECORD.unpack_from(frame, offset)
+
+                offset += DICTIONARY_RECORD.size
+
+                records.append(
+                    ("dictionary", index, frame[offset : offset + size].decode())
+                )
+
+                offset += size
+
+            elif record_type == POSITION_RECORD_TYPE:
+                _, index, latitude, longitude, ts = POSITION_RECORD.unpack_from(
+                    frame, offset
+                )
+
+                offset += POSITION_RECORD.size
+
+                records.append(
+                    (
+                        "position",
+                        index,
+                        latitude / MICRO_DEGREES,
+                        longitude / MICRO_DEGREES,
+                        ts / 1000,
+                    )
+                )
+
+            else:
+                raise ValueError(f"Unknown record type {record_type}")
+
+        return records
+
+
+def decode_device_frame(
+    vehicle_uuid: str, frame: Union[str, bytes]
+) -> List[VehiclePositionItemEntity]:
+    if isinstance(frame, str):
+        data: Any = orjson.loads(frame)
+
+        items: List[Any] = data if isinstance(data, list) else [data]
+
+        if not all(isinstance(item, dict) for item in items):
+            raise ValueError("Position frames must contain objects")
+
+        return [
+            VehiclePositionItemEntity.model_validate(
+                {**item, "vehicle_uuid": vehicle_uuid}
+            )
+            for item in items
+        ]
+
+    if len(frame) % DEVICE_POSITION_RECORD.size:
+        raise ValueError(f"Invalid position frame size {len(frame)}")
+
+    return [
+        VehiclePositionItemEntity(
+            vehicle_uuid=vehicle_uuid,
+            latitude=latitude / MICRO_DEGREES,
+            longitude=longitude / MICRO_DEGREES,
+            ts=datetime.fromtimestamp(ts / 1000, UTC) if ts else None,
+        )
+        for latitude, longitude, ts in DEVICE_POSITION_RECORD.iter_unpack(frame)
+    ]
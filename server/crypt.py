@@ -0,0 +1,124 @@
+from typing import Any, Callable, Optional, Tuple, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import logging
+import threading
+import time
+
+from utils.crypt import CryptUtils
+from utils.entities import CryptPoolMetricsEntity
+from utils.exceptions import ServerCryptPoolOverloaded
+
+
+T = TypeVar("T")
+
+
+class ServerCryptPool:
+    def __init__(self, max_workers: int, max_pending: int, name: str = "crypt") -> None:
+        self.__max_workers: int = max(max_workers, 1)
+
+        self.__max_pending: int = max(max_pending, 0)
+
+        self.__name: str = name
+
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+        self.__in_flight: int = 0
+
+        self.__lock: threading.Lock = threading.Lock()
+
+        self.__completed: int = 0
+
+        self.__rejected: int = 0
+
+        self.__wait_time: float = 0
+
+        self.__max_wait_time: float = 0
+
+    @property
+    def running(self) -> int:
+        return min(self.__in_flight, self.__max_workers)
+
+    @property
+    def queued(self) -> int:
+        return max(self.__in_flight - self.__max_workers, 0)
+
+    @property
+    def metrics(self) -> CryptPoolMetricsEntity:
+        return CryptPoolMetricsEntity(
+            max_workers=self.__max_workers,
+            max_pending=self.__max_pending,
+            running=self.running,
+            queued=self.queued,
+            completed=self.__completed,
+            rejected=self.__rejected,
+            average_wait_seconds=self.__wait_time / max(self.__completed, 1),
+            max_wait_seconds=self.__max_wait_time,
+        )
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.__max_workers, thread_name_prefix=self.__name
+            )
+
+        return self.__executor
+
+    @staticmethod
+    def __call(
+        submitted_at: float, function: Callable[..., T], *args: Any
+    ) -> Tuple[float, T]:
+        waited: float = time.monotonic() - submitted_at
+
+        return waited, function(*args)
+
+    def __release(self, *_: Any) -> None:
+        with self.__lock:
+            self.__in_flight -= 1
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        if self.__in_flight >= self.__max_workers + self.__max_pending:
+            self.__rejected += 1
+
+            logging.warning(
+                f"Rejecting {self.__name} job, {self.queued} jobs already queued"
+            )
+
+            raise ServerCryptPoolOverloaded(self.__name)
+
+        with self.__lock:
+            self.__in_flight += 1
+
+        try:
+            future: Future[Tuple[float, T]] = self.__get_executor().submit(
+                self.__call, time.monotonic(), function, *args
+            )
+
+        except:
+            self.__release()
+
+            raise
+
+        future.add_done_callback(self.__release)
+
+        waited, result = await asyncio.wrap_future(future)
+
+        self.__completed += 1
+
+        self.__wait_time += waited
+
+        self.__max_wait_time = max(self.__max_wait_time, waited)
+
+        return result
+
+    async def create_hash(self, data: str) -> str:
+        return await self.run(CryptUtils.Bcrypt.create_hash, data)
+
+    async def compare_password(self, password: str, hash: str) -> bool:
+        return await self.run(CryptUtils.Bcrypt.compare_password, password, hash)
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+            self.__executor = None
@@ -0,0 +1,71 @@
+from typing import Dict, Optional
+
+from utils.entities import VehicleProgressEntity
+
+
+class ServerEtaTracker:
+    def __init__(
+        self, smoothing: float, default_speed: float, reset_distance: float
+    ) -> None:
+        self.__smoothing: float = smoothing
+
+        self.__default_speed: float = default_speed
+
+        self.__reset_distance: float = reset_distance
+
+        self.__vehicles: Dict[str, VehicleProgressEntity] = {}
+
+    def __len__(self) -> int:
+        return len(self.__vehicles)
+
+    def __contains__(self, vehicle_uuid: str) -> bool:
+        return vehicle_uuid in self.__vehicles
+
+    def update(
+        self, vehicle_uuid: str, route_id: int, progress: float, ts: float
+    ) -> VehicleProgressEntity:
+        current: Optional[VehicleProgressEntity] = self.__vehicles.get(vehicle_uuid)
+
+        if current is not None and current.route_id == route_id and ts <= current.ts:
+            return current
+
+        if (
+            current is None
+            or current.route_id != route_id
+            or progress < current.progress - self.__reset_distance
+        ):
+            speed: float = (
+                current.speed
+                if current is not None and current.route_id == route_id
+                else self.__default_speed
+            )
+
+            updated: VehicleProgressEntity = VehicleProgressEntity(
+                route_id=route_id, progress=progress, speed=speed, ts=ts
+            )
+
+        else:
+            distance: float = max(0, progress - current.progress)
+
+            sample: float = distance / (ts - current.ts)
+
+            updated = VehicleProgressEntity(
+                route_id=route_id,
+                progress=current.progress + distance,
+                speed=self.__smoothing * sample
+                + (1 - self.__smoothing) * current.speed,
+                ts=ts,
+            )
+
+        self.__vehicles[vehicle_uuid] = updated
+
+        return updated
+
+    def find(self, vehicle_uuid: str) -> Optional[VehicleProgressEntity]:
+        return self.__vehicles.get(vehicle_uuid)
+
+    def remove(self, vehicle_uuid: str) -> None:
+        self.__vehicles.pop(vehicle_uuid, None)
+
+    def clear(self) -> None:
+        self.__vehicles.clear()
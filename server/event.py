@@ -1,6 +1,21 @@
-from typing import Any, Callable, List, Optional, Sequence, TypeAlias
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeAlias,
+    TypeVar,
+)
 from threading import Thread
+from functools import partial
 from kafka import KafkaConsumer, KafkaProducer
+import asyncio
+import inspect
 import logging
 
 from utils.config import BROKER_KAFKA_URL
@@ -8,6 +23,8 @@ from utils.config import BROKER_KAFKA_URL
 
 CallbackType: TypeAlias = Callable[[Any], None]
 
+ET = TypeVar("ET")
+
 
 class ServerConsumer(KafkaConsumer):
     def __init__(self, topic: str, default_callback: CallbackType, **kwargs: Any):
@@ -67,3 +84,67 @@ class ServerEvents:
         [thread.start() for thread in threads]
 
         [thread.join() for thread in threads]
+
+
+class ServerEventBus(Generic[ET]):
+    def __init__(self, name: str = "event") -> None:
+        self.__name: str = name
+
+        self.__handlers: Dict[Hashable, List[Callable[[ET], Any]]] = {}
+
+        self.__tasks: Set[asyncio.Future] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__tasks)
+
+    def __on_task_done(self, event_type: Hashable, task: asyncio.Future) -> None:
+        self.__tasks.discard(task)
+
+        if task.cancelled() or task.exception() is None:
+            return
+
+        logging.error(
+            f"Failed to handle {self.__name} {event_type}", exc_info=task.exception()
+        )
+
+    def add_handler(self, event_type: Hashable, handler: Callable[[ET], Any]) -> None:
+        self.__handlers.setdefault(event_type, []).append(handler)
+
+    def remove_handler(
+        self, event_type: Hashable, handler: Callable[[ET], Any]
+    ) -> None:
+        handlers: List[Callable[[ET], Any]] = self.__handlers.get(event_type, [])
+
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def subscribe(
+        self, *event_types: Hashable
+    ) -> Callable[[Callable[[ET], Any]], Callable[[ET], Any]]:
+        def wrapper(handler: Callable[[ET], Any]) -> Callable[[ET], Any]:
+            for event_type in event_types:
+                self.add_handler(event_type, handler)
+
+            return handler
+
+        return wrapper
+
+    def publish(self, event_type: Hashable, event: ET) -> int:
+        handlers: List[Callable[[ET], Any]] = self.__handlers.get(event_type, [])
+
+        for handler in list(handlers):
+            try:
+                result: Any = handler(event)
+
+                if inspect.isawaitable(result):
+                    task: asyncio.Future = asyncio.ensure_future(result)
+
+                    self.__tasks.add(task)
+
+                    task.add_done_callback(partial(self.__on_task_done, event_type))
+
+            except Exception:
+                logging.exception(f"Failed to handle {self.__name} {event_type}")
+
+        return len(handlers)
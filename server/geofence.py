@@ -0,0 +1,41 @@
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+class ServerGeofenceTracker:
+    def __init__(self) -> None:
+        self.__vehicles: Dict[str, Tuple[int, FrozenSet[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__vehicles)
+
+    def __contains__(self, vehicle_uuid: str) -> bool:
+        return vehicle_uuid in self.__vehicles
+
+    def update(
+        self, vehicle_uuid: str, route_id: int, stops: Iterable[int]
+    ) -> Tuple[List[int], List[int]]:
+        current_route_id, current_stops = self.__vehicles.get(
+            vehicle_uuid, (route_id, frozenset())
+        )
+
+        if current_route_id != route_id:
+            current_stops = frozenset()
+
+        inside: FrozenSet[int] = frozenset(stops)
+
+        if inside:
+            self.__vehicles[vehicle_uuid] = route_id, inside
+
+        else:
+            self.__vehicles.pop(vehicle_uuid, None)
+
+        return sorted(inside - current_stops), sorted(current_stops - inside)
+
+    def find(self, vehicle_uuid: str) -> FrozenSet[int]:
+        return self.__vehicles.get(vehicle_uuid, (0, frozenset()))[1]
+
+    def remove(self, vehicle_uuid: str) -> None:
+        self.__vehicles.pop(vehicle_uuid, None)
+
+    def clear(self) -> None:
+        self.__vehicles.clear()
@@ -1,5 +1,17 @@
 from server.api import ServerApi
+from server.backplane import create_backplane
+from server.codec import ServerPositionCodec
+from server.crypt import ServerCryptPool
 from server.database import ServerDatabases, ServerDatabase
+from server.position import ServerPositionStore
+from server.eta import ServerEtaTracker
+from server.geofence import ServerGeofenceTracker
+from server.event import ServerEventBus
+from server.pipeline import ServerPipeline
+from server.batch import ServerBatchWriter
+from server.ticker import ServerTicker
+from server.viewport import ServerViewportIndex
+from server.websocket import ServerWebSocketConnection
 from utils.types import DatabaseDialectType
 from utils.config import (
     API_HOST,
@@ -11,6 +23,7 @@ from utils.config import (
     DATABASE_USERNAME,
     DOCS_ENDPOINT_NAME,
     REDOC_ENDPOINT_NAME,
+    OPENAPI_ENDPOINT_NAME,
     SWAGGER_API_DESCRIPTION,
     SWAGGER_API_TITLE,
     SWAGGER_API_VERSION,
@@ -18,10 +31,36 @@ from utils.config import (
     SWAGGER_USER_API_TITLE,
     SWAGGER_AGENT_API_DESCRIPTION,
     SWAGGER_USER_API_DESCRIPTION,
+    WEBSOCKET_BACKPLANE,
+    VEHICLE_POSITIONS_TOPIC,
+    VEHICLE_POSITIONS_GROUP,
+    VEHICLE_POSITIONS_LINGER_MS,
+    VEHICLE_POSITIONS_BATCH_SIZE,
+    VEHICLE_POSITIONS_MAX_BATCH,
+    VEHICLE_HISTORY_BATCH_SIZE,
+    VEHICLE_HISTORY_MAX_BUFFER_SIZE,
+    VEHICLE_HISTORY_FLUSH_INTERVAL_SECONDS,
+    FLEET_TICK_INTERVAL_SECONDS,
+    VIEWPORT_GRID_CELL_DEGREES,
+    VIEWPORT_MAX_CELLS,
+    ETA_SPEED_SMOOTHING,
+    ETA_DEFAULT_SPEED_METERS_PER_SECOND,
+    ETA_RESET_DISTANCE_METERS,
+    CRYPT_MAX_WORKERS,
+    CRYPT_MAX_PENDING,
 )
+from utils.entities import VehiclePositionRecordEntity, StopEventEntity
 
 
 class ServerInstances:
+    vehicle_viewports: ServerViewportIndex[ServerWebSocketConnection] = (
+        ServerViewportIndex(
+            topic_prefix="vehicle:",
+            cell_size=VIEWPORT_GRID_CELL_DEGREES,
+            max_cells=VIEWPORT_MAX_CELLS,
+        )
+    )
+
     databases: ServerDatabases = ServerDatabases(
         ServerDatabase(
             host=DATABASE_HOST,
@@ -44,11 +83,16 @@ class ServerInstances:
         ),
     )
 
+    crypt_pool: ServerCryptPool = ServerCryptPool(
+        max_workers=CRYPT_MAX_WORKERS, max_pending=CRYPT_MAX_PENDING, name="bcrypt"
+    )
+
     user_api: ServerApi = ServerApi(
         host=API_HOST,
         port=API_PORT,
         docs_url=DOCS_ENDPOINT_NAME,
         redoc_url=REDOC_ENDPOINT_NAME,
+        openapi_url=OPENAPI_ENDPOINT_NAME,
         title=SWAGGER_USER_API_TITLE,
         description=SWAGGER_USER_API_DESCRIPTION,
         version=SWAGGER_API_VERSION,
@@ -59,6 +103,7 @@ class ServerInstances:
         port=API_PORT,
         docs_url=DOCS_ENDPOINT_NAME,
         redoc_url=REDOC_ENDPOINT_NAME,
+        openapi_url=OPENAPI_ENDPOINT_NAME,
         title=SWAGGER_AGENT_API_TITLE,
         description=SWAGGER_AGENT_API_DESCRIPTION,
         version=SWAGGER_API_VERSION,
@@ -69,7 +114,44 @@ class ServerInstances:
         port=API_PORT,
         docs_url=DOCS_ENDPOINT_NAME,
         redoc_url=REDOC_ENDPOINT_NAME,
+        openapi_url=OPENAPI_ENDPOINT_NAME,
         title=SWAGGER_API_TITLE,
         description=SWAGGER_API_DESCRIPTION,
         version=SWAGGER_API_VERSION,
+        websocket_backplane=create_backplane(WEBSOCKET_BACKPLANE),
+        websocket_codecs=[ServerPositionCodec()],
+        websocket_routers=[vehicle_viewports],
+    )
+
+    vehicle_positions: ServerPositionStore = ServerPositionStore()
+
+    vehicle_etas: ServerEtaTracker = ServerEtaTracker(
+        smoothing=ETA_SPEED_SMOOTHING,
+        default_speed=ETA_DEFAULT_SPEED_METERS_PER_SECOND,
+        reset_distance=ETA_RESET_DISTANCE_METERS,
+    )
+
+    vehicle_geofences: ServerGeofenceTracker = ServerGeofenceTracker()
+
+    stop_events: ServerEventBus[StopEventEntity] = ServerEventBus(name="stop event")
+
+    vehicle_positions_pipeline: ServerPipeline = ServerPipeline(
+        topic=VEHICLE_POSITIONS_TOPIC,
+        group_id=VEHICLE_POSITIONS_GROUP,
+        linger_ms=VEHICLE_POSITIONS_LINGER_MS,
+        batch_size=VEHICLE_POSITIONS_BATCH_SIZE,
+        max_batch=VEHICLE_POSITIONS_MAX_BATCH,
+    )
+
+    vehicle_positions_history: ServerBatchWriter[VehiclePositionRecordEntity] = (
+        ServerBatchWriter(
+            batch_size=VEHICLE_HISTORY_BATCH_SIZE,
+            max_buffer_size=VEHICLE_HISTORY_MAX_BUFFER_SIZE,
+            flush_interval=VEHICLE_HISTORY_FLUSH_INTERVAL_SECONDS,
+            name="vehicle position",
+        )
+    )
+
+    fleet_ticker: ServerTicker = ServerTicker(
+        interval=FLEET_TICK_INTERVAL_SECONDS, name="fleet"
     )
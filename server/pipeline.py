@@ -0,0 +1,188 @@
+from typing import Any, Awaitable, Callable, List, Optional, TypeAlias
+from concurrent.futures import Future, TimeoutError
+from threading import Event, Thread
+import asyncio
+import logging
+
+from server.event import ServerConsumer, ServerProducer
+
+
+HandlerType: TypeAlias = Callable[[List[bytes]], Awaitable[Any]]
+
+ProducerFactoryType: TypeAlias = Callable[..., ServerProducer]
+
+ConsumerFactoryType: TypeAlias = Callable[..., ServerConsumer]
+
+
+class ServerPipeline:
+    def __init__(
+        self,
+        topic: str,
+        group_id: str,
+        linger_ms: int = 5,
+        batch_size: int = 16384,
+        max_batch: int = 500,
+        poll_timeout: float = 0.5,
+        producer_factory: ProducerFactoryType = ServerProducer,
+        consumer_factory: ConsumerFactoryType = ServerConsumer,
+    ) -> None:
+        self.__topic: str = topic
+
+        self.__group_id: str = group_id
+
+        self.__linger_ms: int = linger_ms
+
+        self.__batch_size: int = batch_size
+
+        self.__max_batch: int = max(max_batch, 1)
+
+        self.__poll_timeout: float = poll_timeout
+
+        self.__producer_factory: ProducerFactoryType = producer_factory
+
+        self.__consumer_factory: ConsumerFactoryType = consumer_factory
+
+        self.__handler: Optional[HandlerType] = None
+
+        self.__producer: Optional[ServerProducer] = None
+
+        self.__consumer: Optional[ServerConsumer] = None
+
+        self.__queue: Optional[asyncio.Queue[bytes]] = None
+
+        self.__worker: Optional[asyncio.Task] = None
+
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.__consumer_thread: Optional[Thread] = None
+
+        self.__stopping: Event = Event()
+
+    @property
+    def started(self) -> bool:
+        return self.__producer is not None
+
+    def bind(self, handler: HandlerType) -> None:
+        self.__handler = handler
+
+    def __on_message(self, message: Any) -> None:
+        if self.__loop is None or self.__queue is None:
+            return
+
+        future: Future = asyncio.run_coroutine_threadsafe(
+            self.__queue.put(message.value), self.__loop
+        )
+
+        while not self.__stopping.is_set():
+            try:
+                future.result(timeout=self.__poll_timeout)
+
+                return
+
+            except TimeoutError:
+                continue
+
+        future.cancel()
+
+    def __consume(self, consumer: ServerConsumer) -> None:
+        try:
+            while not self.__stopping.is_set():
+                records: Any = consumer.poll(timeout_ms=int(self.__poll_timeout * 1000))
+
+                for messages in records.values():
+                    for message in messages:
+                        self.__on_message(message)
+
+        except Exception as error:
+            logging.error(f"Pipeline consumer for {self.__topic} failed")
+
+            logging.exception(error)
+
+        finally:
+            consumer.close()
+
+    async def __work(self, queue: asyncio.Queue[bytes]) -> None:
+        while True:
+            values: List[bytes] = [await queue.get()]
+
+            while len(values) < self.__max_batch and not queue.empty():
+                values.append(queue.get_nowait())
+
+            if self.__handler is None:
+                continue
+
+            try:
+                await self.__handler(values)
+
+            except Exception as error:
+                logging.error(f"Failed to handle {len(values)} pipeline messages")
+
+                logging.exception(error)
+
+    async def start(self) -> None:
+        self.__loop = asyncio.get_running_loop()
+
+        self.__queue = asyncio.Queue(self.__max_batch * 4)
+
+        self.__producer = await asyncio.to_thread(
+            self.__producer_factory,
+            linger_ms=self.__linger_ms,
+            batch_size=self.__batch_size,
+            acks=1,
+        )
+
+        try:
+            await asyncio.to_thread(self.__producer.partitions_for, self.__topic)
+
+        except Exception as error:
+            logging.warning(f"Failed to fetch metadata for {self.__topic}: {error}")
+
+        self.__consumer = await asyncio.to_thread(
+            self.__consumer_factory,
+            self.__topic,
+            self.__on_message,
+            group_id=self.__group_id,
+        )
+
+        self.__worker = self.__loop.create_task(self.__work(self.__queue))
+
+        self.__stopping.clear()
+
+        self.__consumer_thread = Thread(
+            target=self.__consume,
+            args=(self.__consumer,),
+            name=f"pipeline-{self.__topic}",
+            daemon=True,
+        )
+
+        self.__consumer_thread.start()
+
+        logging.info(f"Pipeline consuming {self.__topic}")
+
+    async def stop(self) -> None:
+        self.__stopping.set()
+
+        if self.__consumer_thread is not None:
+            await asyncio.to_thread(self.__consumer_thread.join)
+
+            self.__consumer_thread = None
+
+        self.__consumer = None
+
+        if self.__producer is not None:
+            await asyncio.to_thread(self.__producer.flush)
+
+            await asyncio.to_thread(self.__producer.close)
+
+            self.__producer = None
+
+        if self.__worker is not None:
+            self.__worker.cancel()
+
+            self.__worker = None
+
+    def publish(self, key: str, value: bytes) -> None:
+        if self.__producer is None:
+            raise RuntimeError(f"Pipeline {self.__topic} is not started")
+
+        self.__producer.send(self.__topic, key=key.encode(), value=value)
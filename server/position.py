@@ -0,0 +1,165 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from array import array
+
+from utils.entities import VehicleLastPositionEntity
+
+
+class ServerPositionStore:
+    def __init__(self) -> None:
+        self.__slots: Dict[str, int] = {}
+
+        self.__free_slots: List[int] = []
+
+        self.__uuids: List[Optional[str]] = []
+
+        self.__latitudes: array = array("d")
+
+        self.__longitudes: array = array("d")
+
+        self.__timestamps: array = array("d")
+
+        self.__company_ids: array = array("q")
+
+        self.__companies: Dict[int, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__slots)
+
+    def __contains__(self, vehicle_uuid: str) -> bool:
+        return vehicle_uuid in self.__slots
+
+    def __allocate(self, vehicle_uuid: str) -> int:
+        slot: int
+
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+
+            self.__uuids[slot] = vehicle_uuid
+
+        else:
+            slot = len(self.__uuids)
+
+            self.__uuids.append(vehicle_uuid)
+
+            self.__latitudes.append(0.0)
+
+            self.__longitudes.append(0.0)
+
+            self.__timestamps.append(0.0)
+
+            self.__company_ids.append(0)
+
+        self.__slots[vehicle_uuid] = slot
+
+        return slot
+
+    def __set_company(self, vehicle_uuid: str, slot: int, company_id: int) -> None:
+        current_company_id: int = self.__company_ids[slot]
+
+        if current_company_id == company_id:
+            return
+
+        vehicle_uuids: Set[str] = self.__companies.get(current_company_id, set())
+
+        vehicle_uuids.discard(vehicle_uuid)
+
+        if not vehicle_uuids:
+            self.__companies.pop(current_company_id, None)
+
+        self.__company_ids[slot] = company_id
+
+        if company_id:
+            self.__companies.setdefault(company_id, set()).add(vehicle_uuid)
+
+    def update(
+        self,
+        vehicle_uuid: str,
+        latitude: float,
+        longitude: float,
+        ts: float,
+        company_id: int = 0,
+    ) -> bool:
+        slot: Optional[int] = self.__slots.get(vehicle_uuid)
+
+        if slot is None:
+            slot = self.__allocate(vehicle_uuid)
+
+        elif ts <= self.__timestamps[slot]:
+            return False
+
+        self.__latitudes[slot] = latitude
+
+        self.__longitudes[slot] = longitude
+
+        self.__timestamps[slot] = ts
+
+        self.__set_company(vehicle_uuid, slot, company_id)
+
+        return True
+
+    def find_slot(self, vehicle_uuid: str) -> Optional[Tuple[float, float, float]]:
+        slot: Optional[int] = self.__slots.get(vehicle_uuid)
+
+        if slot is None:
+            return None
+
+        return (
+            self.__latitudes[slot],
+            self.__longitudes[slot],
+            self.__timestamps[slot],
+        )
+
+    def find(self, vehicle_uuid: str) -> Optional[VehicleLastPositionEntity]:
+        position: Optional[Tuple[float, float, float]] = self.find_slot(vehicle_uuid)
+
+        if position is None:
+            return None
+
+        latitude, longitude, ts = position
+
+        return VehicleLastPositionEntity(
+            vehicle_uuid=vehicle_uuid, latitude=latitude, longitude=longitude, ts=ts
+        )
+
+    def find_many(
+        self, vehicle_uuids: Iterable[str]
+    ) -> List[VehicleLastPositionEntity]:
+        positions: List[VehicleLastPositionEntity] = []
+
+        for vehicle_uuid in dict.fromkeys(vehicle_uuids):
+            position: Optional[VehicleLastPositionEntity] = self.find(vehicle_uuid)
+
+            if position is not None:
+                positions.append(position)
+
+        return positions
+
+    def find_by_company(self, company_id: int) -> List[VehicleLastPositionEntity]:
+        return self.find_many(sorted(self.__companies.get(company_id, ())))
+
+    def remove(self, vehicle_uuid: str) -> None:
+        slot: Optional[int] = self.__slots.pop(vehicle_uuid, None)
+
+        if slot is not None:
+            self.__set_company(vehicle_uuid, slot, 0)
+
+            self.__uuids[slot] = None
+
+            self.__free_slots.append(slot)
+
+    def clear(self) -> None:
+        self.__slots.clear()
+
+        self.__free_slots.clear()
+
+        self.__uuids.clear()
+
+        del self.__latitudes[:]
+
+        del self.__longitudes[:]
+
+        del self.__timestamps[:]
+
+        del self.__company_ids[:]
+
+        self.__companies.clear()
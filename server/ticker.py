@@ -0,0 +1,55 @@
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import logging
+
+
+class ServerTicker:
+    def __init__(
+        self,
+        interval: float,
+        callback: Optional[Callable[[], Awaitable[Any]]] = None,
+        name: str = "ticker",
+    ) -> None:
+        self.__interval: float = interval
+
+        self.__callback: Optional[Callable[[], Awaitable[Any]]] = callback
+
+        self.__name: str = name
+
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+    @property
+    def running(self) -> bool:
+        return self.__task is not None
+
+    def bind(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        self.__callback = callback
+
+    async def __run(self) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+
+            if self.__callback is None:
+                continue
+
+            try:
+                await self.__callback()
+
+            except Exception as error:
+                logging.error(f"Failed to run {self.__name} tick")
+
+                logging.exception(error)
+
+    async def start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+
+            self.__task = None
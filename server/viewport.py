@@ -0,0 +1,155 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TypeAlias
+import math
+
+from server.websocket import CT, ServerWebSocketRouter
+from utils.entities import ViewportBodyEntity
+
+
+CellType: TypeAlias = Tuple[int, int]
+
+
+class ServerViewportIndex(ServerWebSocketRouter[CT]):
+    def __init__(self, topic_prefix: str, cell_size: float, max_cells: int) -> None:
+        self.topic_prefix: str = topic_prefix
+
+        self.__cell_size: float = cell_size
+
+        self.__max_cells: int = max_cells
+
+        self.__subscribers: Dict[CellType, Set[CT]] = {}
+
+        self.__wide_subscribers: Set[CT] = set()
+
+        self.__viewports: Dict[CT, Tuple[ViewportBodyEntity, List[CellType]]] = {}
+
+        self.__vehicle_cells: Dict[str, CellType] = {}
+
+        self.__cell_vehicles: Dict[CellType, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__viewports)
+
+    def __contains__(self, connection: CT) -> bool:
+        return connection in self.__viewports
+
+    def __get_cell(self, latitude: float, longitude: float) -> CellType:
+        return (
+            math.floor(latitude / self.__cell_size),
+            math.floor(longitude / self.__cell_size),
+        )
+
+    def __get_cells(self, viewport: ViewportBodyEntity) -> Optional[List[CellType]]:
+        min_row, min_column = self.__get_cell(
+            viewport.min_latitude, viewport.min_longitude
+        )
+
+        max_row, max_column = self.__get_cell(
+            viewport.max_latitude, viewport.max_longitude
+        )
+
+        if (max_row - min_row + 1) * (max_column - min_column + 1) > self.__max_cells:
+            return None
+
+        return [
+            (row, column)
+            for row in range(min_row, max_row + 1)
+            for column in range(min_column, max_column + 1)
+        ]
+
+    def subscribe(self, connection: CT, viewport: ViewportBodyEntity) -> None:
+        self.remove(connection)
+
+        cells: Optional[List[CellType]] = self.__get_cells(viewport)
+
+        if cells is None:
+            self.__wide_subscribers.add(connection)
+
+        else:
+            for cell in cells:
+                self.__subscribers.setdefault(cell, set()).add(connection)
+
+        self.__viewports[connection] = viewport, cells or []
+
+    def remove(self, connection: CT) -> None:
+        _, cells = self.__viewports.pop(connection, (None, []))
+
+        self.__wide_subscribers.discard(connection)
+
+        for cell in cells:
+            subscribers: Set[CT] = self.__subscribers.get(cell, set())
+
+            subscribers.discard(connection)
+
+            if not subscribers:
+                self.__subscribers.pop(cell, None)
+
+    def update_vehicle(
+        self, vehicle_uuid: str, latitude: float, longitude: float
+    ) -> None:
+        cell: CellType = self.__get_cell(latitude, longitude)
+
+        current_cell: Optional[CellType] = self.__vehicle_cells.get(vehicle_uuid)
+
+        if current_cell == cell:
+            return
+
+        if current_cell is not None:
+            self.remove_vehicle(vehicle_uuid)
+
+        self.__vehicle_cells[vehicle_uuid] = cell
+
+        self.__cell_vehicles.setdefault(cell, set()).add(vehicle_uuid)
+
+    def remove_vehicle(self, vehicle_uuid: str) -> None:
+        cell: Optional[CellType] = self.__vehicle_cells.pop(vehicle_uuid, None)
+
+        if cell is None:
+            return
+
+        vehicle_uuids: Set[str] = self.__cell_vehicles.get(cell, set())
+
+        vehicle_uuids.discard(vehicle_uuid)
+
+        if not vehicle_uuids:
+            self.__cell_vehicles.pop(cell, None)
+
+    def find_vehicles(self, viewport: ViewportBodyEntity) -> List[str]:
+        cells: Optional[List[CellType]] = self.__get_cells(viewport)
+
+        if cells is None:
+            return list(self.__vehicle_cells)
+
+        return [
+            vehicle_uuid
+            for cell in cells
+            for vehicle_uuid in self.__cell_vehicles.get(cell, ())
+        ]
+
+    def route(self, topic: str, data: Any) -> Iterable[CT]:
+        try:
+            vehicle_uuid: str = data["vehicle_uuid"]
+
+            latitude: float = float(data["latitude"])
+
+            longitude: float = float(data["longitude"])
+
+        except (KeyError, TypeError, ValueError):
+            return ()
+
+        self.update_vehicle(vehicle_uuid, latitude, longitude)
+
+        if not self.__viewports:
+            return ()
+
+        candidates: Iterable[CT] = self.__subscribers.get(
+            self.__get_cell(latitude, longitude), ()
+        )
+
+        if self.__wide_subscribers:
+            candidates = (*candidates, *self.__wide_subscribers)
+
+        return [
+            connection
+            for connection in candidates
+            if self.__viewports[connection][0].contains(latitude, longitude)
+        ]
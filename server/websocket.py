@@ -0,0 +1,304 @@
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import count
+from fastapi import WebSocket
+import asyncio
+import logging
+import time
+import orjson
+
+from utils.types import WebSocketOverflowPolicy
+
+
+CT = TypeVar("CT", bound=Hashable)
+
+WebSocketFrame = Union[str, bytes]
+
+
+def encode_websocket_frame(data: Any) -> str:
+    return orjson.dumps(data).decode()
+
+
+class WebSocketEncodedFrame(NamedTuple):
+    frame: WebSocketFrame
+
+    announcement_key: Optional[Hashable] = None
+
+    announcement: Optional[bytes] = None
+
+
+class ServerWebSocketCodec(ABC):
+    subprotocol: str
+
+    @abstractmethod
+    def encode(self, data: Any) -> Optional[WebSocketEncodedFrame]: ...
+
+
+class ServerWebSocketRouter(ABC, Generic[CT]):
+    topic_prefix: str
+
+    @abstractmethod
+    def route(self, topic: str, data: Any) -> Iterable[CT]: ...
+
+    @abstractmethod
+    def remove(self, connection: CT) -> None: ...
+
+
+class ServerWebSocketConnection:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_close: Callable[[WebSocket], Awaitable[None]],
+        max_queue_size: int,
+        overflow_policy: WebSocketOverflowPolicy,
+        codec: Optional[ServerWebSocketCodec] = None,
+        company_id: Optional[int] = None,
+        is_device: bool = False,
+    ) -> None:
+        self.__websocket: WebSocket = websocket
+
+        self.__company_id: Optional[int] = company_id
+
+        self.__is_device: bool = is_device
+
+        self.__last_activity: float = time.monotonic()
+
+        self.__codec: Optional[ServerWebSocketCodec] = codec
+
+        self.__on_close: Callable[[WebSocket], Awaitable[None]] = on_close
+
+        self.__max_queue_size: int = max(max_queue_size, 1)
+
+        self.__overflow_policy: WebSocketOverflowPolicy = overflow_policy
+
+        self.__queue: OrderedDict[
+            Hashable, Tuple[WebSocketFrame, Optional[Hashable]]
+        ] = OrderedDict()
+
+        self.__announced: Set[Hashable] = set()
+
+        self.__sequence: count = count()
+
+        self.__ready: asyncio.Event = asyncio.Event()
+
+        self.__writer: Optional[asyncio.Task] = None
+
+        self.__closing: Optional[asyncio.Task] = None
+
+        self.__dropped: int = 0
+
+    @property
+    def websocket(self) -> WebSocket:
+        return self.__websocket
+
+    @property
+    def codec(self) -> Optional[ServerWebSocketCodec]:
+        return self.__codec
+
+    @property
+    def company_id(self) -> Optional[int]:
+        return self.__company_id
+
+    @property
+    def is_device(self) -> bool:
+        return self.__is_device
+
+    @property
+    def last_activity(self) -> float:
+        return self.__last_activity
+
+    @property
+    def overflow_policy(self) -> WebSocketOverflowPolicy:
+        return self.__overflow_policy
+
+    @property
+    def pending(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    @property
+    def closed(self) -> bool:
+        return self.__closing is not None
+
+    def touch(self) -> None:
+        self.__last_activity = time.monotonic()
+
+    def __close(self) -> None:
+        if self.__closing is None:
+            self.__closing = asyncio.get_running_loop().create_task(
+                self.__on_close(self.__websocket)
+            )
+
+    def send_json(self, data: Any, key: Optional[Hashable] = None) -> bool:
+        return self.send(encode_websocket_frame(data), key)
+
+    def send_data(self, data: Any, key: Optional[Hashable] = None) -> bool:
+        encoded: Optional[WebSocketEncodedFrame] = (
+            self.__codec.encode(data) if self.__codec is not None else None
+        )
+
+        if encoded is None:
+            return self.send_json(data, key)
+
+        return self.send_encoded(encoded, key)
+
+    def send_encoded(
+        self, encoded: WebSocketEncodedFrame, key: Optional[Hashable] = None
+    ) -> bool:
+        if (
+            encoded.announcement is None
+            or encoded.announcement_key in self.__announced
+            or isinstance(encoded.frame, str)
+        ):
+            return self.send(encoded.frame, key)
+
+        return self.send(
+            encoded.announcement + encoded.frame, key, encoded.announcement_key
+        )
+
+    def send(
+        self,
+        frame: WebSocketFrame,
+        key: Optional[Hashable] = None,
+        announcement_key: Optional[Hashable] = None,
+    ) -> bool:
+        if self.closed:
+            return False
+
+        item: Tuple[WebSocketFrame, Optional[Hashable]] = (frame, announcement_key)
+
+        coalesce: bool = (
+            key is not None
+            and self.__overflow_policy == WebSocketOverflowPolicy.COALESCE
+        )
+
+        if coalesce and key in self.__queue:
+            self.__queue[key] = item
+
+            return True
+
+        if len(self.__queue) >= self.__max_queue_size:
+            if self.__overflow_policy == WebSocketOverflowPolicy.DISCONNECT:
+                logging.warning(f"Disconnecting slow websocket {self.__websocket}")
+
+                self.__close()
+
+                return False
+
+            self.__queue.popitem(last=False)
+
+            self.__dropped += 1
+
+        self.__queue[key if coalesce else next(self.__sequence)] = item
+
+        self.__ready.set()
+
+        return True
+
+    async def __write(self) -> None:
+        while True:
+            await self.__ready.wait()
+
+            while self.__queue:
+                _, (frame, announcement_key) = self.__queue.popitem(last=False)
+
+                try:
+                    if isinstance(frame, bytes):
+                        await self.__websocket.send_bytes(frame)
+
+                    else:
+                        await self.__websocket.send_text(frame)
+
+                except Exception as error:
+                    logging.warning(f"Failed to send websocket message: {error}")
+
+                    self.__close()
+
+                    return
+
+                if announcement_key is not None:
+                    self.__announced.add(announcement_key)
+
+            self.__ready.clear()
+
+    def start(self) -> None:
+        if self.__writer is None:
+            self.__writer = asyncio.get_running_loop().create_task(self.__write())
+
+    def stop(self) -> None:
+        if self.__writer is not None and self.__writer is not asyncio.current_task():
+            self.__writer.cancel()
+
+        self.__queue.clear()
+
+
+class ServerWebSocketRegistry(Generic[CT]):
+    def __init__(self) -> None:
+        self.__subscribers: Dict[str, Set[CT]] = {}
+
+        self.__topics: Dict[CT, Set[str]] = {}
+
+    @property
+    def connections(self) -> Collection[CT]:
+        return self.__topics.keys()
+
+    @property
+    def topics(self) -> Collection[str]:
+        return self.__subscribers.keys()
+
+    def __len__(self) -> int:
+        return len(self.__topics)
+
+    def __contains__(self, connection: CT) -> bool:
+        return connection in self.__topics
+
+    def add(self, connection: CT) -> None:
+        self.__topics.setdefault(connection, set())
+
+    def subscribe(self, connection: CT, topic: str) -> None:
+        self.__topics.setdefault(connection, set()).add(topic)
+
+        self.__subscribers.setdefault(topic, set()).add(connection)
+
+    def unsubscribe(self, connection: CT, topic: str) -> None:
+        topics: Set[str] = self.__topics.get(connection, set())
+
+        topics.discard(topic)
+
+        subscribers: Set[CT] = self.__subscribers.get(topic, set())
+
+        subscribers.discard(connection)
+
+        if not subscribers:
+            self.__subscribers.pop(topic, None)
+
+    def remove(self, connection: CT) -> None:
+        for topic in tuple(self.__topics.get(connection, ())):
+            self.unsubscribe(connection, topic)
+
+        self.__topics.pop(connection, None)
+
+    def find(self, topic: str) -> Tuple[CT, ...]:
+        return tuple(self.__subscribers.get(topic, ()))
+
+    def find_topics(self, connection: CT) -> Tuple[str, ...]:
+        return tuple(self.__topics.get(connection, ()))
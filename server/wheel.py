@@ -0,0 +1,125 @@
+from typing import Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+import asyncio
+import logging
+import math
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ServerTimerWheel(Generic[K]):
+    def __init__(
+        self,
+        tick: float,
+        slots: int,
+        callback: Optional[Callable[[K], None]] = None,
+        name: str = "timer wheel",
+    ) -> None:
+        self.__tick: float = tick
+
+        self.__callback: Optional[Callable[[K], None]] = callback
+
+        self.__name: str = name
+
+        self.__slots: List[Dict[K, int]] = [{} for _ in range(max(slots, 1))]
+
+        self.__entries: Dict[K, int] = {}
+
+        self.__position: int = 0
+
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def tick(self) -> float:
+        return self.__tick
+
+    @property
+    def running(self) -> bool:
+        return self.__task is not None
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.__entries
+
+    def bind(self, callback: Callable[[K], None]) -> None:
+        self.__callback = callback
+
+    def schedule(self, key: K, delay: float) -> None:
+        self.cancel(key)
+
+        ticks: int = max(1, math.ceil(delay / self.__tick))
+
+        slot: int = (self.__position + ticks) % len(self.__slots)
+
+        self.__slots[slot][key] = (ticks - 1) // len(self.__slots)
+
+        self.__entries[key] = slot
+
+    def cancel(self, key: K) -> None:
+        slot: Optional[int] = self.__entries.pop(key, None)
+
+        if slot is not None:
+            self.__slots[slot].pop(key, None)
+
+    def advance(self) -> int:
+        self.__position = (self.__position + 1) % len(self.__slots)
+
+        bucket: Dict[K, int] = self.__slots[self.__position]
+
+        expired: List[K] = []
+
+        for key, rounds in bucket.items():
+            if rounds:
+                bucket[key] = rounds - 1
+
+            else:
+                expired.append(key)
+
+        for key in expired:
+            del bucket[key]
+
+            del self.__entries[key]
+
+            if self.__callback is None:
+                continue
+
+            try:
+                self.__callback(key)
+
+            except Exception as error:
+                logging.error(f"Failed to run {self.__name} timer")
+
+                logging.exception(error)
+
+        return len(expired)
+
+    async def __run(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        next_at: float = loop.time() + self.__tick
+
+        while True:
+            await asyncio.sleep(max(0, next_at - loop.time()))
+
+            while next_at <= loop.time():
+                self.advance()
+
+                next_at += self.__tick
+
+    async def start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+
+            self.__task = None
+
+    def clear(self) -> None:
+        for bucket in self.__slots:
+            bucket.clear()
+
+        self.__entries.clear()
@@ -1,5 +1,6 @@
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 from copy import copy
+from sqlalchemy import event
 
 from models import Company, database, Agent
 from repositories.agent import (
@@ -20,6 +21,13 @@ from utils.patterns import (
     IUpdateRepository,
 )
 from utils.exceptions import ModelNotFound
+from utils.cache import TTLCache
+from utils.config import PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL_SECONDS
+
+
+agent_cache: TTLCache[str, Agent] = TTLCache(
+    max_size=PRINCIPAL_CACHE_MAX_SIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS
+)
 
 
 class AgentCreationProps(AbstractBaseEntity):
@@ -29,7 +37,7 @@ class AgentCreationProps(AbstractBaseEntity):
 
     password: str
 
-    company: Company
+    company_id: int
 
 
 class AgentUpdateProps(AbstractBaseEntity):
@@ -54,21 +62,35 @@ class AgentCaptureProps(AbstractBaseEntity):
 
 
 class AgentListingProps(AbstractBaseEntity):
-    company: Company
+    company_id: int
+
+    limit: int
+
+    page: int
 
 
 class AgentService:
     def __init__(self) -> None:
         self.__company_service: CompanyService = CompanyService()
 
-    async def __get_company(
-        self, company_uuid: Optional[str], company_instance: Optional[Company]
-    ):
-        if company_instance is None:
-            return await self.__company_service.find_company(company_uuid or "")
+    async def __get_company_id(
+        self,
+        company_uuid: Optional[str],
+        company_instance: Optional[Company],
+        company_id: Optional[int],
+    ) -> int:
+        if company_id is not None:
+            return company_id
+
+        elif company_instance is None:
+            company: Company = await self.__company_service.find_company(
+                company_uuid or ""
+            )
+
+            return company.id
 
         else:
-            return company_instance
+            return company_instance.id
 
     async def create_agent(
         self,
@@ -77,16 +99,19 @@ class AgentService:
         password: str,
         company_uuid: Optional[str] = None,
         company_instance: Optional[Company] = None,
+        company_id: Optional[int] = None,
     ) -> Optional[Agent]:
         async with database.create_async_session() as session:
             agent_repository: ICreateRepository[
                 IAgentCreateRepository, Optional[Agent]
             ] = AgentRepository(session)
 
-            company: Company = await self.__get_company(company_uuid, company_instance)
+            agent_company_id: int = await self.__get_company_id(
+                company_uuid, company_instance, company_id
+            )
 
             agent_props: IAgentCreateRepository = AgentCreationProps(
-                company=company,
+                company_id=agent_company_id,
                 name=name,
                 email=email,
                 password=password,
@@ -125,6 +150,8 @@ class AgentService:
 
             await session.commit()
 
+            self.invalidate_agent(agent_uuid)
+
             if agent is not None:
                 await session.refresh(agent)
 
@@ -144,6 +171,8 @@ class AgentService:
 
             agent: Optional[Agent] = await agent_repository.delete(agent_props)
 
+            self.invalidate_agent(agent_uuid)
+
             if agent is not None:
                 return copy(agent)
 
@@ -162,18 +191,48 @@ class AgentService:
 
             return agent
 
+    async def find_cached_agent(
+        self, agent_uuid: str, ttl: Optional[float] = None
+    ) -> Agent:
+        agent: Optional[Agent] = agent_cache.get(agent_uuid)
+
+        if agent is None:
+            agent = await self.find_agent(agent_uuid)
+
+            agent_cache.set(agent_uuid, agent, ttl)
+
+        return agent
+
+    def invalidate_agent(self, agent_uuid: str) -> None:
+        agent_cache.invalidate(agent_uuid)
+
     async def find_agents(
         self,
         company_uuid: Optional[str] = None,
         company_instance: Optional[Company] = None,
+        company_id: Optional[int] = None,
+        limit: int = 50,
+        page: int = 0,
     ) -> Sequence[Agent]:
         async with database.create_async_session() as session:
             agent_repository: IFindManyRepository[IAgentFindManyRepository, Agent] = (
                 AgentRepository(session)
             )
 
-            company: Company = await self.__get_company(company_uuid, company_instance)
+            agent_company_id: int = await self.__get_company_id(
+                company_uuid, company_instance, company_id
+            )
 
-            agent_props: IAgentFindManyRepository = AgentListingProps(company=company)
+            agent_props: IAgentFindManyRepository = AgentListingProps(
+                company_id=agent_company_id,
+                limit=limit,
+                page=page,
+            )
 
             return await agent_repository.find_many(agent_props)
+
+
+@event.listens_for(Agent, "after_update")
+@event.listens_for(Agent, "after_delete")
+def on_agent_changed(mapper: Any, connection: Any, agent: Agent) -> None:
+    agent_cache.invalidate(agent.uuid)
@@ -1,6 +1,8 @@
-from typing import Literal, TypeAlias
+from typing import AsyncIterator, Literal, Optional, TypeAlias
+from contextlib import asynccontextmanager
+from datetime import datetime, UTC
 
-from models import database, Agent, User
+from models import database, Agent, Company, User
 from repositories.agent import AgentRepository, IAgentAuthRepository
 from repositories.user import UserRepository, IUserAuthRepository
 from services.agent import AgentService
@@ -8,8 +10,20 @@ from services.user import UserService
 from utils.entities import TokenDataEntity, AgentTokenDataEntity
 from utils.patterns import AbstractBaseEntity, IAuthRepository
 from utils.crypt import CryptUtils
-from utils.config import TOKEN_EXPIRATION_MINUTE, REFRESH_TOKEN_EXPIRATION_MINUTE
-from utils.exceptions import InvalidToken
+from utils.config import (
+    TOKEN_EXPIRATION_MINUTE,
+    REFRESH_TOKEN_EXPIRATION_MINUTE,
+    AUTH_PRINCIPAL_MODE,
+    LOGIN_EMAIL_BUCKET_CAPACITY,
+    LOGIN_EMAIL_REFILL_PER_SECOND,
+    LOGIN_ADDRESS_BUCKET_CAPACITY,
+    LOGIN_ADDRESS_REFILL_PER_SECOND,
+    LOGIN_BUCKET_MAX_SIZE,
+    LOGIN_MAX_CONCURRENCY,
+)
+from utils.exceptions import InvalidToken, TooManyLoginAttempts
+from utils.throttle import KeyedTokenBucket, ConcurrencyGate
+from utils.types import AuthPrincipalType
 from utils.types import DictType
 
 
@@ -28,6 +42,71 @@ class UserAuthProps(AbstractBaseEntity):
 AuthResult: TypeAlias = DictType[Literal["token", "refresh_token"], str]
 
 
+login_email_buckets: KeyedTokenBucket[str] = KeyedTokenBucket(
+    capacity=LOGIN_EMAIL_BUCKET_CAPACITY,
+    rate=LOGIN_EMAIL_REFILL_PER_SECOND,
+    max_size=LOGIN_BUCKET_MAX_SIZE,
+)
+
+login_address_buckets: KeyedTokenBucket[str] = KeyedTokenBucket(
+    capacity=LOGIN_ADDRESS_BUCKET_CAPACITY,
+    rate=LOGIN_ADDRESS_REFILL_PER_SECOND,
+    max_size=LOGIN_BUCKET_MAX_SIZE,
+)
+
+login_gate: ConcurrencyGate = ConcurrencyGate(LOGIN_MAX_CONCURRENCY)
+
+
+class AgentPrincipal:
+    def __init__(
+        self, token_data: AgentTokenDataEntity, agent_service: AgentService
+    ) -> None:
+        self.__token_data: AgentTokenDataEntity = token_data
+
+        self.__agent_service: AgentService = agent_service
+
+        self.__agent: Optional[Agent] = None
+
+    @property
+    def uuid(self) -> str:
+        return self.__token_data.user_uuid
+
+    @property
+    def company_uuid(self) -> str:
+        return self.__token_data.company_uuid
+
+    async def get_agent(self) -> Agent:
+        if self.__agent is None:
+            ttl: float = (self.__token_data.exp - datetime.now(UTC)).total_seconds()
+
+            self.__agent = await self.__agent_service.find_cached_agent(
+                self.uuid, ttl=ttl
+            )
+
+        return self.__agent
+
+    async def get_company(self) -> Company:
+        agent: Agent = await self.get_agent()
+
+        return agent.company
+
+    async def get_id(self) -> int:
+        if self.__token_data.agent_id is not None:
+            return self.__token_data.agent_id
+
+        agent: Agent = await self.get_agent()
+
+        return agent.id
+
+    async def get_company_id(self) -> int:
+        if self.__token_data.company_id is not None:
+            return self.__token_data.company_id
+
+        agent: Agent = await self.get_agent()
+
+        return agent.company_id
+
+
 class AuthService:
     def __init__(self) -> None:
         self.__agent_service: AgentService = AgentService()
@@ -38,6 +117,8 @@ class AuthService:
         return CryptUtils.Jwt.create_token(
             user_uuid=agent.uuid,
             company_uuid=agent.company.uuid,
+            agent_id=agent.id,
+            company_id=agent.company_id,
             expiration_minute=TOKEN_EXPIRATION_MINUTE,
             is_refresh=False,
             entity_class=AgentTokenDataEntity,
@@ -47,6 +128,8 @@ class AuthService:
         return CryptUtils.Jwt.create_token(
             user_uuid=agent.uuid,
             company_uuid=agent.company.uuid,
+            agent_id=agent.id,
+            company_id=agent.company_id,
             expiration_minute=REFRESH_TOKEN_EXPIRATION_MINUTE,
             is_refresh=True,
             entity_class=AgentTokenDataEntity,
@@ -66,8 +149,34 @@ class AuthService:
             is_refresh=True,
         )
 
-    async def auth_agent(self, email: str, password: str) -> AuthResult:
-        async with database.create_async_session() as session:
+    @asynccontextmanager
+    async def __admit_login(
+        self, email_key: str, client_host: Optional[str]
+    ) -> AsyncIterator[None]:
+        if client_host is not None and not login_address_buckets.acquire(client_host):
+            raise TooManyLoginAttempts(login_address_buckets.retry_after(client_host))
+
+        if not login_email_buckets.acquire(email_key):
+            raise TooManyLoginAttempts(login_email_buckets.retry_after(email_key))
+
+        if not login_gate.try_acquire():
+            raise TooManyLoginAttempts(1)
+
+        try:
+            yield
+
+        finally:
+            login_gate.release()
+
+    async def auth_agent(
+        self, email: str, password: str, client_host: Optional[str] = None
+    ) -> AuthResult:
+        email_key: str = f"agent:{email.strip().lower()}"
+
+        async with (
+            self.__admit_login(email_key, client_host),
+            database.create_async_session() as session,
+        ):
             agent_repository: IAuthRepository[IAgentAuthRepository, Agent] = (
                 AgentRepository(session)
             )
@@ -84,14 +193,31 @@ class AuthService:
 
             return {"token": token, "refresh_token": refresh_token}
 
+    def __get_token_lifetime(self, token_data: TokenDataEntity) -> float:
+        return (token_data.exp - datetime.now(UTC)).total_seconds()
+
     async def get_agent_data_in_token(self, token: str) -> Agent:
+        principal: AgentPrincipal = await self.get_agent_principal(token)
+
+        return await principal.get_agent()
+
+    async def get_agent_principal(
+        self,
+        token: str,
+        mode: AuthPrincipalType = AuthPrincipalType(AUTH_PRINCIPAL_MODE),
+    ) -> AgentPrincipal:
         token_handled: str = token.replace("Bearer", "").strip()
 
-        token_data: TokenDataEntity = CryptUtils.Jwt.decode_token(
+        token_data: AgentTokenDataEntity = CryptUtils.Jwt.decode_token(
             token_handled, entity_class=AgentTokenDataEntity
         )
 
-        return await self.__agent_service.find_agent(token_data.user_uuid)
+        principal: AgentPrincipal = AgentPrincipal(token_data, self.__agent_service)
+
+        if mode == AuthPrincipalType.MODEL:
+            await principal.get_agent()
+
+        return principal
 
     async def refresh_agent_token(self, token: str) -> str:
         token_data: AgentTokenDataEntity = CryptUtils.Jwt.decode_token(
@@ -105,8 +231,15 @@ class AuthService:
 
         return self.__create_agent_token(agent)
 
-    async def auth_user(self, email: str, password: str) -> AuthResult:
-        async with database.create_async_session() as session:
+    async def auth_user(
+        self, email: str, password: str, client_host: Optional[str] = None
+    ) -> AuthResult:
+        email_key: str = f"user:{email.strip().lower()}"
+
+        async with (
+            self.__admit_login(email_key, client_host),
+            database.create_async_session() as session,
+        ):
             user_repository: IAuthRepository[IUserAuthRepository, User] = (
                 UserRepository(session)
             )
@@ -138,4 +271,6 @@ class AuthService:
 
         token_data: TokenDataEntity = CryptUtils.Jwt.decode_token(token_handled)
 
-        return await self.__user_service.find_user(token_data.user_uuid)
+        return await self.__user_service.find_cached_user(
+            token_data.user_uuid, ttl=self.__get_token_lifetime(token_data)
+        )
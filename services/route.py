@@ -14,6 +14,7 @@ from repositories.route import (
 )
 from services.company import CompanyService
 from services.point import PointService
+from services.route_matching import RouteMatchingService
 from utils.patterns import (
     AbstractBaseEntity,
     ICreateRepository,
@@ -79,6 +80,8 @@ class RouteService:
 
         self.__point_service: PointService = PointService()
 
+        self.__route_matching_service: RouteMatchingService = RouteMatchingService()
+
     async def __get_company(
         self, company_uuid: Optional[str], company_instance: Optional[Company]
     ):
@@ -200,6 +203,8 @@ class RouteService:
 
             await session.commit()
 
+            self.__route_matching_service.invalidate_route(route.id)
+
             await session.refresh(route)
 
             return route
@@ -221,4 +226,6 @@ class RouteService:
             await session.commit()
 
             if route is not None:
+                self.__route_matching_service.invalidate_route(route.id)
+
                 return copy(route)
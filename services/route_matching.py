@@ -0,0 +1,100 @@
+from typing import Any, Dict, List, Sequence, Tuple
+from pydantic import BaseModel
+from sqlalchemy import Row, event
+
+from models import Route, RoutePoint, database
+from repositories.route_point import (
+    RoutePointRepository,
+    IRoutePointFindManyRepository,
+)
+from utils.patterns import IFindManyRepository
+from utils.geo import RouteGeometry
+from utils.cache import TTLCache
+from utils.config import (
+    ROUTE_MATCH_CELL_METERS,
+    ROUTE_GEOMETRY_CACHE_MAX_SIZE,
+    ROUTE_GEOMETRY_CACHE_TTL_SECONDS,
+)
+
+
+route_geometry_cache: TTLCache[int, RouteGeometry] = TTLCache(
+    max_size=ROUTE_GEOMETRY_CACHE_MAX_SIZE, ttl=ROUTE_GEOMETRY_CACHE_TTL_SECONDS
+)
+
+
+class RoutePointListingProps(BaseModel):
+    route_ids: Sequence[int]
+
+
+class RouteMatchingService:
+    async def find_route_geometries(
+        self, route_ids: Sequence[int]
+    ) -> Dict[int, RouteGeometry]:
+        geometries: Dict[int, RouteGeometry] = {}
+
+        missing_ids: List[int] = []
+
+        for route_id in route_ids:
+            cached, geometry = route_geometry_cache.lookup(route_id)
+
+            if not cached:
+                missing_ids.append(route_id)
+
+            elif geometry is not None:
+                geometries[route_id] = geometry
+
+        if not missing_ids:
+            return geometries
+
+        async with database.create_async_session() as session:
+            route_point_repository: IFindManyRepository[
+                IRoutePointFindManyRepository, Row
+            ] = RoutePointRepository(session)
+
+            route_point_props: IRoutePointFindManyRepository = RoutePointListingProps(
+                route_ids=missing_ids
+            )
+
+            rows: Sequence[Row] = await route_point_repository.find_many(
+                route_point_props
+            )
+
+        points: Dict[int, List[Tuple[float, float]]] = {
+            route_id: [] for route_id in missing_ids
+        }
+
+        stops: Dict[int, List[str]] = {route_id: [] for route_id in missing_ids}
+
+        for route_id, point_uuid, latitude, longitude in rows:
+            points[route_id].append((float(latitude), float(longitude)))
+
+            stops[route_id].append(point_uuid)
+
+        for route_id, route_points in points.items():
+            geometry = RouteGeometry(
+                route_points, ROUTE_MATCH_CELL_METERS, stops=stops[route_id]
+            )
+
+            route_geometry_cache.set(route_id, geometry)
+
+            geometries[route_id] = geometry
+
+        return geometries
+
+    def invalidate_route(self, route_id: int) -> None:
+        route_geometry_cache.invalidate(route_id)
+
+
+@event.listens_for(Route, "after_update")
+@event.listens_for(Route, "after_delete")
+def on_route_changed(mapper: Any, connection: Any, route: Route) -> None:
+    route_geometry_cache.invalidate(route.id)
+
+
+@event.listens_for(RoutePoint, "after_insert")
+@event.listens_for(RoutePoint, "after_update")
+@event.listens_for(RoutePoint, "after_delete")
+def on_route_point_changed(
+    mapper: Any, connection: Any, route_point: RoutePoint
+) -> None:
+    route_geometry_cache.invalidate(route_point.route_id)
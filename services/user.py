@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Any, Optional
 from copy import copy
+from sqlalchemy import event
 
 from models import database, User
 from repositories.user import (
@@ -17,6 +18,13 @@ from utils.patterns import (
     AbstractBaseEntity,
 )
 from utils.exceptions import ModelNotFound
+from utils.cache import TTLCache
+from utils.config import PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL_SECONDS
+
+
+user_cache: TTLCache[str, User] = TTLCache(
+    max_size=PRINCIPAL_CACHE_MAX_SIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS
+)
 
 
 class UserCreationProps(AbstractBaseEntity):
@@ -77,6 +85,8 @@ class UserService:
 
             await session.commit()
 
+            self.invalidate_user(user_uuid)
+
             if user is None:
                 raise ModelNotFound(User, user_uuid)
 
@@ -96,6 +106,8 @@ class UserService:
 
             user: Optional[User] = await user_repository.delete(user_exclusion_props)
 
+            self.invalidate_user(user_uuid)
+
             if user is None:
                 raise ModelNotFound(User, user_uuid)
 
@@ -115,3 +127,24 @@ class UserService:
                 raise ModelNotFound(User, user_uuid)
 
             return user
+
+    async def find_cached_user(
+        self, user_uuid: str, ttl: Optional[float] = None
+    ) -> User:
+        user: Optional[User] = user_cache.get(user_uuid)
+
+        if user is None:
+            user = await self.find_user(user_uuid)
+
+            user_cache.set(user_uuid, user, ttl)
+
+        return user
+
+    def invalidate_user(self, user_uuid: str) -> None:
+        user_cache.invalidate(user_uuid)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def on_user_changed(mapper: Any, connection: Any, user: User) -> None:
+    user_cache.invalidate(user.uuid)
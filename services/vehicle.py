@@ -1,17 +1,160 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 from pydantic import BaseModel
+from sqlalchemy import event
 
-from models import Vehicle, database
-from repositories.vehicle import VehicleRepository, IVehicleFindRepository
-from utils.patterns import IFindRepository
+from models import Route, Vehicle, database
+from repositories.vehicle import (
+    VehicleRepository,
+    IVehicleCreateRepository,
+    IVehicleUpdateRepository,
+    IVehicleFindRepository,
+    IVehicleFindManyRepository,
+)
+from services.route import RouteService
+from utils.patterns import (
+    AbstractBaseEntity,
+    ICreateRepository,
+    IUpdateRepository,
+    IFindRepository,
+    IFindManyRepository,
+)
 from utils.exceptions import ModelNotFound
+from utils.entities import VehicleIdentityEntity
+from utils.types import VehicleType
+from utils.cache import TTLCache
+from utils.config import (
+    VEHICLE_CACHE_MAX_SIZE,
+    VEHICLE_CACHE_TTL_SECONDS,
+    VEHICLE_CACHE_NEGATIVE_TTL_SECONDS,
+)
+
+
+vehicle_cache: TTLCache[str, VehicleIdentityEntity] = TTLCache(
+    max_size=VEHICLE_CACHE_MAX_SIZE,
+    ttl=VEHICLE_CACHE_TTL_SECONDS,
+    negative_ttl=VEHICLE_CACHE_NEGATIVE_TTL_SECONDS,
+)
+
+
+class VehicleCreationProps(AbstractBaseEntity):
+    company_id: int
+
+    type: VehicleType
+
+    plate: str
+
+    route_id: Optional[int]
+
+
+class VehicleUpdateProps(AbstractBaseEntity):
+    uuid: str
+
+    company_id: int
+
+    type: VehicleType
+
+    plate: str
+
+    route_id: Optional[int]
+
+    instance: Optional[Vehicle]
 
 
 class VehicleFindProps(BaseModel):
     uuid: str
 
 
+class VehicleListingProps(BaseModel):
+    uuids: Sequence[str]
+
+
 class VehicleService:
+    def __init__(self) -> None:
+        self.__route_service: RouteService = RouteService()
+
+    async def __get_route_id(
+        self, company_id: int, route_uuid: Optional[str]
+    ) -> Optional[int]:
+        if route_uuid is None:
+            return None
+
+        route: Optional[Route] = await self.__route_service.find_route(route_uuid)
+
+        if route is None or route.company_id != company_id:
+            raise ModelNotFound(Route, route_uuid)
+
+        return route.id
+
+    def __get_vehicle_identity(self, vehicle: Vehicle) -> VehicleIdentityEntity:
+        return VehicleIdentityEntity(
+            uuid=vehicle.uuid,
+            id=vehicle.id,
+            company_id=vehicle.company_id,
+            route_id=vehicle.route_id,
+        )
+
+    async def create_vehicle(
+        self,
+        company_id: int,
+        type: VehicleType,
+        plate: str,
+        route_uuid: Optional[str] = None,
+    ) -> Optional[Vehicle]:
+        async with database.create_async_session() as session:
+            vehicle_repository: ICreateRepository[
+                IVehicleCreateRepository, Optional[Vehicle]
+            ] = VehicleRepository(session)
+
+            vehicle_props: IVehicleCreateRepository = VehicleCreationProps(
+                company_id=company_id,
+                type=type,
+                plate=plate,
+                route_id=await self.__get_route_id(company_id, route_uuid),
+            )
+
+            vehicle: Optional[Vehicle] = await vehicle_repository.create(vehicle_props)
+
+            await session.commit()
+
+            await session.refresh(vehicle)
+
+            return vehicle
+
+    async def update_vehicle(
+        self,
+        vehicle_uuid: str,
+        company_id: int,
+        type: VehicleType,
+        plate: str,
+        route_uuid: Optional[str] = None,
+    ) -> Optional[Vehicle]:
+        async with database.create_async_session() as session:
+            vehicle_repository: IUpdateRepository[
+                IVehicleUpdateRepository, Optional[Vehicle]
+            ] = VehicleRepository(session)
+
+            vehicle_props: IVehicleUpdateRepository = VehicleUpdateProps(
+                uuid=vehicle_uuid,
+                company_id=company_id,
+                type=type,
+                plate=plate,
+                route_id=await self.__get_route_id(company_id, route_uuid),
+                instance=None,
+            )
+
+            vehicle: Optional[Vehicle] = await vehicle_repository.update(vehicle_props)
+
+            await session.commit()
+
+            self.invalidate_vehicle(vehicle_uuid)
+
+            if vehicle is None:
+                raise ModelNotFound(Vehicle, vehicle_uuid)
+
+            await session.refresh(vehicle)
+
+            return vehicle
+
     async def find_vehicle(self, vehicle_uuid: str) -> Vehicle:
         async with database.create_async_session() as session:
             vehicle_repository: IFindRepository[IVehicleFindRepository, Vehicle] = (
@@ -26,3 +169,59 @@ class VehicleService:
                 raise ModelNotFound(Vehicle, vehicle_uuid)
 
             return vehicle
+
+    async def find_vehicles(self, vehicle_uuids: Sequence[str]) -> Sequence[Vehicle]:
+        async with database.create_async_session() as session:
+            vehicle_repository: IFindManyRepository[
+                IVehicleFindManyRepository, Vehicle
+            ] = VehicleRepository(session)
+
+            vehicle_props: IVehicleFindManyRepository = VehicleListingProps(
+                uuids=vehicle_uuids
+            )
+
+            return await vehicle_repository.find_many(vehicle_props)
+
+    async def find_vehicle_identities(
+        self, vehicle_uuids: Sequence[str]
+    ) -> Dict[str, VehicleIdentityEntity]:
+        identities: Dict[str, VehicleIdentityEntity] = {}
+
+        missing_uuids: List[str] = []
+
+        for vehicle_uuid in vehicle_uuids:
+            cached, identity = vehicle_cache.lookup(vehicle_uuid)
+
+            if not cached:
+                missing_uuids.append(vehicle_uuid)
+
+            elif identity is not None:
+                identities[vehicle_uuid] = identity
+
+        if not missing_uuids:
+            return identities
+
+        vehicles: Sequence[Vehicle] = await self.find_vehicles(missing_uuids)
+
+        for vehicle in vehicles:
+            identity = self.__get_vehicle_identity(vehicle)
+
+            vehicle_cache.set(vehicle.uuid, identity)
+
+            identities[vehicle.uuid] = identity
+
+        for vehicle_uuid in missing_uuids:
+            if vehicle_uuid not in identities:
+                vehicle_cache.set_missing(vehicle_uuid)
+
+        return identities
+
+    def invalidate_vehicle(self, vehicle_uuid: str) -> None:
+        vehicle_cache.invalidate(vehicle_uuid)
+
+
+@event.listens_for(Vehicle, "after_insert")
+@event.listens_for(Vehicle, "after_update")
+@event.listens_for(Vehicle, "after_delete")
+def on_vehicle_changed(mapper: Any, connection: Any, vehicle: Vehicle) -> None:
+    vehicle_cache.invalidate(vehicle.uuid)
@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+from bisect import bisect_right
+import time
+
+from server.instances import ServerInstances
+from services.route_matching import RouteMatchingService
+from utils.entities import (
+    VehicleEtaEntity,
+    VehicleProgressEntity,
+    VehicleStopEtaEntity,
+)
+from utils.geo import RouteGeometry
+from utils.cache import TTLCache
+from utils.config import (
+    ETA_CACHE_MAX_SIZE,
+    ETA_CACHE_TTL_SECONDS,
+    ETA_MIN_SPEED_METERS_PER_SECOND,
+    ETA_MAX_AGE_SECONDS,
+)
+
+
+vehicle_eta_cache: TTLCache[str, VehicleEtaEntity] = TTLCache(
+    max_size=ETA_CACHE_MAX_SIZE, ttl=ETA_CACHE_TTL_SECONDS
+)
+
+
+class VehicleEtaService:
+    def __init__(self) -> None:
+        self.__route_matching_service: RouteMatchingService = RouteMatchingService()
+
+    def __get_stop_etas(
+        self, progress: VehicleProgressEntity, geometry: RouteGeometry
+    ) -> List[VehicleStopEtaEntity]:
+        speed: float = max(progress.speed, ETA_MIN_SPEED_METERS_PER_SECOND)
+
+        stops: List[VehicleStopEtaEntity] = []
+
+        for index in range(
+            bisect_right(geometry.offsets, progress.progress), len(geometry.stops)
+        ):
+            distance: float = geometry.offsets[index] - progress.progress
+
+            stops.append(
+                VehicleStopEtaEntity(
+                    point_uuid=geometry.stops[index],
+                    distance=distance,
+                    eta=progress.ts + distance / speed,
+                )
+            )
+
+        return stops
+
+    async def find_vehicle_eta(self, vehicle_uuid: str) -> Optional[VehicleEtaEntity]:
+        cached, eta = vehicle_eta_cache.lookup(vehicle_uuid)
+
+        if cached:
+            return eta
+
+        progress: Optional[VehicleProgressEntity] = ServerInstances.vehicle_etas.find(
+            vehicle_uuid
+        )
+
+        if progress is None:
+            return None
+
+        if 0 < ETA_MAX_AGE_SECONDS < time.time() - progress.ts:
+            return None
+
+        geometries: Dict[int, RouteGeometry] = (
+            await self.__route_matching_service.find_route_geometries(
+                [progress.route_id]
+            )
+        )
+
+        eta = VehicleEtaEntity(
+            vehicle_uuid=vehicle_uuid,
+            progress=progress.progress,
+            speed=progress.speed,
+            ts=progress.ts,
+            stops=self.__get_stop_etas(progress, geometries[progress.route_id]),
+        )
+
+        vehicle_eta_cache.set(vehicle_uuid, eta)
+
+        return eta
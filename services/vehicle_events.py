@@ -1,38 +1,318 @@
-from typing import Sequence, Union
-from fastapi import WebSocket
-import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Set
+from datetime import datetime, UTC
+from pydantic import ValidationError
+from sqlalchemy import event
+import logging
+import orjson
 
 from server.instances import ServerInstances
 from models import Vehicle
 from services.vehicle import VehicleService
-from utils.types import DictType
-from utils.config import VEHICLE_ENDPOINT_NAME
+from services.route_matching import RouteMatchingService
+from utils.entities import (
+    VehiclePositionItemEntity,
+    VehicleIdentityEntity,
+    VehicleLastPositionEntity,
+    VehiclePositionRecordEntity,
+    FleetPositionsEntity,
+    ViewportBodyEntity,
+    RouteMatchEntity,
+    VehicleProgressEntity,
+    StopEventEntity,
+)
+from utils.exceptions import ModelNotFound
+from utils.types import DictType, VehiclePositionsPipelineType, StopEventType
+from utils.functions import get_vehicle_topic, get_company_topic
+from utils.throttle import KeyedThrottle
+from utils.geo import RouteGeometry
+from utils.config import (
+    VEHICLE_POSITIONS_PIPELINE,
+    VEHICLE_BROADCAST_INTERVAL_SECONDS,
+    ROUTE_MATCH_MAX_DISTANCE_METERS,
+    GEOFENCE_RADIUS_METERS,
+)
+
+
+def broadcast_vehicle_position(vehicle_uuid: str, data: DictType) -> None:
+    ServerInstances.general_api.broadcast(
+        get_vehicle_topic(vehicle_uuid), data, key=vehicle_uuid
+    )
+
+
+vehicle_broadcast_throttle: KeyedThrottle[str, DictType] = KeyedThrottle(
+    interval=VEHICLE_BROADCAST_INTERVAL_SECONDS, callback=broadcast_vehicle_position
+)
+
+fleet_changes: Dict[int, Set[str]] = {}
 
 
 class VehicleEventsService:
     def __init__(self) -> None:
         self.__vehicle_service: VehicleService = VehicleService()
 
-    async def process_vehicle_position(
+        self.__route_matching_service: RouteMatchingService = RouteMatchingService()
+
+        self.__pipeline_type: VehiclePositionsPipelineType = (
+            VehiclePositionsPipelineType(VEHICLE_POSITIONS_PIPELINE)
+        )
+
+    def __get_position_data(self, position: VehiclePositionItemEntity) -> DictType:
+        ts: datetime = position.ts or datetime.now(UTC)
+
+        return {
+            "vehicle_uuid": position.vehicle_uuid,
+            "latitude": position.latitude,
+            "longitude": position.longitude,
+            "ts": ts.timestamp(),
+        }
+
+    def __get_position_ts(self, position: VehiclePositionItemEntity) -> float:
+        return position.ts.timestamp() if position.ts else float("inf")
+
+    def __store_position_data(
+        self, vehicle: VehicleIdentityEntity, data: DictType
+    ) -> bool:
+        stored: bool = ServerInstances.vehicle_positions.update(
+            data["vehicle_uuid"],
+            data["latitude"],
+            data["longitude"],
+            data["ts"],
+            vehicle.company_id,
+        )
+
+        if stored:
+            fleet_changes.setdefault(vehicle.company_id, set()).add(vehicle.uuid)
+
+        return stored
+
+    def __match_position_data(
+        self,
+        vehicle: VehicleIdentityEntity,
+        geometry: Optional[RouteGeometry],
+        data: DictType,
+    ) -> None:
+        if geometry is None or vehicle.route_id is None:
+            return
+
+        previous: Optional[VehicleProgressEntity] = ServerInstances.vehicle_etas.find(
+            vehicle.uuid
+        )
+
+        match: Optional[RouteMatchEntity] = geometry.match(
+            data["latitude"],
+            data["longitude"],
+            ROUTE_MATCH_MAX_DISTANCE_METERS,
+            (
+                previous.progress
+                if previous is not None and previous.route_id == vehicle.route_id
+                else None
+            ),
+        )
+
+        stops: List[int] = []
+
+        if match is not None:
+            data["route_progress"] = match.progress
+
+            ServerInstances.vehicle_etas.update(
+                vehicle.uuid, vehicle.route_id, match.progress, data["ts"]
+            )
+
+            stops = geometry.find_stops(
+                data["latitude"],
+                data["longitude"],
+                match.progress,
+                GEOFENCE_RADIUS_METERS,
+                GEOFENCE_RADIUS_METERS * 2 + match.distance,
+            )
+
+        self.__publish_stop_events(vehicle, geometry, stops, data["ts"])
+
+    def __publish_stop_events(
+        self,
+        vehicle: VehicleIdentityEntity,
+        geometry: RouteGeometry,
+        stops: List[int],
+        ts: float,
+    ) -> None:
+        arrivals, departures = ServerInstances.vehicle_geofences.update(
+            vehicle.uuid, vehicle.route_id, stops
+        )
+
+        for event_type, indexes in (
+            (StopEventType.DEPARTURE, departures),
+            (StopEventType.ARRIVAL, arrivals),
+        ):
+            for index in indexes:
+                ServerInstances.stop_events.publish(
+                    event_type,
+                    StopEventEntity(
+                        type=event_type,
+                        vehicle_uuid=vehicle.uuid,
+                        point_uuid=geometry.stops[index],
+                        stop_index=index,
+                        ts=ts,
+                    ),
+                )
+
+    def __record_position_data(
+        self, vehicle: VehicleIdentityEntity, data: DictType
+    ) -> None:
+        ServerInstances.vehicle_positions_history.add(
+            VehiclePositionRecordEntity(
+                vehicle_id=vehicle.id,
+                latitude=data["latitude"],
+                longitude=data["longitude"],
+                ts=datetime.fromtimestamp(data["ts"], UTC),
+            )
+        )
+
+    def find_last_positions(
+        self, vehicle_uuids: Sequence[str]
+    ) -> Sequence[VehicleLastPositionEntity]:
+        return ServerInstances.vehicle_positions.find_many(vehicle_uuids)
+
+    def find_fleet_snapshot(
+        self, company_id: int, company_uuid: Optional[str] = None
+    ) -> FleetPositionsEntity:
+        return FleetPositionsEntity(
+            type="snapshot",
+            company_uuid=company_uuid,
+            positions=ServerInstances.vehicle_positions.find_by_company(company_id),
+        )
+
+    def find_viewport_positions(
+        self, viewport: ViewportBodyEntity
+    ) -> List[VehicleLastPositionEntity]:
+        vehicle_uuids: Sequence[str] = ServerInstances.vehicle_viewports.find_vehicles(
+            viewport
+        )
+
+        return [
+            position
+            for position in ServerInstances.vehicle_positions.find_many(vehicle_uuids)
+            if viewport.contains(position.latitude, position.longitude)
+        ]
+
+    def broadcast_fleet_changes(self) -> int:
+        changes: Dict[int, Set[str]] = dict(fleet_changes)
+
+        fleet_changes.clear()
+
+        for company_id, vehicle_uuids in changes.items():
+            delta: FleetPositionsEntity = FleetPositionsEntity(
+                type="delta",
+                positions=ServerInstances.vehicle_positions.find_many(vehicle_uuids),
+            )
+
+            ServerInstances.general_api.broadcast(
+                get_company_topic(company_id), delta.model_dump(exclude_none=True)
+            )
+
+        return len(changes)
+
+    def publish_vehicle_positions(
+        self, positions: Sequence[VehiclePositionItemEntity]
+    ) -> None:
+        for position in positions:
+            ServerInstances.vehicle_positions_pipeline.publish(
+                position.vehicle_uuid,
+                orjson.dumps(self.__get_position_data(position)),
+            )
+
+    async def capture_vehicle_positions(
+        self, positions: Sequence[VehiclePositionItemEntity]
+    ) -> Sequence[str]:
+        if self.__pipeline_type == VehiclePositionsPipelineType.KAFKA:
+            self.publish_vehicle_positions(positions)
+
+            return []
+
+        return await self.process_vehicle_positions(positions)
+
+    async def capture_vehicle_position(
         self,
         vehicle_uuid: str,
-        latitude: Union[str, float],
-        longitude: Union[str, float],
+        latitude: float,
+        longitude: float,
     ) -> None:
-        vehicle: Vehicle = await self.__vehicle_service.find_vehicle(vehicle_uuid)
+        position: VehiclePositionItemEntity = VehiclePositionItemEntity(
+            vehicle_uuid=vehicle_uuid, latitude=latitude, longitude=longitude
+        )
 
-        data: DictType = {
-            "vehicle_uuid": vehicle.uuid,
-            "latitude": latitude,
-            "longitude": longitude,
-        }
+        rejected: Sequence[str] = await self.capture_vehicle_positions([position])
+
+        if rejected:
+            raise ModelNotFound(Vehicle, vehicle_uuid)
+
+    async def process_published_positions(self, values: Sequence[bytes]) -> None:
+        positions: List[VehiclePositionItemEntity] = []
+
+        for value in values:
+            try:
+                positions.append(VehiclePositionItemEntity.model_validate_json(value))
 
-        url: str = f"{VEHICLE_ENDPOINT_NAME}/{vehicle_uuid}/location"
+            except ValidationError:
+                logging.warning(f"Discarding invalid vehicle position: {value!r}")
 
-        connections: Sequence[WebSocket] = (
-            ServerInstances.general_api.find_websocket_connections_by_url(url)
+        rejected: Sequence[str] = await self.process_vehicle_positions(positions)
+
+        if rejected:
+            logging.info(f"Discarding positions of unknown vehicles: {rejected}")
+
+    async def process_vehicle_positions(
+        self, positions: Sequence[VehiclePositionItemEntity]
+    ) -> Sequence[str]:
+        vehicle_uuids: Set[str] = {position.vehicle_uuid for position in positions}
+
+        vehicles: Dict[str, VehicleIdentityEntity] = (
+            await self.__vehicle_service.find_vehicle_identities(list(vehicle_uuids))
         )
 
-        await asyncio.gather(
-            *[connection.send_json(data) for connection in connections]
+        found_uuids: Set[str] = set(vehicles)
+
+        geometries: Dict[int, RouteGeometry] = (
+            await self.__route_matching_service.find_route_geometries(
+                list(
+                    {
+                        vehicle.route_id
+                        for vehicle in vehicles.values()
+                        if vehicle.route_id is not None
+                    }
+                )
+            )
         )
+
+        for position in sorted(positions, key=self.__get_position_ts):
+            if position.vehicle_uuid not in found_uuids:
+                continue
+
+            data: DictType = self.__get_position_data(position)
+
+            vehicle: VehicleIdentityEntity = vehicles[position.vehicle_uuid]
+
+            self.__record_position_data(vehicle, data)
+
+            if self.__store_position_data(vehicle, data):
+                self.__match_position_data(
+                    vehicle, geometries.get(vehicle.route_id), data
+                )
+
+                vehicle_broadcast_throttle.push(position.vehicle_uuid, data)
+
+        return sorted(vehicle_uuids - found_uuids)
+
+
+@event.listens_for(Vehicle, "after_delete")
+def on_vehicle_deleted(mapper: Any, connection: Any, vehicle: Vehicle) -> None:
+    vehicle_broadcast_throttle.discard(vehicle.uuid)
+
+    fleet_changes.get(vehicle.company_id, set()).discard(vehicle.uuid)
+
+    ServerInstances.vehicle_positions.remove(vehicle.uuid)
+
+    ServerInstances.vehicle_viewports.remove_vehicle(vehicle.uuid)
+
+    ServerInstances.vehicle_etas.remove(vehicle.uuid)
+
+    ServerInstances.vehicle_geofences.remove(vehicle.uuid)
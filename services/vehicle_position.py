@@ -0,0 +1,96 @@
+from typing import AsyncIterator, Optional, Sequence
+from datetime import datetime, UTC
+from pydantic import BaseModel
+from sqlalchemy import Row
+
+from models import database
+from repositories.vehicle_position import (
+    VehiclePositionRepository,
+    IVehiclePositionCreateManyRepository,
+    IVehiclePositionStreamManyRepository,
+)
+from utils.patterns import ICreateManyRepository, IStreamManyRepository
+from utils.entities import VehiclePositionRecordEntity, VehicleTrackPointEntity
+from utils.geo import TrackSimplifier
+from utils.config import VEHICLE_TRACK_FETCH_SIZE
+
+
+class VehiclePositionCreateManyProps(BaseModel):
+    records: Sequence[VehiclePositionRecordEntity]
+
+
+class VehiclePositionStreamProps(BaseModel):
+    vehicle_id: int
+
+    start: datetime
+
+    end: datetime
+
+    fetch_size: int = VEHICLE_TRACK_FETCH_SIZE
+
+
+class VehiclePositionService:
+    def __get_utc_datetime(self, value: datetime) -> datetime:
+        return value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
+
+    def __get_track_point(self, row: Row) -> VehicleTrackPointEntity:
+        ts: datetime = self.__get_utc_datetime(row.ts)
+
+        return VehicleTrackPointEntity(
+            latitude=row.latitude, longitude=row.longitude, ts=ts.timestamp()
+        )
+
+    async def create_vehicle_positions(
+        self, records: Sequence[VehiclePositionRecordEntity]
+    ) -> int:
+        async with database.create_async_session() as session:
+            vehicle_position_repository: ICreateManyRepository[
+                IVehiclePositionCreateManyRepository, int
+            ] = VehiclePositionRepository(session)
+
+            vehicle_position_props: IVehiclePositionCreateManyRepository = (
+                VehiclePositionCreateManyProps.model_construct(records=records)
+            )
+
+            total: int = await vehicle_position_repository.create_many(
+                vehicle_position_props
+            )
+
+            await session.commit()
+
+            return total
+
+    async def stream_vehicle_track(
+        self, vehicle_id: int, start: datetime, end: datetime, tolerance: float = 0
+    ) -> AsyncIterator[VehicleTrackPointEntity]:
+        async with database.create_async_session() as session:
+            vehicle_position_repository: IStreamManyRepository[
+                IVehiclePositionStreamManyRepository, Row
+            ] = VehiclePositionRepository(session)
+
+            vehicle_position_props: IVehiclePositionStreamManyRepository = (
+                VehiclePositionStreamProps(
+                    vehicle_id=vehicle_id,
+                    start=self.__get_utc_datetime(start),
+                    end=self.__get_utc_datetime(end),
+                )
+            )
+
+            simplifier: TrackSimplifier[VehicleTrackPointEntity] = TrackSimplifier(
+                tolerance
+            )
+
+            async for row in vehicle_position_repository.stream_many(
+                vehicle_position_props
+            ):
+                point: Optional[VehicleTrackPointEntity] = simplifier.push(
+                    row.latitude, row.longitude, self.__get_track_point(row)
+                )
+
+                if point is not None:
+                    yield point
+
+            last_point: Optional[VehicleTrackPointEntity] = simplifier.finish()
+
+            if last_point is not None:
+                yield last_point
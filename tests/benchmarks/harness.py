@@ -0,0 +1,303 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+from uuid import uuid4
+import asyncio
+import time
+import tracemalloc
+import httpx
+import orjson
+
+from server.api import ServerApi
+from server.instances import ServerInstances
+from models import Company, Vehicle, database
+from tests.repositories.mocks import create_company, create_vehicle
+from services.vehicle import VehicleService, vehicle_cache
+from services.vehicle_eta import vehicle_eta_cache
+from services.vehicle_events import vehicle_broadcast_throttle, fleet_changes
+from services.route_matching import route_geometry_cache
+from utils.types import DictType
+from utils.config import VEHICLE_BROADCAST_INTERVAL_SECONDS
+import controllers.http.public
+import controllers.websocket
+import controllers.listeners
+
+
+class BenchmarkResult(NamedTuple):
+    vehicles: int
+
+    rate: float
+
+    subscribers: int
+
+    duration: float
+
+    sent: int
+
+    failed: int
+
+    received: int
+
+    throughput: float
+
+    p50: float
+
+    p95: float
+
+    p99: float
+
+    max: float
+
+    peak_memory: Optional[int]
+
+
+def get_percentile(values: Sequence[float], percentile: float) -> float:
+    if not values:
+        return 0
+
+    index: int = max(0, round(percentile / 100 * len(values) + 0.5) - 1)
+
+    return values[min(index, len(values) - 1)]
+
+
+class ASGIWebSocketClient:
+    def __init__(self, app: ServerApi, path: str) -> None:
+        self.__app: ServerApi = app
+
+        self.__path: str = path
+
+        self.__incoming: asyncio.Queue[DictType] = asyncio.Queue()
+
+        self.__outgoing: asyncio.Queue[DictType] = asyncio.Queue()
+
+        self.__task: Optional[asyncio.Task] = None
+
+    async def __receive(self) -> DictType:
+        return await self.__incoming.get()
+
+    async def __send(self, message: DictType) -> None:
+        await self.__outgoing.put(message)
+
+    async def connect(self) -> None:
+        scope: DictType = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": self.__path,
+            "raw_path": self.__path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+            "subprotocols": [],
+            "state": {},
+        }
+
+        self.__task = asyncio.create_task(
+            self.__app(scope, self.__receive, self.__send)
+        )
+
+        await self.__incoming.put({"type": "websocket.connect"})
+
+        message: DictType = await self.__outgoing.get()
+
+        if message["type"] != "websocket.accept":
+            raise ConnectionError(f"WebSocket {self.__path} was not accepted")
+
+    async def receive(self) -> Union[str, bytes]:
+        message: DictType = await self.__outgoing.get()
+
+        if message["type"] == "websocket.close":
+            raise ConnectionError(f"WebSocket {self.__path} was closed")
+
+        return message.get("text") or message.get("bytes", b"")
+
+    async def close(self) -> None:
+        await self.__incoming.put({"type": "websocket.disconnect", "code": 1000})
+
+        if self.__task is not None:
+            await self.__task
+
+
+class VehicleEventsBenchmark:
+    def __init__(
+        self,
+        vehicles: int,
+        rate: float,
+        subscribers: int,
+        duration: float,
+        trace_memory: bool = True,
+    ) -> None:
+        self.__vehicles: int = vehicles
+
+        self.__rate: float = rate
+
+        self.__subscribers: int = subscribers
+
+        self.__duration: float = duration
+
+        self.__trace_memory: bool = trace_memory
+
+        self.__app: ServerApi = ServerInstances.general_api
+
+        self.__latencies: List[float] = []
+
+        self.__sent: int = 0
+
+        self.__failed: int = 0
+
+    async def __create_vehicles(self) -> List[str]:
+        await database.create_all_async()
+
+        company: Company = await create_company()
+
+        vehicle_uuids: List[str] = []
+
+        for _ in range(self.__vehicles):
+            vehicle: Vehicle = await create_vehicle(company, plate=uuid4().hex)
+
+            vehicle_uuids.append(vehicle.uuid)
+
+        await VehicleService().find_vehicle_identities(vehicle_uuids)
+
+        return vehicle_uuids
+
+    async def __post_positions(
+        self, client: httpx.AsyncClient, vehicle_uuid: str, deadline: float
+    ) -> None:
+        interval: float = 1 / self.__rate
+
+        latitude: float = -28.44
+
+        next_at: float = time.perf_counter()
+
+        while next_at < deadline:
+            latitude += 0.0001
+
+            body: List[DictType] = [
+                {
+                    "vehicle_uuid": vehicle_uuid,
+                    "latitude": latitude,
+                    "longitude": -48.95,
+                    "ts": time.time(),
+                }
+            ]
+
+            response: httpx.Response = await client.post(
+                "/events/vehicle/positions", json=body
+            )
+
+            if response.status_code == 200:
+                self.__sent += 1
+
+            else:
+                self.__failed += 1
+
+            next_at += interval
+
+            await asyncio.sleep(max(0, next_at - time.perf_counter()))
+
+    async def __read_positions(self, websocket: ASGIWebSocketClient) -> None:
+        while True:
+            data: Dict[str, Any] = orjson.loads(await websocket.receive())
+
+            if "ts" in data:
+                self.__latencies.append(time.time() - data["ts"])
+
+    async def __cleanup(self) -> None:
+        await database.drop_all_async()
+
+        ServerInstances.vehicle_positions.clear()
+
+        ServerInstances.vehicle_etas.clear()
+
+        ServerInstances.vehicle_geofences.clear()
+
+        vehicle_broadcast_throttle.clear()
+
+        fleet_changes.clear()
+
+        vehicle_cache.clear()
+
+        vehicle_eta_cache.clear()
+
+        route_geometry_cache.clear()
+
+    async def run(self) -> BenchmarkResult:
+        try:
+            return await self.__run()
+
+        finally:
+            await self.__cleanup()
+
+    async def __run(self) -> BenchmarkResult:
+        vehicle_uuids: List[str] = await self.__create_vehicles()
+
+        async with self.__app.router.lifespan_context(self.__app):
+            websockets: List[ASGIWebSocketClient] = [
+                ASGIWebSocketClient(
+                    self.__app,
+                    f"/vehicle/{vehicle_uuids[index % len(vehicle_uuids)]}/location",
+                )
+                for index in range(self.__subscribers)
+            ]
+
+            for websocket in websockets:
+                await websocket.connect()
+
+            readers: List[asyncio.Task] = [
+                asyncio.create_task(self.__read_positions(websocket))
+                for websocket in websockets
+            ]
+
+            if self.__trace_memory:
+                tracemalloc.start()
+
+            started_at: float = time.perf_counter()
+
+            deadline: float = started_at + self.__duration
+
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=self.__app),
+                base_url="http://benchmark",
+            ) as client:
+                await asyncio.gather(
+                    *[
+                        self.__post_positions(client, vehicle_uuid, deadline)
+                        for vehicle_uuid in vehicle_uuids
+                    ]
+                )
+
+            elapsed: float = time.perf_counter() - started_at
+
+            await asyncio.sleep(VEHICLE_BROADCAST_INTERVAL_SECONDS + 0.1)
+
+            peak_memory: Optional[int] = None
+
+            if self.__trace_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+
+                tracemalloc.stop()
+
+            for reader in readers:
+                reader.cancel()
+
+            for websocket in websockets:
+                await websocket.close()
+
+        latencies: List[float] = sorted(latency * 1000 for latency in self.__latencies)
+
+        return BenchmarkResult(
+            vehicles=self.__vehicles,
+            rate=self.__rate,
+            subscribers=self.__subscribers,
+            duration=elapsed,
+            sent=self.__sent,
+            failed=self.__failed,
+            received=len(latencies),
+            throughput=self.__sent / elapsed,
+            p50=get_percentile(latencies, 50),
+            p95=get_percentile(latencies, 95),
+            p99=get_percentile(latencies, 99),
+            max=latencies[-1] if latencies else 0,
+            peak_memory=peak_memory,
+        )
@@ -0,0 +1,29 @@
+from unittest import IsolatedAsyncioTestCase, skipUnless
+import logging
+import os
+
+from tests.benchmarks.harness import BenchmarkResult, VehicleEventsBenchmark
+
+
+@skipUnless(os.environ.get("RUN_BENCHMARKS"), "Set RUN_BENCHMARKS=1 to run benchmarks")
+class VehicleEventsBenchmarkTestCase(IsolatedAsyncioTestCase):
+    async def test_ingest_to_subscriber_latency(self) -> None:
+        benchmark: VehicleEventsBenchmark = VehicleEventsBenchmark(
+            vehicles=5, rate=4, subscribers=10, duration=1
+        )
+
+        result: BenchmarkResult = await benchmark.run()
+
+        logging.info(f"Vehicle events benchmark: {result}")
+
+        self.assertEqual(result.failed, 0)
+
+        self.assertGreater(result.sent, 0)
+
+        self.assertGreaterEqual(result.received, result.subscribers)
+
+        self.assertLessEqual(result.p50, result.p95)
+
+        self.assertLessEqual(result.p95, result.p99)
+
+        self.assertIsNotNone(result.peak_memory)
@@ -0,0 +1,82 @@
+from typing import Any, List
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+from starlette.types import Message, Scope
+
+from middlewares.auth import AuthMiddleware
+from utils.types import DictType
+
+
+class AuthMiddlewareTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__mock_app: AsyncMock = AsyncMock()
+
+        self.__mock_authenticate: AsyncMock = AsyncMock(return_value="principal")
+
+        self.__middleware: AuthMiddleware = AuthMiddleware(
+            self.__mock_app,
+            authenticate=self.__mock_authenticate,
+            public_routes=("/docs", "/auth"),
+            public_endpoints=(("POST", "/profile"),),
+        )
+
+        self.__messages: List[Message] = []
+
+    async def __send(self, message: Message) -> None:
+        self.__messages.append(message)
+
+    async def __call(self, scope_type: str, path: str, **kwargs: Any) -> Scope:
+        scope: DictType = {
+            "type": scope_type,
+            "path": path,
+            "root_path": "",
+            "headers": [],
+            **kwargs,
+        }
+
+        await self.__middleware(scope, AsyncMock(), self.__send)
+
+        return scope
+
+    async def test_public_paths_pass(self) -> None:
+        await self.__call("http", "/auth/refresh", method="GET")
+
+        await self.__call("http", "/profile", method="POST")
+
+        self.assertEqual(self.__mock_app.await_count, 2)
+
+        self.__mock_authenticate.assert_not_awaited()
+
+    async def test_private_path_without_token(self) -> None:
+        self.__mock_authenticate.side_effect = ValueError("invalid token")
+
+        await self.__call("http", "/profile/1", method="GET")
+
+        self.__mock_app.assert_not_awaited()
+
+        self.__mock_authenticate.assert_awaited_once_with("")
+
+        self.assertEqual(self.__messages[0]["status"], 401)
+
+    async def test_private_path_with_token(self) -> None:
+        scope: Scope = await self.__call(
+            "http",
+            "/profile",
+            method="GET",
+            headers=[(b"authorization", b"Bearer token")],
+        )
+
+        self.__mock_authenticate.assert_awaited_once_with("Bearer token")
+
+        self.__mock_app.assert_awaited_once()
+
+        self.assertEqual(scope["state"]["user"], "principal")
+
+    async def test_other_scopes_pass(self) -> None:
+        await self.__call("websocket", "/profile/1")
+
+        await self.__call("lifespan", "")
+
+        self.assertEqual(self.__mock_app.await_count, 2)
+
+        self.__mock_authenticate.assert_not_awaited()
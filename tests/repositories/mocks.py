@@ -112,11 +112,11 @@ async def create_route(
 
 async def create_vehicle(
     company: Company,
-    type: str = "",
+    type: str = "bus",
     plate: str = "1234",
 ) -> Vehicle:
     async with database.create_async_session() as session:
-        vehicle: Vehicle = Vehicle()
+        vehicle: Vehicle = Vehicle(company_id=company.id, type=type, plate=plate)
 
         session.add(vehicle)
 
@@ -48,7 +48,7 @@ class AgentRepositoryOnlineTestCase(BaseRepositoryTestCase):
             repository_params: IAgentCreateRepository = Mock(
                 email="usuario_teste@gmail.com",
                 password="1234",
-                company=self.__company,
+                company_id=self.__company.id,
             )
 
             repository_params.name = "Usuário Teste"
@@ -121,7 +121,7 @@ class AgentRepositoryOnlineTestCase(BaseRepositoryTestCase):
             ] = AgentRepository(session)
 
             repository_params: IAgentFindManyRepository = Mock(
-                company=self.__company, limit=limit, page=page
+                company_id=self.__company.id, limit=limit, page=page
             )
 
             agents: Sequence[Agent] = await repository.find_many(repository_params)
@@ -0,0 +1,57 @@
+from typing import Sequence
+from unittest.mock import Mock
+from sqlalchemy import Row
+
+from models import Company, Point, Route, RoutePoint, database
+from repositories.route_point import (
+    RoutePointRepository,
+    IRoutePointFindManyRepository,
+)
+from utils.patterns import IFindManyRepository
+from .common import BaseRepositoryTestCase
+from .mocks import create_company, create_point, create_route
+
+
+class RoutePointRepositoryTestCase(BaseRepositoryTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        company: Company = await create_company()
+
+        self.__route: Route = await create_route(company)
+
+        self.__points: Sequence[Point] = [
+            await create_point(company, latitude=str(-28 - index), longitude="-48")
+            for index in range(3)
+        ]
+
+        async with database.create_async_session() as session:
+            for index, point in zip([2, 0, 1], self.__points):
+                session.add(
+                    RoutePoint(route_id=self.__route.id, point_id=point.id, index=index)
+                )
+
+            await session.commit()
+
+    async def test_find_many(self) -> None:
+        async with database.create_async_session() as session:
+            route_point_repository: IFindManyRepository[
+                IRoutePointFindManyRepository, Row
+            ] = RoutePointRepository(session)
+
+            repository_props: IRoutePointFindManyRepository = Mock(
+                route_ids=[self.__route.id]
+            )
+
+            rows: Sequence[Row] = await route_point_repository.find_many(
+                repository_props
+            )
+
+            self.assertSequenceEqual(
+                [tuple(row) for row in rows],
+                [
+                    (self.__route.id, self.__points[1].uuid, "-29", "-48"),
+                    (self.__route.id, self.__points[2].uuid, "-30", "-48"),
+                    (self.__route.id, self.__points[0].uuid, "-28", "-48"),
+                ],
+            )
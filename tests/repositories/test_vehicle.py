@@ -0,0 +1,129 @@
+from typing import Optional, Sequence
+from unittest.mock import Mock
+
+from models import Company, Route, Vehicle, database
+from repositories.vehicle import (
+    VehicleRepository,
+    IVehicleCreateRepository,
+    IVehicleUpdateRepository,
+    IVehicleFindRepository,
+    IVehicleFindManyRepository,
+)
+from utils.patterns import (
+    ICreateRepository,
+    IUpdateRepository,
+    IFindRepository,
+    IFindManyRepository,
+)
+from utils.types import VehicleType
+from .common import BaseRepositoryTestCase
+from .mocks import create_company, create_route, create_vehicle
+
+
+class VehicleRepositoryTestCase(BaseRepositoryTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.__company: Company = await create_company()
+
+        self.__vehicle: Vehicle = await create_vehicle(self.__company, plate="AAA0001")
+
+        self.__other_vehicle: Vehicle = await create_vehicle(
+            self.__company, plate="AAA0002"
+        )
+
+    async def test_create(self) -> None:
+        route: Route = await create_route(self.__company)
+
+        async with database.create_async_session() as session:
+            vehicle_repository: ICreateRepository[
+                IVehicleCreateRepository, Optional[Vehicle]
+            ] = VehicleRepository(session)
+
+            repository_props: IVehicleCreateRepository = Mock(
+                company_id=self.__company.id,
+                type=VehicleType.CAR,
+                plate="AAA0003",
+                route_id=route.id,
+            )
+
+            vehicle: Optional[Vehicle] = await vehicle_repository.create(
+                repository_props
+            )
+
+            await session.commit()
+
+            self.assertIsNotNone(vehicle)
+
+            self.assertEqual(vehicle.route_id, route.id)
+
+    async def test_update(self) -> None:
+        route: Route = await create_route(self.__company)
+
+        async with database.create_async_session() as session:
+            vehicle_repository: IUpdateRepository[
+                IVehicleUpdateRepository, Optional[Vehicle]
+            ] = VehicleRepository(session)
+
+            repository_props: IVehicleUpdateRepository = Mock(
+                uuid=self.__vehicle.uuid,
+                company_id=self.__company.id,
+                type=VehicleType.BUS,
+                plate="AAA0004",
+                route_id=route.id,
+                instance=None,
+            )
+
+            vehicle: Optional[Vehicle] = await vehicle_repository.update(
+                repository_props
+            )
+
+            await session.commit()
+
+            self.assertIsNotNone(vehicle)
+
+            self.assertEqual(vehicle.route_id, route.id)
+
+            self.assertEqual(vehicle.plate, "AAA0004")
+
+    async def test_find(self) -> None:
+        async with database.create_async_session() as session:
+            vehicle_repository: IFindRepository[IVehicleFindRepository, Vehicle] = (
+                VehicleRepository(session)
+            )
+
+            repository_props: IVehicleFindRepository = Mock(uuid=self.__vehicle.uuid)
+
+            vehicle: Optional[Vehicle] = await vehicle_repository.find(repository_props)
+
+            self.assertIsNotNone(vehicle)
+
+    async def test_find_many(self) -> None:
+        async with database.create_async_session() as session:
+            vehicle_repository: IFindManyRepository[
+                IVehicleFindManyRepository, Vehicle
+            ] = VehicleRepository(session)
+
+            repository_props: IVehicleFindManyRepository = Mock(
+                uuids=[self.__vehicle.uuid, self.__other_vehicle.uuid, "unknown"]
+            )
+
+            vehicles: Sequence[Vehicle] = await vehicle_repository.find_many(
+                repository_props
+            )
+
+            self.assertEqual(len(vehicles), 2)
+
+    async def test_find_many_without_uuids(self) -> None:
+        async with database.create_async_session() as session:
+            vehicle_repository: IFindManyRepository[
+                IVehicleFindManyRepository, Vehicle
+            ] = VehicleRepository(session)
+
+            repository_props: IVehicleFindManyRepository = Mock(uuids=[])
+
+            vehicles: Sequence[Vehicle] = await vehicle_repository.find_many(
+                repository_props
+            )
+
+            self.assertSequenceEqual(vehicles, [])
@@ -0,0 +1,90 @@
+from typing import List, Sequence
+from unittest.mock import Mock
+from datetime import datetime, UTC
+from sqlalchemy import Row, select, func
+
+from models import Company, Vehicle, VehiclePosition, database
+from repositories.vehicle_position import (
+    VehiclePositionRepository,
+    IVehiclePositionCreateManyRepository,
+    IVehiclePositionStreamManyRepository,
+)
+from utils.patterns import ICreateManyRepository, IStreamManyRepository
+from utils.entities import VehiclePositionRecordEntity
+from .common import BaseRepositoryTestCase
+from .mocks import create_company, create_vehicle
+
+
+class VehiclePositionRepositoryTestCase(BaseRepositoryTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.__company: Company = await create_company()
+
+        self.__vehicle: Vehicle = await create_vehicle(self.__company)
+
+        self.__records: Sequence[VehiclePositionRecordEntity] = [
+            VehiclePositionRecordEntity(
+                vehicle_id=self.__vehicle.id,
+                latitude=-28.44 - index / 1000,
+                longitude=-48.95,
+                ts=datetime.fromtimestamp(1718000000 + index, UTC),
+            )
+            for index in range(10)
+        ]
+
+    async def test_create_many(self) -> None:
+        records: Sequence[VehiclePositionRecordEntity] = self.__records
+
+        async with database.create_async_session() as session:
+            vehicle_position_repository: ICreateManyRepository[
+                IVehiclePositionCreateManyRepository, int
+            ] = VehiclePositionRepository(session)
+
+            repository_props: IVehiclePositionCreateManyRepository = Mock(
+                records=records
+            )
+
+            total: int = await vehicle_position_repository.create_many(repository_props)
+
+            await session.commit()
+
+            count: int = await session.scalar(
+                select(func.count()).select_from(VehiclePosition)
+            )
+
+            self.assertEqual(total, 10)
+
+            self.assertEqual(count, 10)
+
+    async def test_stream_many(self) -> None:
+        async with database.create_async_session() as session:
+            vehicle_position_repository: VehiclePositionRepository = (
+                VehiclePositionRepository(session)
+            )
+
+            await vehicle_position_repository.create_many(
+                Mock(records=list(reversed(self.__records)))
+            )
+
+            await session.commit()
+
+            stream_repository: IStreamManyRepository[
+                IVehiclePositionStreamManyRepository, Row
+            ] = vehicle_position_repository
+
+            repository_props: IVehiclePositionStreamManyRepository = Mock(
+                vehicle_id=self.__vehicle.id,
+                start=self.__records[2].ts,
+                end=self.__records[5].ts,
+                fetch_size=2,
+            )
+
+            rows: List[Row] = [
+                row async for row in stream_repository.stream_many(repository_props)
+            ]
+
+            self.assertSequenceEqual(
+                [row.latitude for row in rows],
+                [record.latitude for record in self.__records[2:6]],
+            )
@@ -0,0 +1,273 @@
+import asyncio
+from typing import List, Sequence
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, patch
+from fastapi import WebSocketException
+
+from server.api import ServerApi
+from server.codec import ServerPositionCodec
+from server.websocket import ServerWebSocketConnection, encode_websocket_frame
+from utils.entities import WebSocketMetricsEntity
+
+
+class ServerApiTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__api: ServerApi = ServerApi(host="", port=0, title="Test")
+
+        self.__mock_websocket: AsyncMock = AsyncMock(scope={})
+
+        self.__mock_other_websocket: AsyncMock = AsyncMock(scope={})
+
+    async def test_connect_websocket(self) -> None:
+        await self.__api.connect_websocket(self.__mock_websocket, "vehicle:1")
+
+        await self.__api.connect_websocket(self.__mock_other_websocket, "vehicle:11")
+
+        connections: Sequence[ServerWebSocketConnection] = (
+            self.__api.find_websocket_connections("vehicle:1")
+        )
+
+        self.__mock_websocket.accept.assert_awaited_once()
+
+        self.assertSequenceEqual(
+            [connection.websocket for connection in connections],
+            [self.__mock_websocket],
+        )
+
+        self.assertEqual(len(self.__api.websocket_connections), 2)
+
+    async def test_subscribe_websocket(self) -> None:
+        await self.__api.connect_websocket(self.__mock_websocket)
+
+        self.__api.subscribe_websocket(self.__mock_websocket, "vehicle:1")
+
+        self.__api.subscribe_websocket(self.__mock_websocket, "vehicle:2")
+
+        self.__api.unsubscribe_websocket(self.__mock_websocket, "vehicle:1")
+
+        self.assertSequenceEqual(self.__api.find_websocket_connections("vehicle:1"), [])
+
+        self.assertSequenceEqual(
+            [
+                connection.websocket
+                for connection in self.__api.find_websocket_connections("vehicle:2")
+            ],
+            [self.__mock_websocket],
+        )
+
+    async def test_disconnect_websocket(self) -> None:
+        await self.__api.connect_websocket(self.__mock_websocket, "vehicle:1")
+
+        await self.__api.disconnect_websocket(self.__mock_websocket)
+
+        self.__mock_websocket.close.assert_awaited_once()
+
+        self.assertSequenceEqual(self.__api.find_websocket_connections("vehicle:1"), [])
+
+        self.assertEqual(len(self.__api.websocket_connections), 0)
+
+    async def test_broadcast(self) -> None:
+        await self.__api.connect_websocket(self.__mock_websocket, "vehicle:1")
+
+        await self.__api.connect_websocket(self.__mock_other_websocket, "vehicle:1")
+
+        with patch(
+            "server.api.encode_websocket_frame", wraps=encode_websocket_frame
+        ) as mock_encode:
+            self.__api.broadcast("vehicle:1", {"latitude": 0})
+
+        await asyncio.sleep(0)
+
+        mock_encode.assert_called_once()
+
+        self.__mock_websocket.send_text.assert_awaited_once_with('{"latitude":0}')
+
+        self.__mock_other_websocket.send_text.assert_awaited_once_with('{"latitude":0}')
+
+    async def test_broadcast_with_codec(self) -> None:
+        api: ServerApi = ServerApi(
+            host="",
+            port=0,
+            title="Test",
+            websocket_codecs=[ServerPositionCodec()],
+        )
+
+        self.__mock_other_websocket.scope = {
+            "subprotocols": [ServerPositionCodec.subprotocol]
+        }
+
+        await api.connect_websocket(self.__mock_websocket, "vehicle:1")
+
+        await api.connect_websocket(self.__mock_other_websocket, "vehicle:1")
+
+        data: dict = {"vehicle_uuid": "1", "latitude": 1.5, "longitude": 2.5, "ts": 1}
+
+        api.broadcast("vehicle:1", data)
+
+        await asyncio.sleep(0)
+
+        api.broadcast("vehicle:1", data)
+
+        await asyncio.sleep(0)
+
+        self.__mock_other_websocket.accept.assert_awaited_once_with(
+            subprotocol=ServerPositionCodec.subprotocol
+        )
+
+        self.assertEqual(self.__mock_websocket.send_text.await_count, 2)
+
+        frames: List[bytes] = [
+            call.args[0]
+            for call in self.__mock_other_websocket.send_bytes.await_args_list
+        ]
+
+        self.assertEqual(
+            [len(ServerPositionCodec.decode(frame)) for frame in frames], [2, 1]
+        )
+
+    async def test_disconnect_websocket_on_send_failure(self) -> None:
+        self.__mock_websocket.send_text.side_effect = RuntimeError()
+
+        connection: ServerWebSocketConnection = await self.__api.connect_websocket(
+            self.__mock_websocket, "vehicle:1"
+        )
+
+        connection.send_json({"latitude": 0})
+
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(connection.closed)
+
+        self.assertEqual(len(self.__api.websocket_connections), 0)
+
+    async def test_connect_websocket_limits(self) -> None:
+        api: ServerApi = ServerApi(
+            host="",
+            port=0,
+            websocket_max_connections=3,
+            websocket_max_company_connections=1,
+        )
+
+        await api.connect_websocket(self.__mock_websocket, company_id=1)
+
+        with self.assertRaises(WebSocketException):
+            await api.connect_websocket(self.__mock_other_websocket, company_id=1)
+
+        self.__mock_other_websocket.close.assert_awaited_once_with(code=1013)
+
+        await api.connect_websocket(AsyncMock(scope={}), company_id=2)
+
+        await api.connect_websocket(AsyncMock(scope={}))
+
+        with self.assertRaises(WebSocketException):
+            await api.connect_websocket(AsyncMock(scope={}))
+
+        await api.disconnect_websocket(self.__mock_websocket)
+
+        metrics: WebSocketMetricsEntity = api.websocket_metrics
+
+        self.assertEqual(metrics.connections, 2)
+
+        self.assertEqual(metrics.companies, 1)
+
+        self.assertEqual(api.count_company_websockets(1), 0)
+
+        self.assertEqual(api.count_company_websockets(2), 1)
+
+        self.assertEqual(metrics.accepted, 3)
+
+        self.assertEqual(metrics.rejected, 2)
+
+    async def test_connect_websocket_device_limits(self) -> None:
+        api: ServerApi = ServerApi(
+            host="",
+            port=0,
+            websocket_max_company_connections=1,
+            websocket_max_company_devices=1,
+        )
+
+        await api.connect_websocket(self.__mock_websocket, company_id=1)
+
+        await api.connect_websocket(
+            self.__mock_other_websocket, company_id=1, is_device=True
+        )
+
+        with self.assertRaises(WebSocketException):
+            await api.connect_websocket(
+                AsyncMock(scope={}), company_id=1, is_device=True
+            )
+
+        await api.disconnect_websocket(self.__mock_other_websocket)
+
+        metrics: WebSocketMetricsEntity = api.websocket_metrics
+
+        self.assertEqual(metrics.devices, 0)
+
+        self.assertEqual(api.count_company_websockets(1), 1)
+
+        self.assertEqual(api.count_company_websockets(1, is_device=True), 0)
+
+    async def test_websocket_listeners_are_kept_by_default(self) -> None:
+        api: ServerApi = ServerApi(host="", port=0, websocket_timer_tick=0.01)
+
+        async with api.router.lifespan_context(api):
+            await api.connect_websocket(self.__mock_websocket)
+
+            await asyncio.sleep(0.1)
+
+        self.__mock_websocket.send_text.assert_not_awaited()
+
+        self.__mock_websocket.close.assert_not_awaited()
+
+        metrics: WebSocketMetricsEntity = api.websocket_metrics
+
+        self.assertEqual(metrics.connections, 1)
+
+        self.assertEqual(metrics.heartbeats, 0)
+
+    async def test_websocket_heartbeat_and_eviction(self) -> None:
+        api: ServerApi = ServerApi(
+            host="",
+            port=0,
+            websocket_heartbeat_interval=0.05,
+            websocket_idle_timeout=0.2,
+            websocket_timer_tick=0.01,
+        )
+
+        self.__mock_websocket.receive.return_value = {
+            "type": "websocket.receive",
+            "text": "pong",
+        }
+
+        async def respond() -> None:
+            while True:
+                await asyncio.sleep(0.05)
+
+                await api.receive_websocket(self.__mock_websocket)
+
+        async with api.router.lifespan_context(api):
+            await api.connect_websocket(self.__mock_websocket)
+
+            await api.connect_websocket(self.__mock_other_websocket)
+
+            responder: asyncio.Task = asyncio.create_task(respond())
+
+            await asyncio.sleep(0.4)
+
+            responder.cancel()
+
+        self.__mock_other_websocket.send_text.assert_awaited_with(
+            '{"type":"heartbeat"}'
+        )
+
+        self.__mock_websocket.close.assert_not_awaited()
+
+        self.__mock_other_websocket.close.assert_awaited_once_with(code=1001)
+
+        metrics: WebSocketMetricsEntity = api.websocket_metrics
+
+        self.assertEqual(metrics.connections, 1)
+
+        self.assertEqual(metrics.evicted, 1)
+
+        self.assertGreater(metrics.heartbeats, 2)
@@ -0,0 +1,141 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+from types import SimpleNamespace
+from queue import Empty, Queue
+import asyncio
+import threading
+
+from server.backplane import ServerKafkaBackplane, ServerLocalBackplane
+
+
+class FakeBroker:
+    def __init__(self) -> None:
+        self.consumers: List["FakeConsumer"] = []
+
+    def create_producer(self, **kwargs: Any) -> "FakeProducer":
+        return FakeProducer(self)
+
+    def create_consumer(
+        self, topic: str, callback: Callable[[Any], None], **kwargs: Any
+    ) -> "FakeConsumer":
+        consumer: FakeConsumer = FakeConsumer(topic, callback)
+
+        self.consumers.append(consumer)
+
+        return consumer
+
+
+class FakeProducer:
+    def __init__(self, broker: FakeBroker) -> None:
+        self.__broker: FakeBroker = broker
+
+    def partitions_for(self, topic: str) -> Set[int]:
+        return {0}
+
+    def send(
+        self, topic: str, value: bytes, key: Optional[bytes], headers: List[Any]
+    ) -> None:
+        message: SimpleNamespace = SimpleNamespace(
+            topic=topic, value=value, key=key, headers=headers
+        )
+
+        for consumer in self.__broker.consumers:
+            if consumer.topic == topic and not consumer.closed:
+                consumer.messages.put(message)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConsumer:
+    def __init__(self, topic: str, callback: Callable[[Any], None]) -> None:
+        self.topic: str = topic
+
+        self.callback: Callable[[Any], None] = callback
+
+        self.messages: Queue[Any] = Queue()
+
+        self.closed: bool = False
+
+        self.closed_by: Optional[int] = None
+
+    def poll(self, timeout_ms: int = 0) -> Dict[str, List[Any]]:
+        try:
+            return {self.topic: [self.messages.get(timeout=timeout_ms / 1000)]}
+
+        except Empty:
+            return {}
+
+    def close(self) -> None:
+        self.closed = True
+
+        self.closed_by = threading.get_ident()
+
+
+class ServerBackplaneTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__broker: FakeBroker = FakeBroker()
+
+        self.__mock_deliver: Mock = Mock()
+
+        self.__mock_other_deliver: Mock = Mock()
+
+    def __create_kafka_backplane(self) -> ServerKafkaBackplane:
+        return ServerKafkaBackplane(
+            kafka_topic="websocket",
+            producer_factory=self.__broker.create_producer,
+            consumer_factory=self.__broker.create_consumer,
+            poll_timeout=0.01,
+        )
+
+    async def __wait_delivered(self, mock_deliver: Mock, count: int) -> None:
+        while mock_deliver.call_count < count:
+            await asyncio.sleep(0.01)
+
+    async def test_local_publish(self) -> None:
+        backplane: ServerLocalBackplane = ServerLocalBackplane()
+
+        backplane.bind(self.__mock_deliver)
+
+        backplane.publish("vehicle:1", '{"latitude":0}', "1")
+
+        self.__mock_deliver.assert_called_once_with("vehicle:1", '{"latitude":0}', "1")
+
+    async def test_kafka_publish(self) -> None:
+        backplane: ServerKafkaBackplane = self.__create_kafka_backplane()
+
+        other_backplane: ServerKafkaBackplane = self.__create_kafka_backplane()
+
+        backplane.bind(self.__mock_deliver)
+
+        other_backplane.bind(self.__mock_other_deliver)
+
+        await backplane.start()
+
+        await other_backplane.start()
+
+        backplane.publish("vehicle:1", '{"latitude":0}', "1")
+
+        backplane.publish("vehicle:2", b"\x01\x02")
+
+        await asyncio.wait_for(self.__wait_delivered(self.__mock_other_deliver, 2), 1)
+
+        self.__mock_deliver.assert_any_call("vehicle:1", '{"latitude":0}', "1")
+
+        self.assertEqual(self.__mock_deliver.call_count, 2)
+
+        self.__mock_other_deliver.assert_any_call("vehicle:1", '{"latitude":0}', "1")
+
+        self.__mock_other_deliver.assert_any_call("vehicle:2", b"\x01\x02", None)
+
+        self.assertEqual(self.__mock_other_deliver.call_count, 2)
+
+        await backplane.stop()
+
+        await other_backplane.stop()
+
+        for consumer in self.__broker.consumers:
+            self.assertTrue(consumer.closed)
+
+            self.assertNotEqual(consumer.closed_by, threading.get_ident())
@@ -0,0 +1,68 @@
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+import asyncio
+
+from server.batch import ServerBatchWriter
+
+
+class ServerBatchWriterTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__mock_flush: AsyncMock = AsyncMock()
+
+        self.__writer: ServerBatchWriter[int] = ServerBatchWriter(
+            batch_size=2, max_buffer_size=4, flush_interval=0.05
+        )
+
+        self.__writer.bind(self.__mock_flush)
+
+    def __get_flushed_batches(self) -> List[List[int]]:
+        return [call.args[0] for call in self.__mock_flush.await_args_list]
+
+    async def test_flush_by_size(self) -> None:
+        await self.__writer.start()
+
+        for item in range(3):
+            self.__writer.add(item)
+
+        await asyncio.sleep(0.01)
+
+        self.assertSequenceEqual(self.__get_flushed_batches(), [[0, 1], [2]])
+
+        self.assertEqual(self.__writer.written, 3)
+
+        await self.__writer.stop()
+
+    async def test_flush_by_interval(self) -> None:
+        await self.__writer.start()
+
+        self.__writer.add(1)
+
+        await asyncio.sleep(0.1)
+
+        self.assertSequenceEqual(self.__get_flushed_batches(), [[1]])
+
+        await self.__writer.stop()
+
+    async def test_flush_on_stop(self) -> None:
+        for item in range(6):
+            self.__writer.add(item)
+
+        self.assertEqual(self.__writer.pending, 4)
+
+        self.assertEqual(self.__writer.dropped, 2)
+
+        await self.__writer.stop()
+
+        self.assertSequenceEqual(self.__get_flushed_batches(), [[2, 3], [4, 5]])
+
+    async def test_flush_with_error(self) -> None:
+        self.__mock_flush.side_effect = RuntimeError()
+
+        self.__writer.add(1)
+
+        await self.__writer.flush()
+
+        self.assertEqual(self.__writer.dropped, 1)
+
+        self.assertEqual(self.__writer.pending, 0)
@@ -0,0 +1,96 @@
+from typing import List, Optional
+from unittest import TestCase
+
+from server.codec import (
+    DEVICE_POSITION_RECORD,
+    ServerPositionCodec,
+    decode_device_frame,
+)
+from server.websocket import WebSocketEncodedFrame
+from utils.entities import VehiclePositionItemEntity
+
+
+class ServerPositionCodecTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__codec: ServerPositionCodec = ServerPositionCodec()
+
+        self.__data: dict = {
+            "vehicle_uuid": "6df97b7d-2beb-4d60-ae75-b742ac3df111",
+            "latitude": -28.441234,
+            "longitude": -48.951234,
+            "ts": 1718000000.25,
+        }
+
+    def test_encode(self) -> None:
+        encoded: Optional[WebSocketEncodedFrame] = self.__codec.encode(self.__data)
+
+        self.assertIsNotNone(encoded)
+
+        self.assertEqual(len(encoded.frame), 21)
+
+        self.assertSequenceEqual(
+            ServerPositionCodec.decode(encoded.announcement + encoded.frame),
+            [
+                ("dictionary", 0, self.__data["vehicle_uuid"]),
+                ("position", 0, -28.441234, -48.951234, 1718000000.25),
+            ],
+        )
+
+    def test_encode_indexes(self) -> None:
+        self.__codec.encode(self.__data)
+
+        encoded: Optional[WebSocketEncodedFrame] = self.__codec.encode(
+            {**self.__data, "vehicle_uuid": "other"}
+        )
+
+        self.assertEqual(encoded.announcement_key, 1)
+
+        self.assertEqual(self.__codec.find_index(self.__data["vehicle_uuid"]), 0)
+
+    def test_encode_unknown_data(self) -> None:
+        self.assertIsNone(self.__codec.encode({"type": "delta"}))
+
+    def test_encode_out_of_range(self) -> None:
+        self.assertIsNone(self.__codec.encode({**self.__data, "latitude": 5000}))
+
+        self.assertIsNone(self.__codec.encode({**self.__data, "ts": -1}))
+
+        self.assertIsNone(self.__codec.encode({**self.__data, "ts": float("inf")}))
+
+
+class DecodeDeviceFrameTestCase(TestCase):
+    def test_decode_binary(self) -> None:
+        frame: bytes = DEVICE_POSITION_RECORD.pack(
+            -28441234, -48951234, 1718000000250
+        ) + DEVICE_POSITION_RECORD.pack(-28441000, -48951000, 0)
+
+        positions: List[VehiclePositionItemEntity] = decode_device_frame("1", frame)
+
+        self.assertEqual(len(positions), 2)
+
+        self.assertEqual(positions[0].latitude, -28.441234)
+
+        self.assertEqual(positions[0].ts.timestamp(), 1718000000.25)
+
+        self.assertIsNone(positions[1].ts)
+
+        with self.assertRaises(ValueError):
+            decode_device_frame("1", frame[:-1])
+
+        with self.assertRaises(ValueError):
+            decode_device_frame("1", DEVICE_POSITION_RECORD.pack(95000000, 0, 0))
+
+    def test_decode_text(self) -> None:
+        positions: List[VehiclePositionItemEntity] = decode_device_frame(
+            "1", '[{"latitude": -28.4, "longitude": -48.9}]'
+        )
+
+        self.assertEqual(positions[0].vehicle_uuid, "1")
+
+        self.assertEqual(
+            decode_device_frame("1", '{"latitude": 1, "longitude": 2}')[0].longitude, 2
+        )
+
+        for frame in ("[1]", "{", '{"latitude": 1}'):
+            with self.assertRaises(ValueError):
+                decode_device_frame("1", frame)
@@ -0,0 +1,95 @@
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+import asyncio
+import threading
+
+from server.crypt import ServerCryptPool
+from utils.entities import CryptPoolMetricsEntity
+from utils.exceptions import ServerCryptPoolOverloaded
+
+
+class ServerCryptPoolTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__pool: ServerCryptPool = ServerCryptPool(max_workers=1, max_pending=1)
+
+    def tearDown(self) -> None:
+        self.__pool.shutdown()
+
+    async def __wait_idle(self) -> None:
+        while self.__pool.running:
+            await asyncio.sleep(0.01)
+
+    async def test_hash_and_compare(self) -> None:
+        hash: str = await self.__pool.create_hash("1234")
+
+        self.assertTrue(await self.__pool.compare_password("1234", hash))
+
+        self.assertFalse(await self.__pool.compare_password("4321", hash))
+
+        metrics: CryptPoolMetricsEntity = self.__pool.metrics
+
+        self.assertEqual(metrics.completed, 3)
+
+        self.assertEqual(metrics.running, 0)
+
+    async def test_runs_outside_event_loop(self) -> None:
+        thread_ids: List[int] = []
+
+        await self.__pool.run(lambda: thread_ids.append(threading.get_ident()))
+
+        self.assertNotEqual(thread_ids[0], threading.get_ident())
+
+    async def test_rejects_when_overloaded(self) -> None:
+        release: threading.Event = threading.Event()
+
+        jobs: List[asyncio.Task] = [
+            asyncio.create_task(self.__pool.run(release.wait)) for _ in range(2)
+        ]
+
+        await asyncio.sleep(0)
+
+        self.assertEqual(self.__pool.running, 1)
+
+        self.assertEqual(self.__pool.queued, 1)
+
+        with self.assertRaises(ServerCryptPoolOverloaded):
+            await self.__pool.run(release.wait)
+
+        release.set()
+
+        await asyncio.gather(*jobs)
+
+        metrics: CryptPoolMetricsEntity = self.__pool.metrics
+
+        self.assertEqual(metrics.completed, 2)
+
+        self.assertEqual(metrics.rejected, 1)
+
+        self.assertEqual(metrics.queued, 0)
+
+    async def test_cancelled_job_keeps_its_slot(self) -> None:
+        started: threading.Event = threading.Event()
+
+        release: threading.Event = threading.Event()
+
+        def wait() -> None:
+            started.set()
+
+            release.wait()
+
+        job: asyncio.Task = asyncio.create_task(self.__pool.run(wait))
+
+        await asyncio.to_thread(started.wait)
+
+        job.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await job
+
+        self.assertEqual(self.__pool.running, 1)
+
+        release.set()
+
+        await asyncio.wait_for(self.__wait_idle(), 1)
+
+        self.assertEqual(self.__pool.running, 0)
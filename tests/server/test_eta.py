@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from server.eta import ServerEtaTracker
+from utils.entities import VehicleProgressEntity
+
+
+class ServerEtaTrackerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__tracker: ServerEtaTracker = ServerEtaTracker(
+            smoothing=0.5, default_speed=6, reset_distance=500
+        )
+
+    def test_update(self) -> None:
+        self.__tracker.update("1", 1, 100, 1000)
+
+        progress: VehicleProgressEntity = self.__tracker.update("1", 1, 200, 1010)
+
+        self.assertEqual(progress.progress, 200)
+
+        self.assertEqual(progress.speed, 8)
+
+        self.assertEqual(self.__tracker.find("1"), progress)
+
+    def test_update_ignores_stale_and_backward_fixes(self) -> None:
+        self.__tracker.update("1", 1, 100, 1000)
+
+        self.assertEqual(self.__tracker.update("1", 1, 300, 990).progress, 100)
+
+        progress: VehicleProgressEntity = self.__tracker.update("1", 1, 90, 1010)
+
+        self.assertEqual(progress.progress, 100)
+
+        self.assertEqual(progress.speed, 3)
+
+    def test_update_resets(self) -> None:
+        self.__tracker.update("1", 1, 1000, 1000)
+
+        self.__tracker.update("1", 1, 1100, 1010)
+
+        progress: VehicleProgressEntity = self.__tracker.update("1", 1, 0, 1020)
+
+        self.assertEqual(progress.progress, 0)
+
+        self.assertEqual(progress.speed, 8)
+
+        self.assertEqual(self.__tracker.update("1", 2, 50, 1030).speed, 6)
+
+    def test_remove(self) -> None:
+        self.__tracker.update("1", 1, 100, 1000)
+
+        self.__tracker.remove("1")
+
+        self.assertNotIn("1", self.__tracker)
+
+        self.assertIsNone(self.__tracker.find("1"))
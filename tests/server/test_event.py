@@ -0,0 +1,66 @@
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+import asyncio
+
+from server.event import ServerEventBus
+
+
+class ServerEventBusTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__bus: ServerEventBus[str] = ServerEventBus()
+
+        self.__received: List[str] = []
+
+    async def test_publish(self) -> None:
+        @self.__bus.subscribe("arrival", "departure")
+        def on_event(event: str) -> None:
+            self.__received.append(event)
+
+        async def on_arrival(event: str) -> None:
+            self.__received.append(f"async {event}")
+
+        self.__bus.add_handler("arrival", on_arrival)
+
+        self.assertEqual(self.__bus.publish("arrival", "a"), 2)
+
+        self.assertEqual(self.__bus.publish("departure", "d"), 1)
+
+        self.assertEqual(self.__bus.publish("other", "o"), 0)
+
+        await asyncio.sleep(0)
+
+        self.assertSequenceEqual(self.__received, ["a", "d", "async a"])
+
+        self.__bus.remove_handler("arrival", on_arrival)
+
+        self.assertEqual(self.__bus.publish("arrival", "a"), 1)
+
+    async def test_publish_failure(self) -> None:
+        def on_failure(event: str) -> None:
+            raise ValueError(event)
+
+        self.__bus.add_handler("arrival", on_failure)
+
+        self.__bus.add_handler("arrival", self.__received.append)
+
+        with self.assertLogs(level="ERROR"):
+            self.__bus.publish("arrival", "a")
+
+        self.assertSequenceEqual(self.__received, ["a"])
+
+    async def test_publish_async_failure(self) -> None:
+        async def on_failure(event: str) -> None:
+            raise ValueError(event)
+
+        self.__bus.add_handler("arrival", on_failure)
+
+        with self.assertLogs(level="ERROR") as logs:
+            self.__bus.publish("arrival", "a")
+
+            self.assertEqual(self.__bus.pending, 1)
+
+            await asyncio.sleep(0.01)
+
+        self.assertIn("ValueError: a", logs.output[0])
+
+        self.assertEqual(self.__bus.pending, 0)
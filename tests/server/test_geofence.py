@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from server.geofence import ServerGeofenceTracker
+
+
+class ServerGeofenceTrackerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__tracker: ServerGeofenceTracker = ServerGeofenceTracker()
+
+    def test_update(self) -> None:
+        self.assertEqual(self.__tracker.update("1", 1, []), ([], []))
+
+        self.assertEqual(self.__tracker.update("1", 1, [2]), ([2], []))
+
+        self.assertEqual(self.__tracker.update("1", 1, [2]), ([], []))
+
+        self.assertEqual(self.__tracker.update("1", 1, [2, 3]), ([3], []))
+
+        self.assertEqual(self.__tracker.update("1", 1, [3]), ([], [2]))
+
+        self.assertEqual(self.__tracker.update("1", 1, []), ([], [3]))
+
+        self.assertNotIn("1", self.__tracker)
+
+    def test_update_route_change(self) -> None:
+        self.__tracker.update("1", 1, [2])
+
+        self.assertEqual(self.__tracker.update("1", 2, [2]), ([2], []))
+
+        self.assertEqual(self.__tracker.find("1"), frozenset([2]))
+
+    def test_remove(self) -> None:
+        self.__tracker.update("1", 1, [2])
+
+        self.__tracker.remove("1")
+
+        self.assertEqual(len(self.__tracker), 0)
+
+        self.assertEqual(self.__tracker.find("1"), frozenset())
@@ -0,0 +1,162 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+from types import SimpleNamespace
+import asyncio
+import time
+
+from server.pipeline import ServerPipeline
+
+
+class FakeConsumer:
+    def __init__(
+        self, topic: str, callback: Callable[[Any], None], **kwargs: Any
+    ) -> None:
+        self.topic: str = topic
+
+        self.callback: Callable[[Any], None] = callback
+
+        self.params: Any = kwargs
+
+        self.closed: bool = False
+
+    def poll(self, timeout_ms: int = 0) -> Dict[str, List[Any]]:
+        time.sleep(timeout_ms / 1000)
+
+        return {}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeProducer:
+    def __init__(self, **kwargs: Any) -> None:
+        self.params: Any = kwargs
+
+        self.messages: List[SimpleNamespace] = []
+
+    def partitions_for(self, topic: str) -> Set[int]:
+        return {0}
+
+    def send(self, topic: str, key: Optional[bytes], value: bytes) -> None:
+        self.messages.append(SimpleNamespace(topic=topic, key=key, value=value))
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class ServerPipelineTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__producers: List[FakeProducer] = []
+
+        self.__consumers: List[FakeConsumer] = []
+
+        self.__mock_handler: AsyncMock = AsyncMock()
+
+        self.__pipeline: ServerPipeline = ServerPipeline(
+            topic="positions",
+            group_id="workers",
+            linger_ms=10,
+            producer_factory=self.__create_producer,
+            consumer_factory=self.__create_consumer,
+            poll_timeout=0.01,
+        )
+
+        self.__pipeline.bind(self.__mock_handler)
+
+    def __create_producer(self, **kwargs: Any) -> FakeProducer:
+        producer: FakeProducer = FakeProducer(**kwargs)
+
+        self.__producers.append(producer)
+
+        return producer
+
+    def __create_consumer(
+        self, topic: str, callback: Callable[[Any], None], **kwargs: Any
+    ) -> FakeConsumer:
+        consumer: FakeConsumer = FakeConsumer(topic, callback, **kwargs)
+
+        self.__consumers.append(consumer)
+
+        return consumer
+
+    async def test_publish(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.__pipeline.publish("vehicle-1", b"{}")
+
+        await self.__pipeline.start()
+
+        self.__pipeline.publish("vehicle-1", b"{}")
+
+        producer: FakeProducer = self.__producers[0]
+
+        self.assertEqual(producer.params["linger_ms"], 10)
+
+        self.assertEqual(producer.messages[0].key, b"vehicle-1")
+
+        self.assertEqual(self.__consumers[0].params["group_id"], "workers")
+
+        await self.__pipeline.stop()
+
+    async def test_consume(self) -> None:
+        await self.__pipeline.start()
+
+        consumer: FakeConsumer = self.__consumers[0]
+
+        await asyncio.gather(
+            *[
+                asyncio.to_thread(consumer.callback, SimpleNamespace(value=value))
+                for value in (b"1", b"2", b"3")
+            ]
+        )
+
+        await asyncio.sleep(0)
+
+        handled: List[bytes] = [
+            value
+            for call in self.__mock_handler.await_args_list
+            for value in call.args[0]
+        ]
+
+        self.assertCountEqual(handled, [b"1", b"2", b"3"])
+
+        await self.__pipeline.stop()
+
+    async def test_stop_with_full_queue(self) -> None:
+        async def hang(values: List[bytes]) -> None:
+            await asyncio.sleep(10)
+
+        pipeline: ServerPipeline = ServerPipeline(
+            topic="positions",
+            group_id="workers",
+            max_batch=1,
+            poll_timeout=0.01,
+            producer_factory=self.__create_producer,
+            consumer_factory=self.__create_consumer,
+        )
+
+        pipeline.bind(hang)
+
+        await pipeline.start()
+
+        consumer: FakeConsumer = self.__consumers[0]
+
+        blocked: asyncio.Future = asyncio.gather(
+            *[
+                asyncio.to_thread(consumer.callback, SimpleNamespace(value=b"1"))
+                for _ in range(8)
+            ]
+        )
+
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(blocked.done())
+
+        await asyncio.wait_for(pipeline.stop(), timeout=2)
+
+        await asyncio.wait_for(blocked, timeout=2)
+
+        self.assertTrue(consumer.closed)
@@ -0,0 +1,77 @@
+from typing import List, Optional
+from unittest import TestCase
+
+from server.position import ServerPositionStore
+from utils.entities import VehicleLastPositionEntity
+
+
+class ServerPositionStoreTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__store: ServerPositionStore = ServerPositionStore()
+
+    def test_update(self) -> None:
+        self.assertTrue(self.__store.update("vehicle-1", -28.44, -48.95, 10))
+
+        self.assertTrue(self.__store.update("vehicle-1", -28.45, -48.96, 20))
+
+        self.assertFalse(self.__store.update("vehicle-1", -28.40, -48.90, 15))
+
+        self.assertFalse(self.__store.update("vehicle-1", -28.45, -48.96, 20))
+
+        position: Optional[VehicleLastPositionEntity] = self.__store.find("vehicle-1")
+
+        self.assertIsNotNone(position)
+
+        self.assertEqual(position.latitude, -28.45)
+
+        self.assertEqual(position.ts, 20)
+
+        self.assertEqual(len(self.__store), 1)
+
+    def test_find_many(self) -> None:
+        self.__store.update("vehicle-1", -28.44, -48.95, 10)
+
+        self.__store.update("vehicle-2", -28.45, -48.96, 10)
+
+        positions: List[VehicleLastPositionEntity] = self.__store.find_many(
+            ["vehicle-2", "unknown", "vehicle-1", "vehicle-2"]
+        )
+
+        self.assertSequenceEqual(
+            [position.vehicle_uuid for position in positions],
+            ["vehicle-2", "vehicle-1"],
+        )
+
+    def test_remove(self) -> None:
+        self.__store.update("vehicle-1", -28.44, -48.95, 10)
+
+        self.__store.remove("vehicle-1")
+
+        self.__store.update("vehicle-2", -28.45, -48.96, 10)
+
+        self.assertIsNone(self.__store.find("vehicle-1"))
+
+        self.assertIn("vehicle-2", self.__store)
+
+        self.assertEqual(len(self.__store), 1)
+
+    def test_find_by_company(self) -> None:
+        self.__store.update("vehicle-1", -28.44, -48.95, 10, company_id=1)
+
+        self.__store.update("vehicle-2", -28.45, -48.96, 10, company_id=1)
+
+        self.__store.update("vehicle-3", -28.45, -48.96, 10, company_id=2)
+
+        self.__store.update("vehicle-2", -28.45, -48.96, 20, company_id=2)
+
+        self.__store.remove("vehicle-3")
+
+        self.assertSequenceEqual(
+            [position.vehicle_uuid for position in self.__store.find_by_company(1)],
+            ["vehicle-1"],
+        )
+
+        self.assertSequenceEqual(
+            [position.vehicle_uuid for position in self.__store.find_by_company(2)],
+            ["vehicle-2"],
+        )
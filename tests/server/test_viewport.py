@@ -0,0 +1,71 @@
+from typing import List
+from unittest import TestCase
+
+from server.viewport import ServerViewportIndex
+from utils.entities import ViewportBodyEntity
+
+
+class ServerViewportIndexTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__index: ServerViewportIndex[str] = ServerViewportIndex(
+            topic_prefix="vehicle:", cell_size=0.1, max_cells=100
+        )
+
+        self.__viewport: ViewportBodyEntity = ViewportBodyEntity(
+            min_latitude=-28.5,
+            min_longitude=-49.0,
+            max_latitude=-28.3,
+            max_longitude=-48.8,
+        )
+
+        self.__wide_viewport: ViewportBodyEntity = ViewportBodyEntity(
+            min_latitude=-30,
+            min_longitude=-50,
+            max_latitude=-20,
+            max_longitude=-40,
+        )
+
+    def __route(self, latitude: float, longitude: float) -> List[str]:
+        return sorted(
+            self.__index.route(
+                "vehicle:1",
+                {"vehicle_uuid": "1", "latitude": latitude, "longitude": longitude},
+            )
+        )
+
+    def test_route(self) -> None:
+        self.__index.subscribe("map", self.__viewport)
+
+        self.__index.subscribe("country", self.__wide_viewport)
+
+        self.assertSequenceEqual(self.__route(-28.4, -48.9), ["country", "map"])
+
+        self.assertSequenceEqual(self.__route(-25.0, -45.0), ["country"])
+
+        self.assertSequenceEqual(self.__route(10.0, 10.0), [])
+
+    def test_subscribe_update(self) -> None:
+        self.__index.subscribe("map", self.__wide_viewport)
+
+        self.__index.subscribe("map", self.__viewport)
+
+        self.assertSequenceEqual(self.__route(-25.0, -45.0), [])
+
+        self.__index.remove("map")
+
+        self.assertSequenceEqual(self.__route(-28.4, -48.9), [])
+
+        self.assertEqual(len(self.__index), 0)
+
+    def test_find_vehicles(self) -> None:
+        self.__route(-28.4, -48.9)
+
+        self.assertSequenceEqual(self.__index.find_vehicles(self.__viewport), ["1"])
+
+        self.__route(-25.0, -45.0)
+
+        self.assertSequenceEqual(self.__index.find_vehicles(self.__viewport), [])
+
+        self.assertSequenceEqual(
+            self.__index.find_vehicles(self.__wide_viewport), ["1"]
+        )
@@ -0,0 +1,105 @@
+from typing import Any, List
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+import asyncio
+import json
+
+from server.websocket import ServerWebSocketConnection
+from utils.types import WebSocketOverflowPolicy
+
+
+class ServerWebSocketConnectionTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__mock_websocket: AsyncMock = AsyncMock()
+
+        self.__mock_on_close: AsyncMock = AsyncMock()
+
+    def __create_connection(
+        self, overflow_policy: WebSocketOverflowPolicy
+    ) -> ServerWebSocketConnection:
+        return ServerWebSocketConnection(
+            self.__mock_websocket,
+            on_close=self.__mock_on_close,
+            max_queue_size=2,
+            overflow_policy=overflow_policy,
+        )
+
+    def __get_sent_datas(self) -> List[Any]:
+        return [
+            json.loads(call.args[0])
+            for call in self.__mock_websocket.send_text.await_args_list
+        ]
+
+    async def test_send(self) -> None:
+        connection: ServerWebSocketConnection = self.__create_connection(
+            WebSocketOverflowPolicy.DROP_OLDEST
+        )
+
+        connection.start()
+
+        connection.send_json({"index": 1})
+
+        connection.send_json({"index": 2})
+
+        await asyncio.sleep(0)
+
+        self.assertSequenceEqual(self.__get_sent_datas(), [{"index": 1}, {"index": 2}])
+
+        self.assertEqual(connection.pending, 0)
+
+        connection.stop()
+
+    async def test_send_with_drop_oldest(self) -> None:
+        connection: ServerWebSocketConnection = self.__create_connection(
+            WebSocketOverflowPolicy.DROP_OLDEST
+        )
+
+        for index in range(4):
+            connection.send_json({"index": index}, key="vehicle")
+
+        connection.start()
+
+        await asyncio.sleep(0)
+
+        self.assertSequenceEqual(self.__get_sent_datas(), [{"index": 2}, {"index": 3}])
+
+        self.assertEqual(connection.dropped, 2)
+
+        connection.stop()
+
+    async def test_send_with_coalesce(self) -> None:
+        connection: ServerWebSocketConnection = self.__create_connection(
+            WebSocketOverflowPolicy.COALESCE
+        )
+
+        for index in range(4):
+            connection.send_json({"index": index}, key="vehicle-1")
+
+        connection.send_json({"index": 10}, key="vehicle-2")
+
+        connection.start()
+
+        await asyncio.sleep(0)
+
+        self.assertSequenceEqual(self.__get_sent_datas(), [{"index": 3}, {"index": 10}])
+
+        self.assertEqual(connection.dropped, 0)
+
+        connection.stop()
+
+    async def test_send_with_disconnect(self) -> None:
+        connection: ServerWebSocketConnection = self.__create_connection(
+            WebSocketOverflowPolicy.DISCONNECT
+        )
+
+        results: List[bool] = [
+            connection.send_json({"index": index}) for index in range(3)
+        ]
+
+        await asyncio.sleep(0)
+
+        self.assertSequenceEqual(results, [True, True, False])
+
+        self.assertTrue(connection.closed)
+
+        self.__mock_on_close.assert_awaited_once_with(self.__mock_websocket)
@@ -0,0 +1,73 @@
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+import asyncio
+
+from server.wheel import ServerTimerWheel
+
+
+class ServerTimerWheelTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__expired: List[str] = []
+
+        self.__wheel: ServerTimerWheel[str] = ServerTimerWheel(
+            tick=1, slots=4, callback=self.__expired.append
+        )
+
+    def test_advance(self) -> None:
+        self.__wheel.schedule("a", 1)
+
+        self.__wheel.schedule("b", 2.5)
+
+        self.__wheel.schedule("c", 10)
+
+        self.assertEqual(self.__wheel.advance(), 1)
+
+        self.assertEqual(self.__wheel.advance(), 0)
+
+        self.assertEqual(self.__wheel.advance(), 1)
+
+        self.assertSequenceEqual(self.__expired, ["a", "b"])
+
+        for _ in range(6):
+            self.__wheel.advance()
+
+        self.assertSequenceEqual(self.__expired, ["a", "b"])
+
+        self.__wheel.advance()
+
+        self.assertSequenceEqual(self.__expired, ["a", "b", "c"])
+
+        self.assertEqual(len(self.__wheel), 0)
+
+    def test_reschedule_and_cancel(self) -> None:
+        self.__wheel.schedule("a", 1)
+
+        self.__wheel.schedule("a", 3)
+
+        self.__wheel.schedule("b", 1)
+
+        self.__wheel.cancel("b")
+
+        self.assertNotIn("b", self.__wheel)
+
+        for _ in range(3):
+            self.__wheel.advance()
+
+        self.assertSequenceEqual(self.__expired, ["a"])
+
+    async def test_start(self) -> None:
+        wheel: ServerTimerWheel[str] = ServerTimerWheel(tick=0.01, slots=8)
+
+        wheel.bind(self.__expired.append)
+
+        wheel.schedule("a", 0.02)
+
+        await wheel.start()
+
+        await asyncio.sleep(0.1)
+
+        await wheel.stop()
+
+        self.assertSequenceEqual(self.__expired, ["a"])
+
+        self.assertFalse(wheel.running)
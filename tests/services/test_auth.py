@@ -4,18 +4,25 @@ from unittest.mock import AsyncMock, Mock, patch
 import logging
 
 
-from services.auth import AuthService
-from services.agent import AgentService
+from services.auth import (
+    AuthService,
+    AgentPrincipal,
+    login_email_buckets,
+    login_address_buckets,
+)
+from services.agent import AgentService, agent_cache
 from models import database, Agent, Company
 from repositories.agent import AgentRepository
 from utils.crypt import CryptUtils
+from utils.entities import AgentTokenDataEntity
 from utils.exceptions import (
     UserNotFound,
     InvalidUserPassword,
     InvalidToken,
     ModelNotFound,
+    TooManyLoginAttempts,
 )
-from utils.types import DictType
+from utils.types import DictType, AuthPrincipalType
 
 
 class AuthServiceTestCase(IsolatedAsyncioTestCase):
@@ -40,6 +47,8 @@ class AuthServiceTestCase(IsolatedAsyncioTestCase):
             email="victorhenrich993@gmail.com",
             password="00000000",
             uuid="6df97b7d-2beb-4d60-ae75-b742ac3df111",
+            id=1,
+            company_id=1,
             company=self.__mock_company,
             spec=Agent,
         )
@@ -50,6 +59,19 @@ class AuthServiceTestCase(IsolatedAsyncioTestCase):
 
         self.__mock_agent_service.find.find_agent = self.__mock_agent
 
+        agent_cache.clear()
+
+        login_email_buckets.clear()
+
+        login_address_buckets.clear()
+
+    def tearDown(self) -> None:
+        agent_cache.clear()
+
+        login_email_buckets.clear()
+
+        login_address_buckets.clear()
+
     @patch("services.auth.database", spec=database)
     @patch("services.auth.AgentRepository", spec=AgentRepository)
     async def test_auth_agent(
@@ -278,3 +300,125 @@ class AuthServiceTestCase(IsolatedAsyncioTestCase):
         mock_crypt_utils_class.Jwt.decode_token.assert_called_once()
 
         mock_crypt_utils_class.Jwt.create_token.assert_not_called()
+
+    @patch.object(AgentService, "find_agent", new_callable=AsyncMock)
+    async def test_get_agent_data_in_token_uses_cache(
+        self, mock_find_agent: AsyncMock
+    ) -> None:
+        mock_find_agent.return_value = self.__mock_agent
+
+        token: str = CryptUtils.Jwt.create_token(
+            user_uuid=self.__mock_agent.uuid,
+            company_uuid=self.__mock_company.uuid,
+            expiration_minute=5,
+            is_refresh=False,
+            entity_class=AgentTokenDataEntity,
+        )
+
+        auth_service: AuthService = AuthService()
+
+        for _ in range(3):
+            agent: Agent = await auth_service.get_agent_data_in_token(f"Bearer {token}")
+
+            self.assertIs(agent, self.__mock_agent)
+
+        mock_find_agent.assert_awaited_once_with(self.__mock_agent.uuid)
+
+        AgentService().invalidate_agent(self.__mock_agent.uuid)
+
+        await auth_service.get_agent_data_in_token(f"Bearer {token}")
+
+        self.assertEqual(mock_find_agent.await_count, 2)
+
+    @patch.object(AgentService, "find_agent", new_callable=AsyncMock)
+    async def test_get_agent_principal_from_claims(
+        self, mock_find_agent: AsyncMock
+    ) -> None:
+        mock_find_agent.return_value = self.__mock_agent
+
+        token: str = CryptUtils.Jwt.create_token(
+            user_uuid=self.__mock_agent.uuid,
+            company_uuid=self.__mock_company.uuid,
+            agent_id=7,
+            company_id=3,
+            expiration_minute=5,
+            is_refresh=False,
+            entity_class=AgentTokenDataEntity,
+        )
+
+        auth_service: AuthService = AuthService()
+
+        principal: AgentPrincipal = await auth_service.get_agent_principal(
+            f"Bearer {token}", mode=AuthPrincipalType.CLAIMS
+        )
+
+        self.assertEqual(principal.uuid, self.__mock_agent.uuid)
+
+        self.assertEqual(principal.company_uuid, self.__mock_company.uuid)
+
+        self.assertEqual(await principal.get_id(), 7)
+
+        self.assertEqual(await principal.get_company_id(), 3)
+
+        mock_find_agent.assert_not_awaited()
+
+        self.assertIs(await principal.get_company(), self.__mock_company)
+
+        mock_find_agent.assert_awaited_once()
+
+    @patch.object(AgentService, "find_agent", new_callable=AsyncMock)
+    async def test_get_agent_principal_without_id_claims(
+        self, mock_find_agent: AsyncMock
+    ) -> None:
+        mock_find_agent.return_value = self.__mock_agent
+
+        token: str = CryptUtils.Jwt.create_token(
+            user_uuid=self.__mock_agent.uuid,
+            company_uuid=self.__mock_company.uuid,
+            expiration_minute=5,
+            is_refresh=False,
+            entity_class=AgentTokenDataEntity,
+        )
+
+        auth_service: AuthService = AuthService()
+
+        principal: AgentPrincipal = await auth_service.get_agent_principal(
+            token, mode=AuthPrincipalType.MODEL
+        )
+
+        mock_find_agent.assert_awaited_once()
+
+        self.assertEqual(await principal.get_company_id(), 1)
+
+        mock_find_agent.assert_awaited_once()
+
+    @patch("services.auth.database", spec=database)
+    @patch("services.auth.AgentRepository", spec=AgentRepository)
+    async def test_auth_agent_throttled(
+        self,
+        mock_agent_repository_class: Mock,
+        mock_database_instance: Mock,
+    ) -> None:
+        mock_database_instance.create_async_session.return_value = (
+            self.__mock_async_session
+        )
+
+        mock_agent_repository_class.return_value = self.__mock_agent_repository
+
+        auth_service: AuthService = AuthService()
+
+        with self.assertRaises(TooManyLoginAttempts) as context:
+            for _ in range(100):
+                await auth_service.auth_agent(
+                    email=self.__mock_agent.email, password="", client_host="10.0.0.1"
+                )
+
+        self.assertEqual(context.exception.status_code, 429)
+
+        attempts: int = self.__mock_agent_repository.auth.await_count
+
+        self.assertGreater(attempts, 0)
+
+        self.assertEqual(
+            mock_database_instance.create_async_session.call_count, attempts
+        )
@@ -0,0 +1,87 @@
+from typing import Dict
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from models import Vehicle
+from repositories.vehicle import VehicleRepository
+from services.vehicle import VehicleService, vehicle_cache
+from utils.entities import VehicleIdentityEntity
+
+
+class VehicleServiceTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        vehicle_cache.clear()
+
+        self.__mock_async_session: AsyncMock = AsyncMock()
+
+        self.__mock_async_session.__aenter__.side_effect = (
+            lambda: self.__mock_async_session
+        )
+
+        self.__mock_vehicle: Mock = Mock(
+            id=1,
+            uuid="6df97b7d-2beb-4d60-ae75-b742ac3df111",
+            company_id=2,
+            route_id=None,
+            spec=Vehicle,
+        )
+
+        self.__mock_vehicle_repository_instance: AsyncMock = AsyncMock()
+
+        self.__mock_vehicle_repository_instance.find_many.return_value = [
+            self.__mock_vehicle
+        ]
+
+    def tearDown(self) -> None:
+        vehicle_cache.clear()
+
+    @patch("services.vehicle.database")
+    @patch("services.vehicle.VehicleRepository", spec=VehicleRepository)
+    async def test_find_vehicle_identities(
+        self, mock_vehicle_repository_class: Mock, mock_database: Mock
+    ) -> None:
+        mock_database.create_async_session.return_value = self.__mock_async_session
+
+        mock_vehicle_repository_class.return_value = (
+            self.__mock_vehicle_repository_instance
+        )
+
+        vehicle_service: VehicleService = VehicleService()
+
+        for _ in range(3):
+            identities: Dict[str, VehicleIdentityEntity] = (
+                await vehicle_service.find_vehicle_identities(
+                    [self.__mock_vehicle.uuid, "unknown"]
+                )
+            )
+
+        self.__mock_vehicle_repository_instance.find_many.assert_awaited_once()
+
+        mock_database.create_async_session.assert_called_once()
+
+        self.assertEqual(list(identities), [self.__mock_vehicle.uuid])
+
+        self.assertEqual(identities[self.__mock_vehicle.uuid].company_id, 2)
+
+    @patch("services.vehicle.database")
+    @patch("services.vehicle.VehicleRepository", spec=VehicleRepository)
+    async def test_invalidate_vehicle(
+        self, mock_vehicle_repository_class: Mock, mock_database: Mock
+    ) -> None:
+        mock_database.create_async_session.return_value = self.__mock_async_session
+
+        mock_vehicle_repository_class.return_value = (
+            self.__mock_vehicle_repository_instance
+        )
+
+        vehicle_service: VehicleService = VehicleService()
+
+        await vehicle_service.find_vehicle_identities([self.__mock_vehicle.uuid])
+
+        vehicle_service.invalidate_vehicle(self.__mock_vehicle.uuid)
+
+        await vehicle_service.find_vehicle_identities([self.__mock_vehicle.uuid])
+
+        self.assertEqual(
+            self.__mock_vehicle_repository_instance.find_many.await_count, 2
+        )
@@ -0,0 +1,88 @@
+from typing import Optional
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, Mock, patch
+import time
+
+from services.route_matching import RouteMatchingService
+from services.vehicle_eta import VehicleEtaService, vehicle_eta_cache
+from utils.entities import VehicleEtaEntity, VehicleProgressEntity
+from utils.geo import RouteGeometry
+
+
+class VehicleEtaServiceTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        vehicle_eta_cache.clear()
+
+        self.__geometry: RouteGeometry = RouteGeometry(
+            [(-28.0, -48.0), (-28.0, -47.99), (-27.99, -47.99)],
+            cell_size=100,
+            stops=["a", "b", "c"],
+        )
+
+        self.__mock_route_matching_service_instance: AsyncMock = AsyncMock()
+
+        self.__mock_route_matching_service_instance.find_route_geometries.return_value = {
+            1: self.__geometry
+        }
+
+    @patch("services.vehicle_eta.ServerInstances")
+    @patch("services.vehicle_eta.RouteMatchingService", spec=RouteMatchingService)
+    async def test_find_vehicle_eta(
+        self, mock_route_matching_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_route_matching_service_class.return_value = (
+            self.__mock_route_matching_service_instance
+        )
+
+        ts: float = time.time()
+
+        mock_server_instances.vehicle_etas.find.return_value = VehicleProgressEntity(
+            route_id=1, progress=500, speed=10, ts=ts
+        )
+
+        vehicle_eta_service: VehicleEtaService = VehicleEtaService()
+
+        eta: Optional[VehicleEtaEntity] = await vehicle_eta_service.find_vehicle_eta(
+            "1"
+        )
+
+        self.assertSequenceEqual([stop.point_uuid for stop in eta.stops], ["b", "c"])
+
+        self.assertAlmostEqual(
+            eta.stops[0].eta, ts + (self.__geometry.offsets[1] - 500) / 10
+        )
+
+        self.assertLess(eta.stops[0].eta, eta.stops[1].eta)
+
+        await vehicle_eta_service.find_vehicle_eta("1")
+
+        mock_server_instances.vehicle_etas.find.assert_called_once()
+
+    @patch("services.vehicle_eta.ServerInstances")
+    async def test_find_untracked_vehicle_eta(
+        self, mock_server_instances: Mock
+    ) -> None:
+        mock_server_instances.vehicle_etas.find.return_value = None
+
+        vehicle_eta_service: VehicleEtaService = VehicleEtaService()
+
+        self.assertIsNone(await vehicle_eta_service.find_vehicle_eta("1"))
+
+    @patch("services.vehicle_eta.ServerInstances")
+    @patch("services.vehicle_eta.RouteMatchingService", spec=RouteMatchingService)
+    async def test_find_stale_vehicle_eta(
+        self, mock_route_matching_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_route_matching_service_class.return_value = (
+            self.__mock_route_matching_service_instance
+        )
+
+        mock_server_instances.vehicle_etas.find.return_value = VehicleProgressEntity(
+            route_id=1, progress=500, speed=10, ts=time.time() - 3600
+        )
+
+        vehicle_eta_service: VehicleEtaService = VehicleEtaService()
+
+        self.assertIsNone(await vehicle_eta_service.find_vehicle_eta("1"))
+
+        self.__mock_route_matching_service_instance.find_route_geometries.assert_not_awaited()
@@ -0,0 +1,262 @@
+from typing import Sequence
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime, UTC
+from pydantic import ValidationError
+
+from server.position import ServerPositionStore
+
+from services.vehicle import VehicleService
+from services.vehicle_events import (
+    VehicleEventsService,
+    vehicle_broadcast_throttle,
+    fleet_changes,
+    on_vehicle_deleted,
+)
+from utils.entities import VehiclePositionItemEntity, VehicleIdentityEntity
+from utils.exceptions import ModelNotFound
+
+
+class VehicleEventsServiceTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        vehicle_broadcast_throttle.clear()
+
+        fleet_changes.clear()
+
+        self.__vehicle_uuid: str = "6df97b7d-2beb-4d60-ae75-b742ac3df111"
+
+        self.__vehicle_identity: VehicleIdentityEntity = VehicleIdentityEntity(
+            uuid=self.__vehicle_uuid, id=1, company_id=1
+        )
+
+        self.__mock_vehicle_service_instance: AsyncMock = AsyncMock()
+
+        self.__mock_vehicle_service_instance.find_vehicle_identities.return_value = {
+            self.__vehicle_uuid: self.__vehicle_identity
+        }
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_process_vehicle_positions(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        positions: Sequence[VehiclePositionItemEntity] = [
+            VehiclePositionItemEntity(
+                vehicle_uuid=self.__vehicle_uuid, latitude=-28.44, longitude=-48.95
+            ),
+            VehiclePositionItemEntity(
+                vehicle_uuid=self.__vehicle_uuid, latitude=-28.45, longitude=-48.96
+            ),
+            VehiclePositionItemEntity(
+                vehicle_uuid="unknown", latitude=-28.45, longitude=-48.96
+            ),
+        ]
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        rejected: Sequence[str] = (
+            await vehicle_events_service.process_vehicle_positions(positions)
+        )
+
+        self.__mock_vehicle_service_instance.find_vehicle_identities.assert_awaited_once()
+
+        mock_server_instances.general_api.broadcast.assert_called_once()
+
+        self.assertEqual(vehicle_broadcast_throttle.pending, 1)
+
+        self.assertEqual(
+            mock_server_instances.vehicle_positions_history.add.call_count, 2
+        )
+
+        self.assertEqual(mock_server_instances.vehicle_positions.update.call_count, 2)
+
+        self.assertSequenceEqual(rejected, ["unknown"])
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_process_late_vehicle_positions(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        mock_server_instances.vehicle_positions.update.return_value = False
+
+        positions: Sequence[VehiclePositionItemEntity] = [
+            VehiclePositionItemEntity(
+                vehicle_uuid=self.__vehicle_uuid,
+                latitude=-28.44,
+                longitude=-48.95,
+                ts=datetime(2024, 1, 1, tzinfo=UTC),
+            ),
+        ]
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        await vehicle_events_service.process_vehicle_positions(positions)
+
+        mock_server_instances.vehicle_positions_history.add.assert_called_once()
+
+        mock_server_instances.general_api.broadcast.assert_not_called()
+
+        self.assertEqual(vehicle_broadcast_throttle.pending, 0)
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_future_position_does_not_block_later_positions(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        mock_server_instances.vehicle_positions = ServerPositionStore()
+
+        with self.assertRaises(ValidationError):
+            VehiclePositionItemEntity(
+                vehicle_uuid=self.__vehicle_uuid,
+                latitude=-28.44,
+                longitude=-48.95,
+                ts=datetime(2999, 1, 1, tzinfo=UTC),
+            )
+
+        positions: Sequence[VehiclePositionItemEntity] = [
+            VehiclePositionItemEntity(
+                vehicle_uuid=self.__vehicle_uuid,
+                latitude=-28.45,
+                longitude=-48.96,
+                ts=datetime.now(UTC),
+            ),
+        ]
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        await vehicle_events_service.process_vehicle_positions(positions)
+
+        self.assertEqual(
+            mock_server_instances.vehicle_positions.find_slot(self.__vehicle_uuid)[:2],
+            (-28.45, -48.96),
+        )
+
+    @patch("services.vehicle_events.ServerInstances")
+    async def test_vehicle_deleted(self, mock_server_instances: Mock) -> None:
+        vehicle_broadcast_throttle.push(self.__vehicle_uuid, {})
+
+        vehicle_broadcast_throttle.push(self.__vehicle_uuid, {})
+
+        fleet_changes[1] = {self.__vehicle_uuid}
+
+        on_vehicle_deleted(None, None, Mock(uuid=self.__vehicle_uuid, company_id=1))
+
+        self.assertEqual(vehicle_broadcast_throttle.pending, 0)
+
+        self.assertEqual(fleet_changes[1], set())
+
+        mock_server_instances.vehicle_positions.remove.assert_called_once_with(
+            self.__vehicle_uuid
+        )
+
+        mock_server_instances.vehicle_etas.remove.assert_called_once_with(
+            self.__vehicle_uuid
+        )
+
+        mock_server_instances.vehicle_geofences.remove.assert_called_once_with(
+            self.__vehicle_uuid
+        )
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_capture_vehicle_position_with_vehicle_not_found(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        self.__mock_vehicle_service_instance.find_vehicle_identities.return_value = {}
+
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        with self.assertRaises(ModelNotFound):
+            vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+            await vehicle_events_service.capture_vehicle_position(
+                vehicle_uuid=self.__vehicle_uuid, latitude=0, longitude=0
+            )
+
+        mock_server_instances.general_api.broadcast.assert_not_called()
+
+    @patch("services.vehicle_events.VEHICLE_POSITIONS_PIPELINE", "kafka")
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_capture_vehicle_positions_with_kafka_pipeline(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        rejected: Sequence[str] = (
+            await vehicle_events_service.capture_vehicle_positions(
+                [
+                    VehiclePositionItemEntity(
+                        vehicle_uuid=self.__vehicle_uuid,
+                        latitude=-28.44,
+                        longitude=-48.95,
+                    )
+                ]
+            )
+        )
+
+        mock_server_instances.vehicle_positions_pipeline.publish.assert_called_once()
+
+        self.__mock_vehicle_service_instance.find_vehicle_identities.assert_not_awaited()
+
+        self.assertSequenceEqual(rejected, [])
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_process_published_positions(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        await vehicle_events_service.process_published_positions(
+            [
+                f'{{"vehicle_uuid": "{self.__vehicle_uuid}", "latitude": -28.44, '
+                f'"longitude": -48.95, "ts": 1718000000.0}}'.encode(),
+                b"invalid",
+            ]
+        )
+
+        mock_server_instances.general_api.broadcast.assert_called_once()
+
+    @patch("services.vehicle_events.ServerInstances")
+    @patch("services.vehicle_events.VehicleService", spec=VehicleService)
+    async def test_broadcast_fleet_changes(
+        self, mock_vehicle_service_class: Mock, mock_server_instances: Mock
+    ) -> None:
+        mock_vehicle_service_class.return_value = self.__mock_vehicle_service_instance
+
+        mock_server_instances.vehicle_positions.update.return_value = True
+
+        mock_server_instances.vehicle_positions.find_many.return_value = []
+
+        vehicle_events_service: VehicleEventsService = VehicleEventsService()
+
+        await vehicle_events_service.process_vehicle_positions(
+            [
+                VehiclePositionItemEntity(
+                    vehicle_uuid=self.__vehicle_uuid, latitude=-28.44, longitude=-48.95
+                )
+            ]
+        )
+
+        self.assertEqual(vehicle_events_service.broadcast_fleet_changes(), 1)
+
+        self.assertEqual(vehicle_events_service.broadcast_fleet_changes(), 0)
+
+        mock_server_instances.vehicle_positions.find_many.assert_called_once_with(
+            {self.__vehicle_uuid}
+        )
+
+        mock_server_instances.general_api.broadcast.assert_called_with(
+            "company:1", {"type": "delta", "positions": []}
+        )
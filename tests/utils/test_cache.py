@@ -0,0 +1,56 @@
+from typing import Optional, Tuple
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from utils.cache import TTLCache
+
+
+class TTLCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10, negative_ttl=1)
+
+    def test_lookup(self) -> None:
+        self.__cache.set("a", 1)
+
+        self.__cache.set_missing("b")
+
+        self.assertEqual(self.__cache.lookup("a"), (True, 1))
+
+        self.assertEqual(self.__cache.lookup("b"), (True, None))
+
+        self.assertEqual(self.__cache.lookup("c"), (False, None))
+
+    def test_evict_least_recently_used(self) -> None:
+        self.__cache.set("a", 1)
+
+        self.__cache.set("b", 2)
+
+        self.__cache.get("a")
+
+        self.__cache.set("c", 3)
+
+        self.assertEqual(len(self.__cache), 2)
+
+        self.assertEqual(self.__cache.lookup("b"), (False, None))
+
+        self.assertEqual(self.__cache.get("a"), 1)
+
+    @patch("utils.cache.time")
+    def test_expiration(self, mock_time: Mock) -> None:
+        mock_time.monotonic.return_value = 100
+
+        self.__cache.set("a", 1)
+
+        self.__cache.set_missing("b")
+
+        mock_time.monotonic.return_value = 105
+
+        self.assertEqual(self.__cache.lookup("b"), (False, None))
+
+        self.assertEqual(self.__cache.get("a"), 1)
+
+        mock_time.monotonic.return_value = 111
+
+        result: Tuple[bool, Optional[int]] = self.__cache.lookup("a")
+
+        self.assertEqual(result, (False, None))
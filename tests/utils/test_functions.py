@@ -0,0 +1,100 @@
+from typing import List, Pattern
+from unittest import TestCase
+from unittest.mock import AsyncMock
+from fastapi import WebSocket
+from pydantic import ValidationError
+
+from utils.entities import VehiclePositionItemEntity
+from utils.functions import (
+    compile_route_prefixes,
+    get_websocket_token,
+    handle_vehicle_positions_body,
+)
+
+
+class CompileRoutePrefixesTestCase(TestCase):
+    def test_matches_prefixes(self) -> None:
+        routes: Pattern[str] = compile_route_prefixes(("/docs", "/redoc", "/auth"))
+
+        for path in ("/auth", "/auth/", "/auth/refresh", "/docs/oauth2-redirect"):
+            self.assertIsNotNone(routes.match(path), path)
+
+        for path in ("/authors", "/profile", "/profile/auth", "/", ""):
+            self.assertIsNone(routes.match(path), path)
+
+    def test_empty_routes(self) -> None:
+        routes: Pattern[str] = compile_route_prefixes(("", "/"))
+
+        self.assertIsNone(routes.match("/"))
+
+        self.assertIsNone(routes.match("/auth"))
+
+
+class GetWebSocketTokenTestCase(TestCase):
+    def __create_websocket(self, query_string: bytes, headers: List) -> WebSocket:
+        return WebSocket(
+            {
+                "type": "websocket",
+                "path": "/",
+                "query_string": query_string,
+                "headers": headers,
+            },
+            AsyncMock(),
+            AsyncMock(),
+        )
+
+    def test_reads_header_then_query(self) -> None:
+        self.assertEqual(
+            get_websocket_token(
+                self.__create_websocket(
+                    b"token=query", [(b"authorization", b"Bearer header")]
+                )
+            ),
+            "Bearer header",
+        )
+
+        self.assertEqual(
+            get_websocket_token(self.__create_websocket(b"token=query", [])), "query"
+        )
+
+        self.assertEqual(get_websocket_token(self.__create_websocket(b"", [])), "")
+
+
+class HandleVehiclePositionsBodyTestCase(TestCase):
+    def test_coerces_coordinates(self) -> None:
+        positions: List[VehiclePositionItemEntity] = handle_vehicle_positions_body(
+            b'[{"vehicle_uuid": "1", "latitude": "-28.4", "longitude": -48.9}]'
+        )
+
+        self.assertEqual(positions[0].latitude, -28.4)
+
+        self.assertEqual(positions[0].longitude, -48.9)
+
+    def test_rejects_invalid_coordinates(self) -> None:
+        for latitude, longitude in (
+            ('"abc"', "0"),
+            ('"-28,4"', "0"),
+            ("91", "0"),
+            ("0", "-180.5"),
+        ):
+            body: bytes = (
+                f'[{{"vehicle_uuid": "1", "latitude": {latitude},'
+                f' "longitude": {longitude}}}]'
+            ).encode()
+
+            with self.assertRaises(ValidationError, msg=body):
+                handle_vehicle_positions_body(body)
+
+    def test_rejects_timestamp_before_epoch(self) -> None:
+        with self.assertRaises(ValidationError):
+            handle_vehicle_positions_body(
+                b'[{"vehicle_uuid": "1", "latitude": 0, "longitude": 0,'
+                b' "ts": "1969-12-31T23:59:59Z"}]'
+            )
+
+    def test_rejects_timestamp_in_the_future(self) -> None:
+        with self.assertRaises(ValidationError):
+            handle_vehicle_positions_body(
+                b'[{"vehicle_uuid": "1", "latitude": 0, "longitude": 0,'
+                b' "ts": "2999-01-01T00:00:00Z"}]'
+            )
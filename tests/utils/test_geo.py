@@ -0,0 +1,126 @@
+from typing import List, Optional, Tuple
+from unittest import TestCase
+
+from utils.geo import RouteGeometry, TrackSimplifier
+from utils.entities import RouteMatchEntity
+
+
+class TrackSimplifierTestCase(TestCase):
+    def __simplify(
+        self, points: List[Tuple[float, float]], tolerance: float
+    ) -> List[int]:
+        simplifier: TrackSimplifier[int] = TrackSimplifier(tolerance)
+
+        kept: List[int] = []
+
+        for index, (latitude, longitude) in enumerate(points):
+            item: Optional[int] = simplifier.push(latitude, longitude, index)
+
+            if item is not None:
+                kept.append(item)
+
+        last: Optional[int] = simplifier.finish()
+
+        if last is not None:
+            kept.append(last)
+
+        return kept
+
+    def test_simplify_straight_line(self) -> None:
+        points: List[Tuple[float, float]] = [
+            (-28.0 + index * 0.001, -48.0) for index in range(100)
+        ]
+
+        self.assertSequenceEqual(self.__simplify(points, tolerance=5), [0, 99])
+
+    def test_simplify_corner(self) -> None:
+        points: List[Tuple[float, float]] = [
+            *[(-28.0 + index * 0.001, -48.0) for index in range(10)],
+            *[(-27.991, -48.0 + index * 0.001) for index in range(1, 10)],
+        ]
+
+        self.assertSequenceEqual(self.__simplify(points, tolerance=5), [0, 9, 18])
+
+    def test_simplify_without_tolerance(self) -> None:
+        points: List[Tuple[float, float]] = [
+            (-28.0, -48.0 + index) for index in range(5)
+        ]
+
+        self.assertSequenceEqual(self.__simplify(points, tolerance=0), [0, 1, 2, 3, 4])
+
+
+class RouteGeometryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.__geometry: RouteGeometry = RouteGeometry(
+            [(-28.0, -48.0), (-28.0, -47.99), (-27.99, -47.99)], cell_size=100
+        )
+
+    def test_length(self) -> None:
+        self.assertEqual(self.__geometry.segments, 2)
+
+        self.assertAlmostEqual(self.__geometry.length, 2094, delta=5)
+
+    def test_match(self) -> None:
+        match: Optional[RouteMatchEntity] = self.__geometry.match(
+            -28.0002, -47.995, max_distance=50
+        )
+
+        self.assertIsNotNone(match)
+
+        self.assertEqual(match.segment, 0)
+
+        self.assertAlmostEqual(match.latitude, -28.0, places=6)
+
+        self.assertAlmostEqual(match.distance, 22.2, delta=0.5)
+
+        self.assertAlmostEqual(match.progress, 491, delta=1)
+
+    def test_match_second_segment(self) -> None:
+        match: Optional[RouteMatchEntity] = self.__geometry.match(
+            -27.995, -47.9899, max_distance=50
+        )
+
+        self.assertEqual(match.segment, 1)
+
+        self.assertAlmostEqual(match.longitude, -47.99, places=6)
+
+        self.assertGreater(match.progress, 1400)
+
+    def test_match_out_and_back(self) -> None:
+        geometry: RouteGeometry = RouteGeometry(
+            [(-28.0, -48.0), (-28.0, -47.99), (-28.0, -48.0)], cell_size=100
+        )
+
+        outbound: Optional[RouteMatchEntity] = geometry.match(
+            -28.0001, -47.995, max_distance=50, previous_progress=400
+        )
+
+        inbound: Optional[RouteMatchEntity] = geometry.match(
+            -28.0001, -47.995, max_distance=50, previous_progress=1400
+        )
+
+        self.assertEqual(outbound.segment, 0)
+
+        self.assertAlmostEqual(outbound.progress, 491, delta=1)
+
+        self.assertEqual(inbound.segment, 1)
+
+        self.assertAlmostEqual(inbound.progress, 1473, delta=1)
+
+    def test_match_out_of_route(self) -> None:
+        self.assertIsNone(self.__geometry.match(-28.01, -48.0, max_distance=50))
+
+        self.assertIsNone(RouteGeometry([], cell_size=100).match(0, 0, 50))
+
+    def test_find_stops(self) -> None:
+        self.assertSequenceEqual(
+            self.__geometry.find_stops(-28.0001, -47.9901, 970, 50, 100), [1]
+        )
+
+        self.assertSequenceEqual(
+            self.__geometry.find_stops(-28.0001, -47.995, 490, 50, 100), []
+        )
+
+        self.assertSequenceEqual(
+            self.__geometry.find_stops(-28.0001, -47.9901, 0, 50, 100), []
+        )
@@ -0,0 +1,142 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, call
+import asyncio
+import time
+
+from utils.throttle import KeyedThrottle, KeyedTokenBucket, ConcurrencyGate
+
+
+class KeyedThrottleTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__mock_callback: Mock = Mock()
+
+        self.__throttle: KeyedThrottle[str, int] = KeyedThrottle(
+            interval=0.05, callback=self.__mock_callback
+        )
+
+    def tearDown(self) -> None:
+        self.__throttle.clear()
+
+    async def test_push(self) -> None:
+        self.assertTrue(self.__throttle.push("a", 1))
+
+        self.assertTrue(self.__throttle.push("b", 1))
+
+        self.assertEqual(self.__mock_callback.call_count, 2)
+
+    async def test_push_coalesce(self) -> None:
+        self.__throttle.push("a", 1)
+
+        self.assertFalse(self.__throttle.push("a", 2))
+
+        self.assertFalse(self.__throttle.push("a", 3))
+
+        self.assertEqual(self.__throttle.pending, 1)
+
+        self.assertEqual(self.__throttle.coalesced, 1)
+
+        await asyncio.sleep(0.1)
+
+        self.assertSequenceEqual(
+            self.__mock_callback.call_args_list, [call("a", 1), call("a", 3)]
+        )
+
+        self.assertEqual(self.__throttle.pending, 0)
+
+    async def test_push_without_interval(self) -> None:
+        throttle: KeyedThrottle[str, int] = KeyedThrottle(
+            interval=0, callback=self.__mock_callback
+        )
+
+        for value in range(3):
+            self.assertTrue(throttle.push("a", value))
+
+        self.assertEqual(self.__mock_callback.call_count, 3)
+
+    async def test_discard(self) -> None:
+        self.__throttle.push("a", 1)
+
+        self.__throttle.push("a", 2)
+
+        self.__throttle.discard("a")
+
+        await asyncio.sleep(0.1)
+
+        self.__mock_callback.assert_called_once_with("a", 1)
+
+
+class KeyedTokenBucketTestCase(TestCase):
+    def test_acquire(self) -> None:
+        buckets: KeyedTokenBucket[str] = KeyedTokenBucket(
+            capacity=2, rate=0.001, max_size=10
+        )
+
+        self.assertTrue(buckets.acquire("a"))
+
+        self.assertTrue(buckets.acquire("a"))
+
+        self.assertFalse(buckets.acquire("a"))
+
+        self.assertTrue(buckets.acquire("b"))
+
+        self.assertEqual(buckets.rejected, 1)
+
+        self.assertGreater(buckets.retry_after("a"), 0)
+
+        self.assertEqual(buckets.retry_after("c"), 0)
+
+    def test_refill_and_expiry(self) -> None:
+        buckets: KeyedTokenBucket[str] = KeyedTokenBucket(
+            capacity=1, rate=50, max_size=10
+        )
+
+        self.assertTrue(buckets.acquire("a"))
+
+        self.assertFalse(buckets.acquire("a"))
+
+        time.sleep(0.05)
+
+        self.assertTrue(buckets.acquire("b"))
+
+        self.assertEqual(len(buckets), 1)
+
+        self.assertTrue(buckets.acquire("a"))
+
+    def test_max_size(self) -> None:
+        buckets: KeyedTokenBucket[int] = KeyedTokenBucket(
+            capacity=1, rate=0.001, max_size=3
+        )
+
+        for key in range(5):
+            buckets.acquire(key)
+
+        self.assertEqual(len(buckets), 3)
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            KeyedTokenBucket(capacity=1, rate=0, max_size=3)
+
+        buckets: KeyedTokenBucket[str] = KeyedTokenBucket(
+            capacity=0, rate=0, max_size=3
+        )
+
+        self.assertTrue(buckets.acquire("a"))
+
+
+class ConcurrencyGateTestCase(TestCase):
+    def test_try_acquire(self) -> None:
+        gate: ConcurrencyGate = ConcurrencyGate(2)
+
+        self.assertTrue(gate.try_acquire())
+
+        self.assertTrue(gate.try_acquire())
+
+        self.assertFalse(gate.try_acquire())
+
+        gate.release()
+
+        self.assertTrue(gate.try_acquire())
+
+        self.assertEqual(gate.active, 2)
+
+        self.assertEqual(gate.rejected, 1)
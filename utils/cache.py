@@ -0,0 +1,83 @@
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+from collections import OrderedDict
+import time
+
+
+K = TypeVar("K", bound=Hashable)
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(
+        self, max_size: int, ttl: float, negative_ttl: Optional[float] = None
+    ) -> None:
+        self.__max_size: int = max_size
+
+        self.__ttl: float = ttl
+
+        self.__negative_ttl: float = ttl if negative_ttl is None else negative_ttl
+
+        self.__entries: OrderedDict[K, Tuple[float, Optional[V]]] = OrderedDict()
+
+        self.__hits: int = 0
+
+        self.__misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __store(self, key: K, value: Optional[V], ttl: float) -> None:
+        if self.__max_size <= 0 or ttl <= 0:
+            return
+
+        self.__entries[key] = (time.monotonic() + ttl, value)
+
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def lookup(self, key: K) -> Tuple[bool, Optional[V]]:
+        entry: Optional[Tuple[float, Optional[V]]] = self.__entries.get(key)
+
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self.__entries[key]
+
+            self.__misses += 1
+
+            return False, None
+
+        self.__entries.move_to_end(key)
+
+        self.__hits += 1
+
+        return True, entry[1]
+
+    def get(self, key: K) -> Optional[V]:
+        return self.lookup(key)[1]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        self.__store(key, value, self.__ttl if ttl is None else min(ttl, self.__ttl))
+
+    def set_missing(self, key: K) -> None:
+        self.__store(key, None, self.__negative_ttl)
+
+    def invalidate(self, key: K) -> None:
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Sequence, Tuple
 import os
 
 from utils.env import EnvUtils
@@ -14,6 +14,7 @@ DATABASE_PASSWORD: str = os.environ.get("DATABASE_PASSWORD", "1234")
 
 API_HOST: str = os.environ.get("API_HOST", "")
 API_PORT: str = os.environ.get("API_PORT", "")
+API_FORWARDED_ALLOW_IPS: str = os.environ.get("API_FORWARDED_ALLOW_IPS", "127.0.0.1")
 
 COMPANY_ENPOINT_NAME: str = os.environ.get("COMPANY_ENPOINT_NAME", "/company")
 GEO_ENPOINT_NAME: str = os.environ.get("GEO_ENPOINT_NAME", "/geolocation")
@@ -24,7 +25,9 @@ USER_ENDPOINT_NAME: str = os.environ.get("USER_ENDPOINT_NAME", "/user")
 AUTH_ENDPOINT_NAME: str = os.environ.get("AUTH_ENDPOINT_NAME", "/auth")
 DOCS_ENDPOINT_NAME: str = os.environ.get("DOCS_ENDPOINT_NAME", "/docs")
 REDOC_ENDPOINT_NAME: str = os.environ.get("REDOC_ENDPOINT_NAME", "/docs")
+OPENAPI_ENDPOINT_NAME: str = os.environ.get("OPENAPI_ENDPOINT_NAME", "/openapi.json")
 INDEX_ENDPOINT_NAME: str = os.environ.get("INDEX_ENDPOINT_NAME", "/")
+METRICS_ENDPOINT_NAME: str = os.environ.get("METRICS_ENDPOINT_NAME", "/metrics")
 PROFILE_ENDPOINT_NAME: str = os.environ.get("PROFILE_ENDPOINT_NAME", "/profile")
 VEHICLE_ENDPOINT_NAME: str = os.environ.get("VEHICLE_ENDPOINT_NAME", "/vehicle")
 
@@ -34,10 +37,20 @@ EVENTS_ENDPOINT_NAME: str = os.environ.get("EVENTS_ENDPOINT_NAME", "")
 AGENT_PUBLIC_ROUTES: Sequence[str] = (
     DOCS_ENDPOINT_NAME,
     REDOC_ENDPOINT_NAME,
+    OPENAPI_ENDPOINT_NAME,
     AUTH_ENDPOINT_NAME,
 )
 
-USER_PUBLIC_ROUTES: Sequence[str] = AUTH_ENDPOINT_NAME
+USER_PUBLIC_ROUTES: Sequence[str] = (
+    DOCS_ENDPOINT_NAME,
+    REDOC_ENDPOINT_NAME,
+    OPENAPI_ENDPOINT_NAME,
+    AUTH_ENDPOINT_NAME,
+)
+
+USER_PUBLIC_ENDPOINTS: Sequence[Tuple[str, str]] = (("POST", PROFILE_ENDPOINT_NAME),)
+
+AUTH_PRINCIPAL_MODE: str = os.environ.get("AUTH_PRINCIPAL_MODE", "claims")
 
 SECRET_KEY: str = os.environ.get("SECRET_KEY", "test123")
 TOKEN_EXPIRATION_MINUTE: int = int(os.environ.get("TOKEN_EXPIRATION_MINUTE", "5"))
@@ -60,6 +73,7 @@ SWAGGER_PROFILE_SESSION_TAG: str = os.environ.get("SWAGGER_PROFILE_SESSION_TAG",
 SWAGGER_AUTH_SESSION_TAG: str = os.environ.get("SWAGGER_AUTH_SESSION_TAG", "")
 SWAGGER_INDEX_SESSION_TAG: str = os.environ.get("SWAGGER_INDEX_SESSION_TAG", "")
 SWAGGER_EVENTS_SESSION_TAG: str = os.environ.get("SWAGGER_EVENTS_SESSION_TAG", "")
+SWAGGER_VEHICLE_SESSION_TAG: str = os.environ.get("SWAGGER_VEHICLE_SESSION_TAG", "")
 
 GOOGLE_API_KEY: str = os.environ.get("GOOGLE_API_KEY", "")
 GOOGLE_API_URL: str = os.environ.get("GOOGLE_API_URL", "")
@@ -74,3 +88,143 @@ TYPE_ADDRESS_NUMBER: str = os.environ.get("TYPE_ADDRESS_NUMBER", "")
 SPARK_JDBC_URL: str = os.environ.get("SPARK_JDBC_URL", "")
 
 BROKER_KAFKA_URL: str = os.environ.get("BROKER_KAFKA_URL", "localhost:9092")
+
+WEBSOCKET_SEND_QUEUE_SIZE: int = int(os.environ.get("WEBSOCKET_SEND_QUEUE_SIZE", "64"))
+WEBSOCKET_OVERFLOW_POLICY: str = os.environ.get("WEBSOCKET_OVERFLOW_POLICY", "coalesce")
+WEBSOCKET_MAX_CONNECTIONS: int = int(
+    os.environ.get("WEBSOCKET_MAX_CONNECTIONS", "10000")
+)
+WEBSOCKET_MAX_COMPANY_CONNECTIONS: int = int(
+    os.environ.get("WEBSOCKET_MAX_COMPANY_CONNECTIONS", "1000")
+)
+WEBSOCKET_MAX_COMPANY_DEVICES: int = int(
+    os.environ.get("WEBSOCKET_MAX_COMPANY_DEVICES", "1000")
+)
+WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS: float = float(
+    os.environ.get("WEBSOCKET_HEARTBEAT_INTERVAL_SECONDS", "0")
+)
+WEBSOCKET_IDLE_TIMEOUT_SECONDS: float = float(
+    os.environ.get("WEBSOCKET_IDLE_TIMEOUT_SECONDS", "0")
+)
+WEBSOCKET_PING_INTERVAL_SECONDS: float = float(
+    os.environ.get("WEBSOCKET_PING_INTERVAL_SECONDS", "20")
+)
+WEBSOCKET_PING_TIMEOUT_SECONDS: float = float(
+    os.environ.get("WEBSOCKET_PING_TIMEOUT_SECONDS", "20")
+)
+WEBSOCKET_TIMER_TICK_SECONDS: float = float(
+    os.environ.get("WEBSOCKET_TIMER_TICK_SECONDS", "1")
+)
+WEBSOCKET_TIMER_SLOTS: int = int(os.environ.get("WEBSOCKET_TIMER_SLOTS", "128"))
+WEBSOCKET_BACKPLANE: str = os.environ.get("WEBSOCKET_BACKPLANE", "local")
+WEBSOCKET_BACKPLANE_TOPIC: str = os.environ.get(
+    "WEBSOCKET_BACKPLANE_TOPIC", "busstop.websocket"
+)
+
+VEHICLE_POSITIONS_PIPELINE: str = os.environ.get("VEHICLE_POSITIONS_PIPELINE", "direct")
+VEHICLE_POSITIONS_TOPIC: str = os.environ.get(
+    "VEHICLE_POSITIONS_TOPIC", "busstop.vehicle.positions"
+)
+VEHICLE_POSITIONS_GROUP: str = os.environ.get(
+    "VEHICLE_POSITIONS_GROUP", "busstop.vehicle.positions"
+)
+VEHICLE_POSITIONS_LINGER_MS: int = int(
+    os.environ.get("VEHICLE_POSITIONS_LINGER_MS", "5")
+)
+VEHICLE_POSITIONS_BATCH_SIZE: int = int(
+    os.environ.get("VEHICLE_POSITIONS_BATCH_SIZE", "65536")
+)
+VEHICLE_POSITIONS_MAX_BATCH: int = int(
+    os.environ.get("VEHICLE_POSITIONS_MAX_BATCH", "500")
+)
+
+VEHICLE_POSITION_MAX_FUTURE_SECONDS: float = float(
+    os.environ.get("VEHICLE_POSITION_MAX_FUTURE_SECONDS", "60")
+)
+VEHICLE_BROADCAST_INTERVAL_SECONDS: float = float(
+    os.environ.get("VEHICLE_BROADCAST_INTERVAL_SECONDS", "1")
+)
+
+VEHICLE_HISTORY_BATCH_SIZE: int = int(
+    os.environ.get("VEHICLE_HISTORY_BATCH_SIZE", "5000")
+)
+VEHICLE_HISTORY_MAX_BUFFER_SIZE: int = int(
+    os.environ.get("VEHICLE_HISTORY_MAX_BUFFER_SIZE", "200000")
+)
+VEHICLE_HISTORY_FLUSH_INTERVAL_SECONDS: float = float(
+    os.environ.get("VEHICLE_HISTORY_FLUSH_INTERVAL_SECONDS", "1")
+)
+
+VEHICLE_TRACK_FETCH_SIZE: int = int(os.environ.get("VEHICLE_TRACK_FETCH_SIZE", "1000"))
+
+FLEET_TICK_INTERVAL_SECONDS: float = float(
+    os.environ.get("FLEET_TICK_INTERVAL_SECONDS", "1")
+)
+
+VIEWPORT_GRID_CELL_DEGREES: float = float(
+    os.environ.get("VIEWPORT_GRID_CELL_DEGREES", "0.05")
+)
+VIEWPORT_MAX_CELLS: int = int(os.environ.get("VIEWPORT_MAX_CELLS", "4096"))
+
+ROUTE_MATCH_CELL_METERS: float = float(os.environ.get("ROUTE_MATCH_CELL_METERS", "250"))
+ROUTE_MATCH_MAX_DISTANCE_METERS: float = float(
+    os.environ.get("ROUTE_MATCH_MAX_DISTANCE_METERS", "150")
+)
+ROUTE_GEOMETRY_CACHE_MAX_SIZE: int = int(
+    os.environ.get("ROUTE_GEOMETRY_CACHE_MAX_SIZE", "1024")
+)
+ROUTE_GEOMETRY_CACHE_TTL_SECONDS: float = float(
+    os.environ.get("ROUTE_GEOMETRY_CACHE_TTL_SECONDS", "300")
+)
+
+GEOFENCE_RADIUS_METERS: float = float(os.environ.get("GEOFENCE_RADIUS_METERS", "50"))
+
+ETA_SPEED_SMOOTHING: float = float(os.environ.get("ETA_SPEED_SMOOTHING", "0.3"))
+ETA_DEFAULT_SPEED_METERS_PER_SECOND: float = float(
+    os.environ.get("ETA_DEFAULT_SPEED_METERS_PER_SECOND", "6")
+)
+ETA_MIN_SPEED_METERS_PER_SECOND: float = float(
+    os.environ.get("ETA_MIN_SPEED_METERS_PER_SECOND", "1")
+)
+ETA_RESET_DISTANCE_METERS: float = float(
+    os.environ.get("ETA_RESET_DISTANCE_METERS", "500")
+)
+ETA_MAX_AGE_SECONDS: float = float(os.environ.get("ETA_MAX_AGE_SECONDS", "300"))
+ETA_CACHE_MAX_SIZE: int = int(os.environ.get("ETA_CACHE_MAX_SIZE", "10000"))
+ETA_CACHE_TTL_SECONDS: float = float(os.environ.get("ETA_CACHE_TTL_SECONDS", "2"))
+
+VEHICLE_CACHE_MAX_SIZE: int = int(os.environ.get("VEHICLE_CACHE_MAX_SIZE", "50000"))
+VEHICLE_CACHE_TTL_SECONDS: float = float(
+    os.environ.get("VEHICLE_CACHE_TTL_SECONDS", "300")
+)
+VEHICLE_CACHE_NEGATIVE_TTL_SECONDS: float = float(
+    os.environ.get("VEHICLE_CACHE_NEGATIVE_TTL_SECONDS", "30")
+)
+
+PRINCIPAL_CACHE_MAX_SIZE: int = int(os.environ.get("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS: float = min(
+    float(os.environ.get("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
+    TOKEN_EXPIRATION_MINUTE * 60,
+)
+
+CRYPT_MAX_WORKERS: int = int(
+    os.environ.get("CRYPT_MAX_WORKERS", str(min(os.cpu_count() or 1, 4)))
+)
+CRYPT_MAX_PENDING: int = int(os.environ.get("CRYPT_MAX_PENDING", "64"))
+
+LOGIN_EMAIL_BUCKET_CAPACITY: float = float(
+    os.environ.get("LOGIN_EMAIL_BUCKET_CAPACITY", "5")
+)
+LOGIN_EMAIL_REFILL_PER_SECOND: float = float(
+    os.environ.get("LOGIN_EMAIL_REFILL_PER_SECOND", "0.1")
+)
+LOGIN_ADDRESS_BUCKET_CAPACITY: float = float(
+    os.environ.get("LOGIN_ADDRESS_BUCKET_CAPACITY", "20")
+)
+LOGIN_ADDRESS_REFILL_PER_SECOND: float = float(
+    os.environ.get("LOGIN_ADDRESS_REFILL_PER_SECOND", "1")
+)
+LOGIN_BUCKET_MAX_SIZE: int = int(os.environ.get("LOGIN_BUCKET_MAX_SIZE", "100000"))
+LOGIN_MAX_CONCURRENCY: int = int(
+    os.environ.get("LOGIN_MAX_CONCURRENCY", str(CRYPT_MAX_WORKERS * 2))
+)
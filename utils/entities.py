@@ -1,8 +1,9 @@
-from typing import List, Optional, Union
-from pydantic import BaseModel
-from datetime import datetime, time
+from typing import List, NamedTuple, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import datetime, time, UTC
 
-from utils.config import SWAGGER_API_VERSION
+from utils.config import SWAGGER_API_VERSION, VEHICLE_POSITION_MAX_FUTURE_SECONDS
+from utils.types import StopEventType, VehicleType
 
 
 class UUIDEntity(BaseModel):
@@ -117,9 +118,228 @@ class TokenDataEntity(BaseModel):
 
 class AgentTokenDataEntity(TokenDataEntity):
     company_uuid: str
+    agent_id: Optional[int] = None
+    company_id: Optional[int] = None
 
 
 class VehiclePositionBodyEntity(BaseModel):
-    latitude: Union[str, float]
+    latitude: float = Field(ge=-90, le=90)
 
-    longitude: Union[str, float]
+    longitude: float = Field(ge=-180, le=180)
+
+
+class VehicleBodyEntity(BaseModel):
+    type: VehicleType = VehicleType.BUS
+
+    plate: str
+
+    route_uuid: Optional[str] = None
+
+
+class VehicleEntity(UUIDEntity):
+    type: str
+
+    plate: str
+
+
+class VehicleIdentityEntity(UUIDEntity):
+    id: int
+
+    company_id: int
+
+    route_id: Optional[int] = None
+
+
+class VehiclePositionItemEntity(VehiclePositionBodyEntity):
+    vehicle_uuid: str
+
+    ts: Optional[datetime] = None
+
+    @field_validator("ts")
+    @classmethod
+    def validate_ts(cls, ts: Optional[datetime]) -> Optional[datetime]:
+        if ts is None:
+            return ts
+
+        if ts.timestamp() < 0:
+            raise ValueError("Position timestamp must not precede the Unix epoch")
+
+        if (
+            ts.timestamp()
+            > datetime.now(UTC).timestamp() + VEHICLE_POSITION_MAX_FUTURE_SECONDS
+        ):
+            raise ValueError("Position timestamp must not be in the future")
+
+        return ts
+
+
+class VehicleLastPositionEntity(BaseModel):
+    vehicle_uuid: str
+
+    latitude: float
+
+    longitude: float
+
+    ts: float
+
+
+class FleetPositionsEntity(BaseModel):
+    type: str
+
+    company_uuid: Optional[str] = None
+
+    positions: List[VehicleLastPositionEntity]
+
+
+class ViewportBodyEntity(BaseModel):
+    min_latitude: float = Field(ge=-90, le=90)
+
+    min_longitude: float = Field(ge=-180, le=180)
+
+    max_latitude: float = Field(ge=-90, le=90)
+
+    max_longitude: float = Field(ge=-180, le=180)
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "ViewportBodyEntity":
+        if (
+            self.min_latitude > self.max_latitude
+            or self.min_longitude > self.max_longitude
+        ):
+            raise ValueError("Viewport minimum bounds must not exceed maximum bounds")
+
+        return self
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return (
+            self.min_latitude <= latitude <= self.max_latitude
+            and self.min_longitude <= longitude <= self.max_longitude
+        )
+
+
+class VehiclePositionRecordEntity(NamedTuple):
+    vehicle_id: int
+
+    latitude: float
+
+    longitude: float
+
+    ts: datetime
+
+
+class VehicleTrackPointEntity(NamedTuple):
+    latitude: float
+
+    longitude: float
+
+    ts: float
+
+
+class RouteMatchEntity(NamedTuple):
+    latitude: float
+
+    longitude: float
+
+    progress: float
+
+    distance: float
+
+    segment: int
+
+
+class VehicleProgressEntity(NamedTuple):
+    route_id: int
+
+    progress: float
+
+    speed: float
+
+    ts: float
+
+
+class VehicleStopEtaEntity(BaseModel):
+    point_uuid: str
+
+    distance: float
+
+    eta: float
+
+
+class VehicleEtaEntity(BaseModel):
+    vehicle_uuid: str
+
+    progress: float
+
+    speed: float
+
+    ts: float
+
+    stops: List[VehicleStopEtaEntity]
+
+
+class StopEventEntity(BaseModel):
+    type: StopEventType
+
+    vehicle_uuid: str
+
+    point_uuid: str
+
+    stop_index: int
+
+    ts: float
+
+
+class WebSocketMetricsEntity(BaseModel):
+    connections: int
+
+    companies: int
+
+    devices: int
+
+    max_connections: int
+
+    max_company_connections: int
+
+    max_company_devices: int
+
+    accepted: int
+
+    rejected: int
+
+    evicted: int
+
+    heartbeats: int
+
+    pending_frames: int
+
+    dropped_frames: int
+
+
+class CryptPoolMetricsEntity(BaseModel):
+    max_workers: int
+
+    max_pending: int
+
+    running: int
+
+    queued: int
+
+    completed: int
+
+    rejected: int
+
+    average_wait_seconds: float
+
+    max_wait_seconds: float
+
+
+class ServerMetricsEntity(BaseModel):
+    websocket: WebSocketMetricsEntity
+
+    crypt: CryptPoolMetricsEntity
+
+
+class VehiclePositionBatchResultEntity(BaseModel):
+    accepted: int
+
+    rejected: List[str]
@@ -1,8 +1,10 @@
-from typing import Type
+from typing import Type, TYPE_CHECKING
+import math
 from sqlalchemy.orm.decl_api import DeclarativeBase
 from fastapi.exceptions import HTTPException
 
-from models import UserBaseModel
+if TYPE_CHECKING:
+    from models import UserBaseModel
 
 
 class ModelNotFound(BaseException):
@@ -16,7 +18,7 @@ class UserNotFound(BaseException):
 
 
 class InvalidUserPassword(BaseException):
-    def __init__(self, user: UserBaseModel) -> None:
+    def __init__(self, user: "UserBaseModel") -> None:
         super().__init__(f"Invalid password passed to user {user.uuid}")
 
 
@@ -28,3 +30,17 @@ class InvalidToken(BaseException):
 class HTTPFailure(HTTPException):
     def __init__(self, error_message: str) -> None:
         super().__init__(500, error_message)
+
+
+class TooManyLoginAttempts(HTTPException):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(
+            429,
+            "Too many login attempts, try again later",
+            headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+        )
+
+
+class ServerCryptPoolOverloaded(HTTPException):
+    def __init__(self, name: str) -> None:
+        super().__init__(503, f"The {name} pool is overloaded, try again later")
@@ -1,26 +1,26 @@
-from typing import (
-    Any,
-    Callable,
-    Awaitable,
-    Optional,
-    List,
-    AsyncGenerator,
-    Sequence,
-    Union,
-)
-from fastapi import Request, Response
+from typing import Any, Callable, Optional, List, Pattern, Sequence
+from fastapi import WebSocket
+from pydantic import TypeAdapter
+import re
 
-from models import Point, Route, Company, Agent, User
+from models import Point, Route, Company, Agent, User, Vehicle
 from utils.entities import (
     PointEntity,
     RouteEntity,
     CompanyEntity,
     AgentEntity,
     UserEntity,
+    VehicleEntity,
+    VehiclePositionItemEntity,
 )
 from utils.types import DictType
 
 
+vehicle_positions_adapter: TypeAdapter[List[VehiclePositionItemEntity]] = TypeAdapter(
+    List[VehiclePositionItemEntity]
+)
+
+
 def get_agent_entity(agent: Agent) -> AgentEntity:
     return AgentEntity(
         uuid=agent.uuid, email=agent.email, password=agent.password, name=agent.name
@@ -90,17 +90,42 @@ def handle_user_body(user: Optional[User]) -> Optional[UserEntity]:
         return get_user_entity(user)
 
 
-async def validate_middleware_request(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-    private_routes: Sequence[str] = [],
-) -> AsyncGenerator[Union[bool, Response], None]:
-    validated: bool = any([True for path in private_routes if path in request.url.path])
+def get_vehicle_entity(vehicle: Vehicle) -> VehicleEntity:
+    return VehicleEntity(uuid=vehicle.uuid, type=vehicle.type, plate=vehicle.plate)
+
 
-    yield validated
+def handle_vehicle_body(vehicle: Optional[Vehicle]) -> Optional[VehicleEntity]:
+    if vehicle is not None:
+        return get_vehicle_entity(vehicle)
 
-    if validated:
-        yield await call_next(request)
+
+def compile_route_prefixes(routes: Sequence[str]) -> Pattern[str]:
+    prefixes: List[str] = sorted(
+        {route.rstrip("/") for route in routes if route.strip("/")},
+        key=len,
+        reverse=True,
+    )
+
+    if not prefixes:
+        return re.compile(r"(?!)")
+
+    alternatives: str = "|".join(re.escape(prefix) for prefix in prefixes)
+
+    return re.compile(rf"(?:{alternatives})(?:/|$)")
+
+
+def get_websocket_token(websocket: WebSocket) -> str:
+    return websocket.headers.get(
+        "Authorization", websocket.query_params.get("token", "")
+    )
+
+
+def get_vehicle_topic(vehicle_uuid: str) -> str:
+    return f"vehicle:{vehicle_uuid}"
+
+
+def get_company_topic(company_id: int) -> str:
+    return f"company:{company_id}"
 
 
 def handle_dict(
@@ -112,3 +137,16 @@ def handle_dict(
         for prop_name, prop_value in dict_data.items()
         if callback(prop_value)
     }
+
+
+def handle_vehicle_positions_body(
+    body: bytes, content_type: str = "application/json"
+) -> List[VehiclePositionItemEntity]:
+    if "ndjson" not in content_type:
+        return vehicle_positions_adapter.validate_json(body)
+
+    return [
+        VehiclePositionItemEntity.model_validate_json(line)
+        for line in body.splitlines()
+        if line.strip()
+    ]
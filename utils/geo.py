@@ -0,0 +1,301 @@
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+from bisect import bisect_left, bisect_right
+import math
+
+from utils.entities import RouteMatchEntity
+
+
+T = TypeVar("T")
+
+EARTH_RADIUS_METERS: float = 6_371_000.0
+
+
+def project_point(
+    latitude: float, longitude: float, reference_latitude: float
+) -> Tuple[float, float]:
+    x: float = (
+        math.radians(longitude)
+        * math.cos(math.radians(reference_latitude))
+        * EARTH_RADIUS_METERS
+    )
+
+    y: float = math.radians(latitude) * EARTH_RADIUS_METERS
+
+    return x, y
+
+
+def unproject_point(
+    x: float, y: float, reference_latitude: float
+) -> Tuple[float, float]:
+    latitude: float = math.degrees(y / EARTH_RADIUS_METERS)
+
+    longitude: float = math.degrees(
+        x / (math.cos(math.radians(reference_latitude)) * EARTH_RADIUS_METERS)
+    )
+
+    return latitude, longitude
+
+
+def get_line_distance(
+    point: Tuple[float, float], start: Tuple[float, float], end: Tuple[float, float]
+) -> float:
+    dx: float = end[0] - start[0]
+
+    dy: float = end[1] - start[1]
+
+    length: float = math.hypot(dx, dy)
+
+    if length == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+
+    return abs(dy * (point[0] - start[0]) - dx * (point[1] - start[1])) / length
+
+
+class TrackSimplifier(Generic[T]):
+    def __init__(self, tolerance: float) -> None:
+        self.__tolerance: float = tolerance
+
+        self.__reference_latitude: Optional[float] = None
+
+        self.__anchor: Optional[Tuple[float, float]] = None
+
+        self.__direction: Optional[Tuple[float, float]] = None
+
+        self.__last: Optional[Tuple[Tuple[float, float], T]] = None
+
+    def push(self, latitude: float, longitude: float, item: T) -> Optional[T]:
+        if self.__tolerance <= 0:
+            return item
+
+        if self.__reference_latitude is None:
+            self.__reference_latitude = latitude
+
+        point: Tuple[float, float] = project_point(
+            latitude, longitude, self.__reference_latitude
+        )
+
+        if self.__anchor is None:
+            self.__anchor = point
+
+            return item
+
+        if self.__direction is None or self.__last is None:
+            self.__direction = point
+
+            self.__last = point, item
+
+            return None
+
+        last_point, last_item = self.__last
+
+        self.__last = point, item
+
+        if (
+            get_line_distance(point, self.__anchor, self.__direction)
+            <= self.__tolerance
+        ):
+            return None
+
+        self.__anchor = last_point
+
+        self.__direction = point
+
+        return last_item
+
+    def finish(self) -> Optional[T]:
+        if self.__last is None:
+            return None
+
+        _, item = self.__last
+
+        self.__last = None
+
+        return item
+
+
+class RouteGeometry:
+    def __init__(
+        self,
+        points: Sequence[Tuple[float, float]],
+        cell_size: float,
+        stops: Sequence[str] = (),
+    ) -> None:
+        self.__cell_size: float = cell_size
+
+        self.__stops: Sequence[str] = stops
+
+        self.__reference_latitude: float = points[0][0] if points else 0
+
+        self.__vertices: List[Tuple[float, float]] = [
+            project_point(latitude, longitude, self.__reference_latitude)
+            for latitude, longitude in points
+        ]
+
+        self.__offsets: List[float] = [0]
+
+        self.__cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for segment in range(len(self.__vertices) - 1):
+            self.__index_segment(segment)
+
+    @property
+    def length(self) -> float:
+        return self.__offsets[-1]
+
+    @property
+    def segments(self) -> int:
+        return len(self.__offsets) - 1
+
+    @property
+    def offsets(self) -> Sequence[float]:
+        return self.__offsets
+
+    @property
+    def stops(self) -> Sequence[str]:
+        return self.__stops
+
+    def __get_cell(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        return (
+            math.floor(point[0] / self.__cell_size),
+            math.floor(point[1] / self.__cell_size),
+        )
+
+    def __get_progress(self, segment: int, ratio: float) -> float:
+        return (
+            self.__offsets[segment]
+            + (self.__offsets[segment + 1] - self.__offsets[segment]) * ratio
+        )
+
+    def __index_segment(self, segment: int) -> None:
+        start, end = self.__vertices[segment], self.__vertices[segment + 1]
+
+        length: float = math.hypot(end[0] - start[0], end[1] - start[1])
+
+        self.__offsets.append(self.__offsets[-1] + length)
+
+        steps: int = math.ceil(length / (self.__cell_size / 2)) or 1
+
+        cells: Set[Tuple[int, int]] = {
+            self.__get_cell(
+                (
+                    start[0] + (end[0] - start[0]) * step / steps,
+                    start[1] + (end[1] - start[1]) * step / steps,
+                )
+            )
+            for step in range(steps + 1)
+        }
+
+        for cell in cells:
+            self.__cells.setdefault(cell, []).append(segment)
+
+    def __find_segments(
+        self, point: Tuple[float, float], max_distance: float
+    ) -> Set[int]:
+        cell_x, cell_y = self.__get_cell(point)
+
+        radius: int = math.ceil(max_distance / self.__cell_size) + 1
+
+        return {
+            segment
+            for x in range(cell_x - radius, cell_x + radius + 1)
+            for y in range(cell_y - radius, cell_y + radius + 1)
+            for segment in self.__cells.get((x, y), ())
+        }
+
+    def match(
+        self,
+        latitude: float,
+        longitude: float,
+        max_distance: float,
+        previous_progress: Optional[float] = None,
+    ) -> Optional[RouteMatchEntity]:
+        point: Tuple[float, float] = project_point(
+            latitude, longitude, self.__reference_latitude
+        )
+
+        best: Optional[Tuple[float, float, int, float, Tuple[float, float]]] = None
+
+        for segment in self.__find_segments(point, max_distance):
+            start, end = self.__vertices[segment], self.__vertices[segment + 1]
+
+            dx: float = end[0] - start[0]
+
+            dy: float = end[1] - start[1]
+
+            length_squared: float = dx * dx + dy * dy
+
+            ratio: float = (
+                min(
+                    1,
+                    max(
+                        0,
+                        ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy)
+                        / length_squared,
+                    ),
+                )
+                if length_squared
+                else 0
+            )
+
+            snapped: Tuple[float, float] = (
+                start[0] + dx * ratio,
+                start[1] + dy * ratio,
+            )
+
+            distance: float = math.hypot(point[0] - snapped[0], point[1] - snapped[1])
+
+            if distance > max_distance:
+                continue
+
+            score: float = distance
+
+            if previous_progress is not None:
+                score += abs(self.__get_progress(segment, ratio) - previous_progress)
+
+            if best is None or score < best[0]:
+                best = score, distance, segment, ratio, snapped
+
+        if best is None:
+            return None
+
+        _, distance, segment, ratio, snapped = best
+
+        snapped_latitude, snapped_longitude = unproject_point(
+            snapped[0], snapped[1], self.__reference_latitude
+        )
+
+        return RouteMatchEntity(
+            latitude=snapped_latitude,
+            longitude=snapped_longitude,
+            progress=self.__get_progress(segment, ratio),
+            distance=distance,
+            segment=segment,
+        )
+
+    def find_stops(
+        self,
+        latitude: float,
+        longitude: float,
+        progress: float,
+        radius: float,
+        window: float,
+    ) -> List[int]:
+        point: Tuple[float, float] = project_point(
+            latitude, longitude, self.__reference_latitude
+        )
+
+        start: int = bisect_left(self.__offsets, progress - window)
+
+        end: int = min(
+            bisect_right(self.__offsets, progress + window), len(self.__vertices)
+        )
+
+        return [
+            index
+            for index in range(start, end)
+            if math.hypot(
+                point[0] - self.__vertices[index][0],
+                point[1] - self.__vertices[index][1],
+            )
+            <= radius
+        ]
@@ -1,4 +1,5 @@
 from typing import (
+    AsyncIterator,
     Generic,
     Optional,
     TypeVar,
@@ -68,6 +69,10 @@ class IFindManyRepository(Protocol, Generic[RPT, RRT]):
     ) -> Union[Awaitable[Sequence[RRT]], Sequence[RRT]]: ...
 
 
+class IStreamManyRepository(Protocol, Generic[RPT, RRT]):
+    def stream_many(self, props: RPT) -> AsyncIterator[RRT]: ...
+
+
 class IAuthRepository(Protocol, Generic[RPT, RRT]):
     def auth(self, props: RPT) -> Union[Awaitable[RRT], RRT]: ...
 
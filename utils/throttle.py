@@ -0,0 +1,207 @@
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from collections import OrderedDict
+import asyncio
+import time
+
+
+K = TypeVar("K", bound=Hashable)
+
+V = TypeVar("V")
+
+
+class KeyedThrottle(Generic[K, V]):
+    def __init__(self, interval: float, callback: Callable[[K, V], Any]) -> None:
+        self.__interval: float = interval
+
+        self.__callback: Callable[[K, V], Any] = callback
+
+        self.__emitted_at: Dict[K, float] = {}
+
+        self.__pending: Dict[K, V] = {}
+
+        self.__timers: Dict[K, asyncio.TimerHandle] = {}
+
+        self.__coalesced: int = 0
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending)
+
+    @property
+    def coalesced(self) -> int:
+        return self.__coalesced
+
+    def __emit(self, key: K, value: V) -> None:
+        self.__emitted_at[key] = time.monotonic()
+
+        self.__callback(key, value)
+
+    def __flush(self, key: K) -> None:
+        self.__timers.pop(key, None)
+
+        if key in self.__pending:
+            self.__emit(key, self.__pending.pop(key))
+
+    def push(self, key: K, value: V) -> bool:
+        if self.__interval <= 0:
+            self.__callback(key, value)
+
+            return True
+
+        if key in self.__pending:
+            self.__pending[key] = value
+
+            self.__coalesced += 1
+
+            return False
+
+        now: float = time.monotonic()
+
+        emitted_at: Optional[float] = self.__emitted_at.get(key)
+
+        if emitted_at is None or now - emitted_at >= self.__interval:
+            self.__emit(key, value)
+
+            return True
+
+        self.__pending[key] = value
+
+        self.__timers[key] = asyncio.get_running_loop().call_later(
+            emitted_at + self.__interval - now, self.__flush, key
+        )
+
+        return False
+
+    def discard(self, key: K) -> None:
+        timer: Optional[asyncio.TimerHandle] = self.__timers.pop(key, None)
+
+        if timer is not None:
+            timer.cancel()
+
+        self.__pending.pop(key, None)
+
+        self.__emitted_at.pop(key, None)
+
+    def clear(self) -> None:
+        for timer in self.__timers.values():
+            timer.cancel()
+
+        self.__timers.clear()
+
+        self.__pending.clear()
+
+        self.__emitted_at.clear()
+
+
+class KeyedTokenBucket(Generic[K]):
+    def __init__(self, capacity: float, rate: float, max_size: int) -> None:
+        if capacity > 0 and rate <= 0:
+            raise ValueError("Token bucket refill rate must be greater than zero")
+
+        self.__capacity: float = capacity
+
+        self.__rate: float = rate
+
+        self.__max_size: int = max_size
+
+        self.__buckets: OrderedDict[K, Tuple[float, float]] = OrderedDict()
+
+        self.__rejected: int = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.__rejected
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def __get_tokens(self, key: K, now: float) -> float:
+        bucket: Optional[Tuple[float, float]] = self.__buckets.get(key)
+
+        if bucket is None:
+            return self.__capacity
+
+        tokens, updated_at = bucket
+
+        return min(self.__capacity, tokens + (now - updated_at) * self.__rate)
+
+    def __store(self, key: K, tokens: float, now: float) -> None:
+        self.__buckets[key] = (tokens, now)
+
+        self.__buckets.move_to_end(key)
+
+        while len(self.__buckets) > self.__max_size:
+            self.__buckets.popitem(last=False)
+
+        while self.__buckets:
+            oldest_key: K = next(iter(self.__buckets))
+
+            if self.__get_tokens(oldest_key, now) < self.__capacity:
+                break
+
+            del self.__buckets[oldest_key]
+
+    def acquire(self, key: K, cost: float = 1) -> bool:
+        if self.__capacity <= 0 or self.__max_size <= 0:
+            return True
+
+        now: float = time.monotonic()
+
+        tokens: float = self.__get_tokens(key, now)
+
+        if tokens < cost:
+            self.__rejected += 1
+
+            return False
+
+        self.__store(key, tokens - cost, now)
+
+        return True
+
+    def retry_after(self, key: K, cost: float = 1) -> float:
+        tokens: float = self.__get_tokens(key, time.monotonic())
+
+        if tokens >= cost:
+            return 0
+
+        return (cost - tokens) / self.__rate
+
+    def discard(self, key: K) -> None:
+        self.__buckets.pop(key, None)
+
+    def clear(self) -> None:
+        self.__buckets.clear()
+
+
+class ConcurrencyGate:
+    def __init__(self, limit: int) -> None:
+        self.__limit: int = limit
+
+        self.__active: int = 0
+
+        self.__rejected: int = 0
+
+    @property
+    def active(self) -> int:
+        return self.__active
+
+    @property
+    def rejected(self) -> int:
+        return self.__rejected
+
+    def try_acquire(self) -> bool:
+        if self.__limit > 0 and self.__active >= self.__limit:
+            self.__rejected += 1
+
+            return False
+
+        self.__active += 1
+
+        return True
+
+    def release(self) -> None:
+        self.__active = max(self.__active - 1, 0)
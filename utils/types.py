@@ -26,4 +26,36 @@ class DatabaseDialectType(Enum):
     SQLITE = "sqlite"
 
 
+class WebSocketOverflowPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+
+    COALESCE = "coalesce"
+
+    DISCONNECT = "disconnect"
+
+
+class WebSocketBackplaneType(Enum):
+    LOCAL = "local"
+
+    KAFKA = "kafka"
+
+
+class VehiclePositionsPipelineType(Enum):
+    DIRECT = "direct"
+
+    KAFKA = "kafka"
+
+
+class AuthPrincipalType(Enum):
+    CLAIMS = "claims"
+
+    MODEL = "model"
+
+
+class StopEventType(Enum):
+    ARRIVAL = "arrival"
+
+    DEPARTURE = "departure"
+
+
 DictType: TypeAlias = Mapping[DPT, DVT]